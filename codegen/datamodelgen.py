@@ -214,28 +214,8 @@ class DataModelGenerator:
         singletons = sorted(info.singletons)
         parameters = sorted(info.parameters)
         commands = sorted(info.commands)
-        for k in named_objects:
-            f.write(
-                f"{indent}        self.{k} = "
-                f'self.__class__.{k}(service, rules, path + [("{k}", "")])\n'
-            )
-        for k in singletons:
-            # This is where filtering these names out really matters (see commsent above)
-            if k.isidentifier():
-                f.write(
-                    f"{indent}        self.{k} = "
-                    f'self.__class__.{k}(service, rules, path + [("{k}", "")])\n'
-                )
-        for k in parameters:
-            f.write(
-                f"{indent}        self.{k} = "
-                f'self.__class__.{k}(service, rules, path + [("{k}", "")])\n'
-            )
-        for k in commands:
-            f.write(
-                f"{indent}        self.{k} = "
-                f'self.__class__.{k}(service, rules, "{k}", path)\n'
-            )
+        # Child objects are created on first access through the LazyPyMenuChild
+        # descriptors written after each child class.
         f.write(f"{indent}        super().__init__(service, rules, path)\n\n")
         for k in named_objects:
             f.write(f"{indent}    class {k}(PyNamedObjectContainer):\n")
@@ -248,12 +228,15 @@ class DataModelGenerator:
             # Specify the concrete named object type for __getitem__
             f.write(f"{indent}        def __getitem__(self, key: str) -> " f"_{k}:\n")
             f.write(f"{indent}            return super().__getitem__(key)\n\n")
+            f.write(f"{indent}    {k} = LazyPyMenuChild({k})\n\n")
         for k in singletons:
+            # This is where filtering these names out really matters (see comment above)
             if k.isidentifier():
                 # print("included", k)
                 api_tree[k] = self._write_static_info(
                     k, info.singletons[k], f, level + 1
                 )
+                f.write(f"{indent}    {k} = LazyPyMenuChild({k})\n\n")
             else:
                 # print("\t\texcluded", k)
                 pass
@@ -274,6 +257,7 @@ class DataModelGenerator:
             )
             f.write(f'{indent}        """\n')
             f.write(f"{indent}        pass\n\n")
+            f.write(f"{indent}    {k} = LazyPyMenuChild({k})\n\n")
             api_tree[k] = "Parameter"
         for k in commands:
             f.write(f"{indent}    class {k}(PyCommand):\n")
@@ -285,6 +269,7 @@ class DataModelGenerator:
             )
             f.write(f'{indent}        """\n')
             f.write(f"{indent}        pass\n\n")
+            f.write(f"{indent}    {k} = LazyPyMenuChild({k})\n\n")
             api_tree[k] = "Command"
         return api_tree
 
@@ -373,6 +358,7 @@ class DataModelGenerator:
                 f.write("#\n")
                 f.write("# pylint: disable=line-too-long\n\n")
                 f.write("from ansys.fluent.core.services.datamodel_se import (\n")
+                f.write("    LazyPyMenuChild,\n")
                 f.write("    PyMenu,\n")
                 f.write("    PyParameter,\n")
                 f.write("    PyTextual,\n")
@@ -219,13 +219,6 @@ class TUIGenerator:
         indent += 1
         self._write_code_to_tui_file("self.path = path\n", indent)
         self._write_code_to_tui_file("self.service = service\n", indent)
-        for k, v in menu.children.items():
-            if not v.is_command:
-                self._write_code_to_tui_file(
-                    f"self.{k} = self.__class__.{k}"
-                    f'(path + ["{v.tui_name}"], service)\n',
-                    indent,
-                )
         self._write_code_to_tui_file("super().__init__(path, service)\n", indent)
         indent -= 1
 
@@ -256,6 +249,10 @@ class TUIGenerator:
                 pass
             else:
                 api_tree[k] = self._write_menu_to_tui_file(v, indent)
+                # Child menus are created on first access
+                self._write_code_to_tui_file(
+                    f'{k} = LazyTUIMenu({k}, "{v.tui_name}")\n', indent
+                )
         return api_tree
 
     def _write_doc_for_menu(
@@ -334,7 +331,7 @@ class TUIGenerator:
                 "#\n"
                 "# pylint: disable=line-too-long\n\n"
                 "from ansys.fluent.core.services.datamodel_tui "
-                "import PyMenu, TUIMenu\n\n\n"
+                "import LazyTUIMenu, PyMenu, TUIMenu\n\n\n"
             )
             self._main_menu.name = "main_menu"
             api_tree["tui"] = self._write_menu_to_tui_file(self._main_menu)
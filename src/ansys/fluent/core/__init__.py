@@ -20,6 +20,7 @@ from ansys.fluent.core.launcher.launcher import (  # noqa: F401
 )
 from ansys.fluent.core.services.batch_ops import BatchOps  # noqa: F401
 from ansys.fluent.core.session import BaseSession as Fluent  # noqa: F401
+from ansys.fluent.core.solver.flobject import settings_cache  # noqa: F401
 from ansys.fluent.core.utils import fldoc
 from ansys.fluent.core.utils.search import search  # noqa: F401
 from ansys.fluent.core.utils.setup_for_fluent import setup_for_fluent  # noqa: F401
@@ -64,6 +65,15 @@ INFER_REMOTING_IP_TIMEOUT_PER_IP = 2
 
 pydoc.text.docother = fldoc.docother.__get__(pydoc.text, pydoc.TextDoc)
 
+# Whether to cache the settings static-info on disk
+SETTINGS_USE_STATIC_INFO_CACHE = False
+
+# Directory of the on-disk settings static-info cache
+SETTINGS_STATIC_INFO_CACHE_PATH = os.path.join(USER_DATA_PATH, "settings")
+
+# Maximum number of entries kept in the on-disk settings static-info cache
+SETTINGS_STATIC_INFO_CACHE_MAX_ENTRIES = 4
+
 # Whether to use datamodel state caching
 DATAMODEL_USE_STATE_CACHE = True
 
@@ -72,3 +82,15 @@ DATAMODEL_USE_ATTR_CACHE = True
 
 # Whether stream and cache commands state
 DATAMODEL_USE_NOCOMMANDS_DIFF_STATE = True
+
+# Maximum number of datamodel events waiting for their callbacks
+DATAMODEL_EVENTS_QUEUE_SIZE = 10000
+
+# Maximum number of iterations kept per monitor set, all of them are kept if None
+MONITORS_MAX_HISTORY = None
+
+# Policy for queueing streaming callbacks: "block", "drop_oldest" or "coalesce"
+STREAMING_DISPATCH_POLICY = "block"
+
+# Maximum number of streaming callbacks waiting to run
+STREAMING_DISPATCH_QUEUE_SIZE = 1000
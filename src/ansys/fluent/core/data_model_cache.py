@@ -2,7 +2,9 @@
 
 
 from collections import defaultdict
-from typing import Any, Dict, List, Union
+import operator
+import threading
+from typing import Any, Callable, Dict, List, Union
 
 from ansys.api.fluent.v0.variant_pb2 import Variant
 
@@ -20,8 +22,80 @@ StateType = Union[
 ]
 
 
+_SCALAR_STATES = frozenset(
+    ("bool_state", "int64_state", "double_state", "string_state")
+)
+_VECTOR_STATES = frozenset(
+    (
+        "bool_vector_state",
+        "int64_vector_state",
+        "double_vector_state",
+        "string_vector_state",
+    )
+)
+
+
+class _CacheDict(dict):
+    """Dictionary of cached state which indexes its named-object children.
+
+    Named-object children are stored under ``<type>:<display name>`` keys
+    with the internal name under ``__iname__``. The index maps
+    ``<type>:<internal name>`` to the stored key and is maintained by item
+    assignment, item deletion and ``clear``.
+    """
+
+    __slots__ = ("inames",)
+
+    def __init__(self, *args, **kwargs):
+        """__init__ method of _CacheDict class."""
+        super().__init__()
+        self.inames = {}
+        for k, v in dict(*args, **kwargs).items():
+            self[k] = v
+
+    def __setitem__(self, key, value):
+        if ":" in key:
+            old_value = self.get(key)
+            if isinstance(old_value, dict) and "__iname__" in old_value:
+                self.inames.pop(_iname_key(key, old_value), None)
+            if isinstance(value, dict) and "__iname__" in value:
+                self.inames[_iname_key(key, value)] = key
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key):
+        value = self[key]
+        super().__delitem__(key)
+        if isinstance(value, dict) and "__iname__" in value:
+            self.inames.pop(_iname_key(key, value), None)
+
+    def clear(self):
+        super().clear()
+        self.inames.clear()
+
+    def __reduce__(self):
+        return self.__class__, (dict(self),)
+
+
+def _iname_key(key: str, value: Dict[str, StateType]) -> str:
+    return f"{key.split(':', maxsplit=1)[0]}:{value['__iname__']}"
+
+
+def _copy_state(state: StateType) -> StateType:
+    if isinstance(state, dict):
+        return {k: _copy_state(v) for k, v in state.items()}
+    elif isinstance(state, list):
+        return [_copy_state(x) for x in state]
+    return state
+
+
 class DataModelCache:
-    """Class to manage datamodel cache."""
+    """Class to manage datamodel cache.
+
+    One instance is created per datamodel service, i.e. per Fluent
+    connection. The cache is updated from the datamodel streaming thread
+    and read from user threads, so all access is serialized by a lock and
+    ``get_state`` returns a copy of the cached state.
+    """
 
     class Empty:
         """Class representing unassigned cached state."""
@@ -42,11 +116,14 @@ class DataModelCache:
         """
         return state is DataModelCache.Empty
 
-    rules_str_to_cache = defaultdict(dict)
-    rules_str_to_config = {}
+    def __init__(self):
+        """__init__ method of DataModelCache class."""
+        self.rules_str_to_cache = defaultdict(_CacheDict)
+        self.rules_str_to_config = {}
+        self.synced_rules = set()
+        self._lock = threading.RLock()
 
-    @staticmethod
-    def get_config(rules: str, name: str) -> Any:
+    def get_config(self, rules: str, name: str) -> Any:
         """Get datamodel cache configuration value.
 
         Parameters
@@ -61,10 +138,10 @@ class DataModelCache:
         Any
             configuration value
         """
-        return DataModelCache.rules_str_to_config.get(rules, {}).get(name, False)
+        with self._lock:
+            return self.rules_str_to_config.get(rules, {}).get(name, False)
 
-    @staticmethod
-    def set_config(rules: str, name: str, value: Any):
+    def set_config(self, rules: str, name: str, value: Any):
         """Set datamodel cache configuration value.
 
         Parameters
@@ -76,68 +153,142 @@ class DataModelCache:
         value : Any
             configuration value
         """
-        if rules not in DataModelCache.rules_str_to_config:
-            DataModelCache.rules_str_to_config[rules] = {}
-        DataModelCache.rules_str_to_config[rules][name] = value
+        with self._lock:
+            self.rules_str_to_config.setdefault(rules, {})[name] = value
+
+    def is_synced(self, rules: str) -> bool:
+        """Check whether the cache holds the full state of the datamodel.
+
+        Parameters
+        ----------
+        rules : str
+            datamodel rules
+
+        Returns
+        -------
+        bool
+            whether the cache is synced with the server
+        """
+        with self._lock:
+            return rules in self.synced_rules
+
+    def set_synced(self, rules: str, synced: bool):
+        """Set whether the cache holds the full state of the datamodel.
+
+        Parameters
+        ----------
+        rules : str
+            datamodel rules
+        synced : bool
+            whether the cache is synced with the server
+        """
+        with self._lock:
+            if synced:
+                self.synced_rules.add(rules)
+            else:
+                self.synced_rules.discard(rules)
+
+    def update_cache_from_stream(
+        self, rules: str, state: Variant, deleted_paths: List[str]
+    ):
+        """Update datamodel cache from the state streamed by a datamodel
+        stream. The first streamed state is the full state of the datamodel,
+        after which the cache is synced with the server.
+
+        Parameters
+        ----------
+        rules : str
+            datamodel rules
+        state : Variant
+            streamed state
+        deleted_paths : List[str]
+            list of deleted paths
+        """
+        with self._lock:
+            self.update_cache(rules, state, deleted_paths)
+            self.synced_rules.add(rules)
+
+    @staticmethod
+    def _find_named_object_key(
+        source: Dict[str, StateType], key: str, internal_names_as_keys: bool
+    ):
+        """Find the cache key of the named object with path component
+        ``<type>:<internal name>``, or ``None`` if it is not cached."""
+        if internal_names_as_keys:
+            return key if key in source else None
+        inames = getattr(source, "inames", None)
+        if inames is not None:
+            cache_key = inames.get(key)
+            return cache_key if cache_key in source else None
+        type_, iname = key.split(":", maxsplit=1)
+        for k, v in source.items():
+            if (
+                isinstance(v, dict)
+                and v.get("__iname__") == iname
+                and k.startswith(f"{type_}:")
+            ):
+                return k
+
+    @staticmethod
+    def _rename_named_object(source: Dict[str, StateType], key: str, new_key: str):
+        """Move the named object to its new key, which also updates the
+        internal name index. The object is moved to the end of the parent."""
+        value = dict.pop(source, key)
+        source[new_key] = value
 
     @staticmethod
     def _update_cache_from_variant_state(
-        rules: str, source: Dict[str, StateType], key: str, state: Variant, updaterFn
+        internal_names_as_keys: bool,
+        source: Dict[str, StateType],
+        key: str,
+        state: Variant,
+        updaterFn,
     ):
-        if state.HasField("bool_state"):
-            updaterFn(source, key, state.bool_state)
-        elif state.HasField("int64_state"):
-            updaterFn(source, key, state.int64_state)
-        elif state.HasField("double_state"):
-            updaterFn(source, key, state.double_state)
-        elif state.HasField("string_state"):
-            updaterFn(source, key, state.string_state)
-        elif state.HasField("bool_vector_state"):
-            updaterFn(source, key, state.bool_vector_state.item)
-        elif state.HasField("int64_vector_state"):
-            updaterFn(source, key, state.int64_vector_state.item)
-        elif state.HasField("double_vector_state"):
-            updaterFn(source, key, state.double_vector_state.item)
-        elif state.HasField("string_vector_state"):
-            updaterFn(source, key, state.string_vector_state.item)
-        elif state.HasField("variant_vector_state"):
+        which = state.WhichOneof("as")
+        if which in _SCALAR_STATES:
+            updaterFn(source, key, getattr(state, which))
+        elif which in _VECTOR_STATES:
+            updaterFn(source, key, getattr(state, which).item)
+        elif which == "variant_vector_state":
             updaterFn(source, key, [])
             for item in state.variant_vector_state.item:
                 DataModelCache._update_cache_from_variant_state(
-                    rules, source, key, item, lambda d, k, v: d[k].append(v)
+                    internal_names_as_keys,
+                    source,
+                    key,
+                    item,
+                    lambda d, k, v: d[k].append(v),
                 )
-        elif state.HasField("variant_map_state"):
-            internal_names_as_keys = DataModelCache.get_config(
-                rules, "internal_names_as_keys"
-            )
+        elif which == "variant_map_state":
+            items = state.variant_map_state.item
             if ":" in key:
-                type_, iname = key.split(":", maxsplit=1)
-                for k1, v1 in source.items():
-                    if (internal_names_as_keys and k1 == key) or (
-                        (not internal_names_as_keys)
-                        and isinstance(v1, dict)
-                        and v1.get("__iname__") == iname
-                    ):
-                        key = k1
-                        break
+                cache_key = DataModelCache._find_named_object_key(
+                    source, key, internal_names_as_keys
+                )
+                if cache_key is not None:
+                    key = cache_key
+                    if not internal_names_as_keys and "_name_" in items:
+                        type_ = key.split(":", maxsplit=1)[0]
+                        new_key = f"{type_}:{items['_name_'].string_state}"
+                        if new_key != key:
+                            DataModelCache._rename_named_object(source, key, new_key)
+                            key = new_key
+                elif internal_names_as_keys:  # new named object
+                    source[key] = _CacheDict()
                 else:  # new named object
-                    if internal_names_as_keys:
-                        source[key] = {}
-                    else:
-                        name = state.variant_map_state.item["_name_"].string_state
-                        key = f"{type_}:{name}"
-                        source[key] = {"__iname__": iname}
+                    type_, iname = key.split(":", maxsplit=1)
+                    key = f"{type_}:{items['_name_'].string_state}"
+                    source[key] = _CacheDict(__iname__=iname)
             else:
                 if key not in source:
-                    source[key] = {}
+                    source[key] = _CacheDict()
             source = source[key]
-            for k, v in state.variant_map_state.item.items():
+            for k, v in items.items():
                 DataModelCache._update_cache_from_variant_state(
-                    rules, source, k, v, dict.__setitem__
+                    internal_names_as_keys, source, k, v, operator.setitem
                 )
 
-    @staticmethod
-    def update_cache(rules: str, state: Variant, deleted_paths: List[str]):
+    def update_cache(self, rules: str, state: Variant, deleted_paths: List[str]):
         """Update datamodel cache from streamed state.
 
         Parameters
@@ -149,41 +300,34 @@ class DataModelCache:
         deleted_paths : List[str]
             list of deleted paths
         """
-        cache = DataModelCache.rules_str_to_cache[rules]
-        internal_names_as_keys = DataModelCache.get_config(
-            rules, "internal_names_as_keys"
-        )
-        for deleted_path in deleted_paths:
-            comps = [x for x in deleted_path.split("/") if x]
-            sub_cache = cache
-            for i, comp in enumerate(comps):
-                if ":" in comp:
-                    _, iname = comp.split(":", maxsplit=1)
-                    key_to_del = None
-                    for k, v in sub_cache.items():
-                        if (internal_names_as_keys and k == comp) or (
-                            (not internal_names_as_keys)
-                            and isinstance(v, dict)
-                            and v.get("__iname__") == iname
-                        ):
-                            if i == len(comps) - 1:
-                                key_to_del = k
-                            else:
-                                sub_cache = v
-                            break
-                    else:
+        with self._lock:
+            cache = self.rules_str_to_cache[rules]
+            internal_names_as_keys = self.get_config(rules, "internal_names_as_keys")
+            for deleted_path in deleted_paths:
+                comps = [x for x in deleted_path.split("/") if x]
+                sub_cache = cache
+                for i, comp in enumerate(comps):
+                    if not isinstance(sub_cache, dict):
                         break
-                    if key_to_del:
-                        del sub_cache[key_to_del]
-                else:
-                    if comp in sub_cache:
-                        sub_cache = sub_cache[comp]
+                    if ":" in comp:
+                        key = DataModelCache._find_named_object_key(
+                            sub_cache, comp, internal_names_as_keys
+                        )
+                        if key is None:
+                            break
+                        if i == len(comps) - 1:
+                            del sub_cache[key]
+                        else:
+                            sub_cache = sub_cache[key]
                     else:
-                        break
-        for k, v in state.variant_map_state.item.items():
-            DataModelCache._update_cache_from_variant_state(
-                rules, cache, k, v, dict.__setitem__
-            )
+                        if comp in sub_cache:
+                            sub_cache = sub_cache[comp]
+                        else:
+                            break
+            for k, v in state.variant_map_state.item.items():
+                DataModelCache._update_cache_from_variant_state(
+                    internal_names_as_keys, cache, k, v, operator.setitem
+                )
 
     @staticmethod
     def _dm_path_comp(comp):
@@ -193,8 +337,18 @@ class DataModelCache:
     def _dm_path_comp_list(obj):
         return [DataModelCache._dm_path_comp(comp) for comp in obj.path]
 
-    @staticmethod
-    def get_state(rules: str, obj: object) -> Any:
+    def _get_cached_state(self, rules: str, obj: object) -> Any:
+        cache = self.rules_str_to_cache.get(rules)
+        if not cache:
+            return DataModelCache.Empty
+        path_components = DataModelCache._dm_path_comp_list(obj)
+        for path_component in path_components:
+            cache = cache.get(path_component, None)
+            if not cache:
+                return DataModelCache.Empty
+        return cache
+
+    def get_state(self, rules: str, obj: object) -> Any:
         """Retrieve state from datamodel cache
 
         Parameters
@@ -206,18 +360,33 @@ class DataModelCache:
 
         Returns
         -------
-        _type_
-            _description_
+        Any
+            copy of the cached state or ``DataModelCache.Empty``
         """
-        cache = DataModelCache.rules_str_to_cache[rules]
-        if not len(cache):
-            return DataModelCache.Empty
-        path_components = DataModelCache._dm_path_comp_list(obj)
-        for path_component in path_components:
-            cache = cache.get(path_component, None)
-            if not cache:
-                return DataModelCache.Empty
-        return cache
+        with self._lock:
+            state = self._get_cached_state(rules, obj)
+            return state if state is DataModelCache.Empty else _copy_state(state)
+
+    def read_state(self, rules: str, obj: object, reader: Callable[[Any], Any]) -> Any:
+        """Read the cached state without copying it.
+
+        Parameters
+        ----------
+        rules : str
+            datamodel rules
+        obj : object
+            datamodel object
+        reader : Callable[[Any], Any]
+            Function called with the cached state, or ``DataModelCache.Empty``,
+            while the cache is locked. It must not modify or keep the state.
+
+        Returns
+        -------
+        Any
+            Return value of ``reader``.
+        """
+        with self._lock:
+            return reader(self._get_cached_state(rules, obj))
 
     @staticmethod
     def _set_state_at_path(cache, path, value):
@@ -229,11 +398,10 @@ class DataModelCache:
         else:
             next_cache = cache.get(path_component, None)
             if not next_cache:
-                next_cache = cache[path_component] = dict()
+                next_cache = cache[path_component] = _CacheDict()
             DataModelCache._set_state_at_path(next_cache, path[1:], value)
 
-    @staticmethod
-    def set_state(rules: str, obj: object, value: Any):
+    def set_state(self, rules: str, obj: object, value: Any):
         """Set datamodel cache state
 
         Parameters
@@ -245,8 +413,9 @@ class DataModelCache:
         value : Any
             state
         """
-        DataModelCache._set_state_at_path(
-            DataModelCache.rules_str_to_cache[rules],
-            DataModelCache._dm_path_comp_list(obj),
-            value,
-        )
+        with self._lock:
+            DataModelCache._set_state_at_path(
+                self.rules_str_to_cache[rules],
+                DataModelCache._dm_path_comp_list(obj),
+                _copy_state(value),
+            )
@@ -16,11 +16,17 @@ Example
 
 """
 import codecs
+from collections.abc import Mapping
 import gzip
+import io
+import json
+import mmap
 import os
 from os.path import dirname
 from pathlib import Path
-from typing import Dict, List, Optional
+import re
+import tempfile
+from typing import Dict, List, Optional, Tuple
 import xml.etree.ElementTree as ET
 
 import h5py
@@ -202,6 +208,8 @@ class CaseFile:
         self,
         case_filepath: Optional[str] = None,
         project_filepath: Optional[str] = None,
+        lazy: bool = False,
+        cache_index: bool = False,
     ) -> None:
         """Initialize a CaseFile object. Exactly one file path argument must be specified.
 
@@ -211,6 +219,13 @@ class CaseFile:
             The path of a case file.
         project_filepath : Optional[str]
             The path of a project file from which the case file is selected.
+        lazy : bool, optional
+            Whether to index the rp-vars and parse each of them only when it
+            is accessed. The default is ``False``, which parses all of them
+            here.
+        cache_index : bool, optional
+            Whether to cache the rp-vars index on disk next to the case file
+            in lazy mode. The default is ``False``.
         """
         if (not case_filepath) == (not project_filepath):
             raise RuntimeError(
@@ -231,25 +246,12 @@ class CaseFile:
                 )
 
         try:
-            if Path(case_filepath).match("*.cas.h5"):
-                file = h5py.File(case_filepath)
-                settings = file["settings"]
-                rpvars = settings["Rampant Variables"][0]
-                rp_vars_str = rpvars.decode()
-            elif Path(case_filepath).match("*.cas"):
-                with open(case_filepath, "rb") as file:
-                    rp_vars_str = file.read()
-                rp_vars_str = _get_processed_string(rp_vars_str)
-            elif Path(case_filepath).match("*.cas.gz"):
-                with gzip.open(case_filepath, "rb") as file:
-                    rp_vars_str = file.read()
-                rp_vars_str = _get_processed_string(rp_vars_str)
-            else:
-                error_message = (
-                    "Could not read case file. "
-                    "Only valid Case files (.h5, .cas, .cas.gz) can be read. "
+            if lazy:
+                rp_vars_section, rp_vars_index = _read_rp_vars_index(
+                    str(case_filepath), cache_index
                 )
-                raise RuntimeError(error_message)
+            else:
+                _, rp_vars_section = _read_case_rp_vars_section(case_filepath)
 
         except FileNotFoundError as e:
             raise FileNotFoundError(
@@ -262,7 +264,11 @@ class CaseFile:
         except Exception as e:
             raise RuntimeError(f"Could not read case file {case_filepath}") from e
 
-        self._rp_vars = {v[0]: v[1] for v in lispy.parse(rp_vars_str)[1]}
+        if lazy:
+            self._rp_vars = _LazyRPVars(rp_vars_section, rp_vars_index)
+        else:
+            rp_vars_str = codecs.decode(rp_vars_section, errors="ignore")
+            self._rp_vars = {v[0]: v[1] for v in lispy.parse(rp_vars_str)[1]}
 
         self._config_vars = {v[0]: v[1] for v in self._rp_vars["case-config"]}
 
@@ -345,7 +351,7 @@ class CaseFile:
         dict
             The rpvars associated with this case.
         """
-        return self._rp_vars
+        return dict(self._rp_vars)
 
     @property
     def rp_var(self) -> CaseVariable:
@@ -411,6 +417,304 @@ class CaseFile:
         return self._rp_vars[name]
 
 
+_RP_VARS_SECTION_START = b"(37 ("
+
+_RP_VARS_SECTION_CHUNK_SIZE = 1 << 20
+
+_SECTION_TOKENS = re.compile(rb'[()"\\]')
+
+
+class _SectionScanner:
+    """Find the parentheses of a Scheme section which may be fed in chunks,
+    skipping parentheses inside strings."""
+
+    def __init__(self) -> None:
+        self._depth = 0
+        self._in_string = False
+        self._escaped_pos = -1
+
+    def parentheses(self, data, start: int = 0, offset: int = 0):
+        """Yield the parentheses of ``data`` outside strings.
+
+        Parameters
+        ----------
+        data : bytes-like
+            The data to scan.
+        start : int
+            The index in ``data`` to start from.
+        offset : int
+            The position of ``data`` within the whole section.
+
+        Yields
+        ------
+        Tuple[int, int]
+            The index of the parenthesis in ``data`` and the depth inside it.
+        """
+        for match in _SECTION_TOKENS.finditer(data, start):
+            i = match.start()
+            if offset + i == self._escaped_pos:
+                continue
+            c = data[i]
+            if self._in_string:
+                if c == 0x5C:  # backslash
+                    self._escaped_pos = offset + i + 1
+                elif c == 0x22:  # double quote
+                    self._in_string = False
+            elif c == 0x22:
+                self._in_string = True
+            elif c == 0x28:  # opening parenthesis
+                self._depth += 1
+                yield i, self._depth
+            elif c == 0x29:  # closing parenthesis
+                yield i, self._depth
+                self._depth -= 1
+
+    def scan(self, data, start: int = 0, offset: int = 0) -> Optional[int]:
+        """Scan ``data`` from ``start``.
+
+        Parameters
+        ----------
+        data : bytes-like
+            The data to scan.
+        start : int
+            The index in ``data`` to start from.
+        offset : int
+            The position of ``data`` within the whole section.
+
+        Returns
+        -------
+        Optional[int]
+            The index in ``data`` just after the closing parenthesis of the
+            section, or ``None`` if the section continues beyond ``data``.
+        """
+        for i, depth in self.parentheses(data, start, offset):
+            if depth == 1 and data[i] == 0x29:
+                return i + 1
+
+
+def _find_rp_vars_section(data) -> Tuple[int, int]:
+    """Find the start and end of the rp-vars section of a legacy case file in
+    a bytes-like object, which can be a memory-mapped file."""
+    start = data.find(_RP_VARS_SECTION_START)
+    if start == -1:
+        raise RuntimeError("The rp-vars section is not found.")
+    end = _SectionScanner().scan(data, start)
+    if end is None:
+        raise RuntimeError("The rp-vars section is incomplete.")
+    return start, end
+
+
+def _get_rp_vars_section(data) -> bytes:
+    """Extract the rp-vars section of a legacy case file from a bytes-like
+    object, which can be a memory-mapped file."""
+    start, end = _find_rp_vars_section(data)
+    return data[start:end]
+
+
+def _read_rp_vars_section(
+    file, chunk_size: int = _RP_VARS_SECTION_CHUNK_SIZE
+) -> Tuple[int, bytes]:
+    """Read the rp-vars section of a legacy case file from a binary file
+    object in chunks, stopping at the end of the section.
+
+    Returns the position of the section in the file and the section.
+    """
+    overlap = len(_RP_VARS_SECTION_START) - 1
+    data = b""
+    position = 0
+    while True:
+        chunk = file.read(chunk_size)
+        if not chunk:
+            raise RuntimeError("The rp-vars section is not found.")
+        data = data[-overlap:] + chunk
+        position += len(chunk)
+        start = data.find(_RP_VARS_SECTION_START)
+        if start != -1:
+            section_position = position - len(data) + start
+            data = data[start:]
+            break
+    section = []
+    offset = 0
+    scanner = _SectionScanner()
+    while True:
+        end = scanner.scan(data, 0, offset)
+        if end is not None:
+            section.append(data[:end])
+            return section_position, b"".join(section)
+        section.append(data)
+        offset += len(data)
+        data = file.read(chunk_size)
+        if not data:
+            raise RuntimeError("The rp-vars section is incomplete.")
+
+
+def _read_case_rp_vars_section(
+    case_filepath: str, section_range: Optional[Tuple[int, int]] = None
+) -> Tuple[int, bytes]:
+    """Read the rp-vars section of a case file.
+
+    Parameters
+    ----------
+    case_filepath : str
+        The path of a case file.
+    section_range : Optional[Tuple[int, int]]
+        The known start and end of the section in the file, which skips
+        searching for it.
+
+    Returns
+    -------
+    Tuple[int, bytes]
+        The position of the section in the file and the section.
+    """
+    if Path(case_filepath).match("*.cas.h5"):
+        with h5py.File(case_filepath) as file:
+            return 0, bytes(file["settings"]["Rampant Variables"][0])
+    elif Path(case_filepath).match("*.cas"):
+        with open(case_filepath, "rb") as file, mmap.mmap(
+            file.fileno(), 0, access=mmap.ACCESS_READ
+        ) as mapped_file:
+            start, end = section_range or _find_rp_vars_section(mapped_file)
+            return start, mapped_file[start:end]
+    elif Path(case_filepath).match("*.cas.gz"):
+        with gzip.open(case_filepath, "rb") as file:
+            if section_range:
+                start, end = section_range
+                file.seek(start)
+                return start, file.read(end - start)
+            return _read_rp_vars_section(file)
+    else:
+        error_message = (
+            "Could not read case file. "
+            "Only valid Case files (.h5, .cas, .cas.gz) can be read. "
+        )
+        raise RuntimeError(error_message)
+
+
+_RP_VAR_NAME = re.compile(rb'\(\s*([^\s()"]+)')
+
+
+def _index_rp_vars_section(section: bytes) -> Dict[str, Tuple[int, int]]:
+    """Index the ``(name value)`` entries of an rp-vars section.
+
+    Parameters
+    ----------
+    section : bytes
+        The rp-vars section, ``(37 ((name value) ...))``.
+
+    Returns
+    -------
+    Dict[str, Tuple[int, int]]
+        The start and end of each entry in the section by name.
+    """
+    entries = {}
+    entry_start = None
+    for i, depth in _SectionScanner().parentheses(section):
+        if depth == 3:
+            if section[i] == 0x28:
+                entry_start = i
+            else:
+                match = _RP_VAR_NAME.match(section, entry_start)
+                if match:
+                    entries[match.group(1).decode(errors="ignore")] = (
+                        entry_start,
+                        i + 1,
+                    )
+    return entries
+
+
+class _RPVarsIndexCache:
+    """On-disk cache of the rp-vars index of a case file, stored next to the
+    case file."""
+
+    format_version = 1
+
+    def __init__(self, case_filepath: str):
+        """__init__ method of _RPVarsIndexCache class."""
+        self._filepath = f"{case_filepath}.rpvars-index.json"
+        stat = os.stat(case_filepath)
+        self._key = [self.format_version, stat.st_size, stat.st_mtime_ns]
+
+    def load(self) -> Optional[Tuple[Tuple[int, int], Dict[str, Tuple[int, int]]]]:
+        """Load the section range and the entries index if they are cached
+        for the current case file."""
+        try:
+            with open(self._filepath, "r") as file:
+                data = json.load(file)
+            if data["key"] == self._key:
+                return tuple(data["section"]), {
+                    k: tuple(v) for k, v in data["entries"].items()
+                }
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+    def save(
+        self, section_range: Tuple[int, int], entries: Dict[str, Tuple[int, int]]
+    ) -> None:
+        """Save the section range and the entries index."""
+        data = dict(key=self._key, section=section_range, entries=entries)
+        try:
+            fd, tmp_filepath = tempfile.mkstemp(
+                dir=os.path.dirname(self._filepath) or None, suffix=".tmp"
+            )
+            try:
+                with os.fdopen(fd, "w") as file:
+                    json.dump(data, file)
+                os.replace(tmp_filepath, self._filepath)
+            except BaseException:
+                os.remove(tmp_filepath)
+                raise
+        except OSError:
+            pass  # The case file directory may be read-only.
+
+
+class _LazyRPVars(Mapping):
+    """Read-only mapping of rp-vars which parses each value on first
+    access."""
+
+    def __init__(self, section: bytes, entries: Dict[str, Tuple[int, int]]):
+        """__init__ method of _LazyRPVars class."""
+        self._section = section
+        self._entries = entries
+        self._values = {}
+
+    def __getitem__(self, name: str):
+        try:
+            return self._values[name]
+        except KeyError:
+            start, end = self._entries[name]
+            entry = codecs.decode(self._section[start:end], errors="ignore")
+            value = lispy.expand(lispy.read(lispy.InputPort(io.StringIO(entry))))[1]
+            self._values[name] = value
+            return value
+
+    def __contains__(self, name) -> bool:
+        return name in self._entries
+
+    def __iter__(self):
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def _read_rp_vars_index(
+    case_filepath: str, cache_index: bool = False
+) -> Tuple[bytes, Dict[str, Tuple[int, int]]]:
+    """Read the rp-vars section of a case file and the index of its entries,
+    using the on-disk index cache if requested."""
+    index_cache = _RPVarsIndexCache(case_filepath) if cache_index else None
+    cached = index_cache.load() if index_cache else None
+    if cached:
+        section_range, entries = cached
+        _, section = _read_case_rp_vars_section(case_filepath, section_range)
+        return section, entries
+    start, section = _read_case_rp_vars_section(case_filepath)
+    entries = _index_rp_vars_section(section)
+    if index_cache:
+        index_cache.save((start, start + len(section)), entries)
+    return section, entries
+
+
 def _get_processed_string(input_string: bytes) -> str:
     """Processes the input string (binary) with help of an identifier to return
     it in a format which can be parsed by lispy.parse()
@@ -424,9 +728,7 @@ def _get_processed_string(input_string: bytes) -> str:
     -------
     processed string (str)
     """
-    rp_vars_str = codecs.decode(input_string, errors="ignore")
-    string_identifier = "(37 ("
-    return string_identifier + rp_vars_str.split(string_identifier)[1]
+    return codecs.decode(_get_rp_vars_section(input_string), errors="ignore")
 
 
 def _get_case_filepath_from_flprj(flprj_file):
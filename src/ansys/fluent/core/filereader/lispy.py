@@ -64,58 +64,56 @@ def parse(in_port):
 eof_object = Symbol("#<eof-object>")  # Note: uninterned; can't be read
 
 
-def count_unescaped_quotes(line):
-    count = 0
-    escaped = False
-    for c in line:
-        if c == "\\":
-            escaped = True
-        else:
-            if c == '"' and not escaped:
-                count += 1
-            escaped = False
-    return count
-
-
 class InputPort:
     """An input port.
 
-    Retains a line of chars.
+    Retains a line of chars and the position of the next token in it.
     """
 
-    tokenizer = r"""\s*(,@|[('`,)]|"(?:[\\].|[^\\"])*"|;.*|[^\s('"`,;)]*)(.*)"""
+    tokenizer = r"""\s*(,@|[('`,)]|"(?:[\\][\s\S]|[^\\"])*"|;[^\n]*|[^\s('"`,;)]*)"""
+    _token_pattern = re.compile(tokenizer)
 
     def __init__(self, file):
         self.file = file
         self.line = ""
+        self.pos = 0
 
     def next_token(self):
         """Return the next token, reading new text into line buffer if
         needed."""
         while True:
-            if self.line == "":
+            if self.pos >= len(self.line):
                 self.line = self.file.readline()
-                # Capture multiline string and replace newline characters with
-                # "<newline>" before passing to tokenizer
-                if count_unescaped_quotes(self.line) % 2:
+                self.pos = 0
+                if self.line == "":
+                    return eof_object
+            match = InputPort._token_pattern.match(self.line, self.pos)
+            token = match.group(1)
+            self.pos = match.end()
+            if token == "":
+                if self.pos < len(self.line):
+                    # An unterminated string: capture the multiline string
+                    # with the trailing whitespace of each line stripped
+                    lines = [self.line[self.pos :].rstrip()]
                     while True:
                         next_line = self.file.readline()
-                        self.line = self.line.rstrip() + "<newline>" + next_line
-                        if count_unescaped_quotes(next_line) > 0:
+                        if next_line == "":
+                            raise SyntaxError("unexpected EOF in string")
+                        if '"' in next_line:
                             break
-            if self.line == "":
-                return eof_object
-            token, self.line = re.match(InputPort.tokenizer, self.line).groups()
-            if token != "" and not token.startswith(";"):
-                # Replace back "<newline>" to newline character after tokenizing
-                token = token.replace("<newline>", "\n")
+                        lines.append(next_line.rstrip())
+                    lines.append(next_line)
+                    self.line = "\n".join(lines)
+                    self.pos = 0
+            elif token[0] != ";":
                 return token
 
 
 def readchar(in_port):
     """Read the next character from an input port."""
-    if in_port.line != "":
-        ch, in_port.line = in_port.line[0], in_port.line[1:]
+    if in_port.pos < len(in_port.line):
+        ch = in_port.line[in_port.pos]
+        in_port.pos += 1
         return ch
     else:
         return in_port.file.read(1) or eof_object
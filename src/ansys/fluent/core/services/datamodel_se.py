@@ -1,8 +1,8 @@
 """Wrappers over StateEngine based datamodel gRPC service of Fluent."""
 from enum import Enum
-import functools
 import itertools
 import logging
+import threading
 from typing import Any, Callable, Dict, Iterator, List, Tuple, Type
 
 import grpc
@@ -11,7 +11,11 @@ from ansys.api.fluent.v0 import datamodel_se_pb2 as DataModelProtoModule
 from ansys.api.fluent.v0 import datamodel_se_pb2_grpc as DataModelGrpcModule
 from ansys.api.fluent.v0.variant_pb2 import Variant
 import ansys.fluent.core as pyfluent
-from ansys.fluent.core.data_model_cache import DataModelCache
+from ansys.fluent.core.data_model_cache import (
+    _SCALAR_STATES,
+    _VECTOR_STATES,
+    DataModelCache,
+)
 from ansys.fluent.core.services.error_handler import catch_grpc_error
 from ansys.fluent.core.services.interceptors import (
     BatchInterceptor,
@@ -84,6 +88,8 @@ class DatamodelService(StreamingService):
         )
         self.event_streaming = None
         self.events = {}
+        self.cache = DataModelCache()
+        self._name_indices = {}
 
     @catch_grpc_error
     def initialize_datamodel(
@@ -184,10 +190,18 @@ class DatamodelService(StreamingService):
         return self._stub.unsubscribeEvents(request, metadata=self._metadata)
 
     def unsubscribe_all_events(self):
-        """Unsubscribe all subscribed events."""
-        for event in list(self.events.values()):
-            event.unsubscribe()
-        self.events.clear()
+        """Unsubscribe all subscribed events.
+
+        The named object indices kept up to date by the events are dropped
+        even if unsubscribing fails, e.g. on session teardown after the server
+        has exited.
+        """
+        try:
+            for event in list(self.events.values()):
+                event.unsubscribe()
+        finally:
+            self.events.clear()
+            self._name_indices.clear()
 
 
 def _convert_value_to_variant(val: Any, var: Variant):
@@ -214,28 +228,17 @@ def _convert_value_to_variant(val: Any, var: Variant):
 
 def _convert_variant_to_value(var: Variant):
     """Convert Fluent's variant type to a Python data type."""
-    if var.HasField("bool_state"):
-        return var.bool_state
-    elif var.HasField("int64_state"):
-        return var.int64_state
-    elif var.HasField("double_state"):
-        return var.double_state
-    elif var.HasField("string_state"):
-        return var.string_state
-    elif var.HasField("bool_vector_state"):
-        return var.bool_vector_state.item
-    elif var.HasField("int64_vector_state"):
-        return var.int64_vector_state.item
-    elif var.HasField("double_vector_state"):
-        return var.double_vector_state.item
-    elif var.HasField("string_vector_state"):
-        return var.string_vector_state.item
-    elif var.HasField("variant_vector_state"):
+    which = var.WhichOneof("as")
+    if which in _SCALAR_STATES:
+        return getattr(var, which)
+    elif which in _VECTOR_STATES:
+        return getattr(var, which).item
+    elif which == "variant_vector_state":
         val = []
         for item in var.variant_vector_state.item:
             val.append(_convert_variant_to_value(item))
         return val
-    elif var.HasField("variant_map_state"):
+    elif which == "variant_map_state":
         val = {}
         for k, v in var.variant_map_state.item.items():
             val[k] = _convert_variant_to_value(v)
@@ -283,11 +286,16 @@ class EventSubscription:
         self,
         service: DatamodelService,
         request: DataModelProtoModule.SubscribeEventsRequest,
+        response: DataModelProtoModule.EventSubscription = None,
     ):
-        """Subscribe to a datamodel event."""
+        """Subscribe to a datamodel event.
+
+        ``response`` is the response to this event of an already sent
+        ``request`` subscribing to several events.
+        """
         self._service = service
-        response = service.subscribe_events(request)
-        response = response.response[0]
+        if response is None:
+            response = service.subscribe_events(request).response[0]
         if response.status != DataModelProtoModule.STATUS_SUBSCRIBED:
             raise RuntimeError(f"Failed to subscribe event: {request}!")
         self.status = response.status
@@ -346,6 +354,7 @@ class PyStateContainer(PyCallableStateObject):
         else:
             self.path = path
         self.cached_attrs = {}
+        self._attr_subscriptions = {}
 
     docstring = None
 
@@ -358,7 +367,7 @@ class PyStateContainer(PyCallableStateObject):
         return _convert_variant_to_value(response.state)
 
     def get_state(self) -> Any:
-        state = DataModelCache.get_state(self.rules, self)
+        state = self.service.cache.get_state(self.rules, self)
         if DataModelCache.is_unassigned(state):
             state = self.get_remote_state()
         return state
@@ -388,17 +397,33 @@ class PyStateContainer(PyCallableStateObject):
     def _get_cached_attr(self, attrib: str) -> Any:
         cached_val = self.cached_attrs.get(attrib)
         if cached_val is None:
+            if attrib not in self._attr_subscriptions:
+                try:  # will fail for Fluent 23.1 or before
+                    self._attr_subscriptions[attrib] = self._subscribe_attr_cache(
+                        attrib
+                    )
+                except Exception:
+                    return self._get_remote_attr(attrib)
             cached_val = self._get_remote_attr(attrib)
-            try:  # will fail for Fluent 23.1 or before
-                self.add_on_attribute_changed(
-                    attrib,
-                    functools.partial(dict.__setitem__, self.cached_attrs, attrib),
-                )
-                self.cached_attrs[attrib] = cached_val
-            except Exception:
-                pass
+            self.cached_attrs[attrib] = cached_val
         return cached_val
 
+    def _subscribe_attr_cache(self, attrib: str) -> EventSubscription:
+        request = DataModelProtoModule.SubscribeEventsRequest()
+        e = request.eventrequest.add(rules=self.rules)
+        e.attributeChangedEventRequest.path = convert_path_to_se_path(self.path)
+        e.attributeChangedEventRequest.attribute = attrib
+        subscription = EventSubscription(self.service, request)
+        # invalidated on the stream thread, so that a full event queue
+        # cannot leave a stale value in the cache
+        self.service.event_streaming.register_callback(
+            subscription.tag,
+            self,
+            lambda _: self.cached_attrs.pop(attrib, None),
+            dispatch=False,
+        )
+        return subscription
+
     def get_attr(self, attrib: str) -> Any:
         """Get attribute value of the current object.
 
@@ -547,6 +572,7 @@ class PyMenu(PyStateContainer):
             raise RuntimeError(
                 f"{self.__class__.__name__} is not a named object class."
             )
+        _get_named_object_index(self.service, self.rules, self.path).invalidate()
 
     def name(self):
         """Get the name of the named object."""
@@ -828,6 +854,71 @@ class PyDictionary(PyParameter):
     updateDict = update_dict
 
 
+class _NamedObjectIndex:
+    """Display name to internal name map of the named objects of one type
+    under one parent object.
+
+    The map is kept up to date by datamodel events which are subscribed once
+    per parent object and handled on the event stream thread.
+    """
+
+    def __init__(self):
+        """__init__ method of _NamedObjectIndex class."""
+        self.names = None
+        self.generation = 0
+        self.subscribed = None
+        self._lock = threading.Lock()
+
+    def invalidate(self, *args) -> None:
+        """Drop the map so that it is fetched again on next access."""
+        self.generation += 1
+        self.names = None
+
+    def subscribe(self, service: DatamodelService, rules: str, path: Path) -> bool:
+        """Subscribe to the creation of child objects of the container at
+        ``path`` and to changes at their type path, which include their
+        deletion and renaming. Return whether the subscription succeeded.
+
+        Both events are subscribed with a single request, and only once.
+        """
+        with self._lock:
+            if self.subscribed is None:
+                parent_path = convert_path_to_se_path(path[:-1])
+                child_type = path[-1][0]
+                request = DataModelProtoModule.SubscribeEventsRequest()
+                e = request.eventrequest.add(rules=rules)
+                e.createdEventRequest.parentpath = parent_path
+                e.createdEventRequest.childtype = child_type
+                e = request.eventrequest.add(rules=rules)
+                e.affectedEventRequest.path = parent_path
+                e.affectedEventRequest.subtype = child_type
+                try:  # will fail for Fluent 23.1 or before
+                    response = service.subscribe_events(request)
+                    for event_response in response.response:
+                        subscription = EventSubscription(
+                            service, request, event_response
+                        )
+                        service.event_streaming.register_callback(
+                            subscription.tag, self, self.invalidate, dispatch=False
+                        )
+                    self.subscribed = True
+                except Exception:
+                    self.subscribed = False
+            return self.subscribed
+
+
+def _get_named_object_index(
+    service: DatamodelService, rules: str, path: Path
+) -> _NamedObjectIndex:
+    """Get the named object index of the container at ``path``, or of the
+    container of the named object at ``path``."""
+    key = (rules, convert_path_to_se_path(path[:-1]), path[-1][0])
+    index = service._name_indices.get(key)
+    if index is None:
+        index = service._name_indices.setdefault(key, _NamedObjectIndex())
+    return index
+
+
 class PyNamedObjectContainer:
     """Container class using the StateEngine-based DatamodelService as the
     backend. Use this class instead of directly calling the DatamodelService's
@@ -872,16 +963,98 @@ class PyNamedObjectContainer:
                         child_object_names.append(member[len(child_type_suffix) :])
         return child_object_names
 
-    def _get_child_object_display_names(self):
-        child_object_display_names = []
-        for name in self._get_child_object_names():
-            name_path = self.path[0:-1]
-            name_path.append((self.path[-1][0], name))
-            name_path.append(("_name_", ""))
-            child_object_display_names.append(
-                PyMenu(self.service, self.rules, name_path).get_state()
+    def _build_name_index(
+        self, parent_state: Dict[str, Any], internal_names: List[str] = None
+    ) -> Dict[str, str]:
+        """Build the display name to internal name map of the child objects
+        from the state of the parent object.
+
+        The keys of the parent state are ``<type>:<internal name>`` with the
+        display name stored under ``_name_``, or, for the datamodel cache,
+        ``<type>:<display name>`` with the internal name stored under
+        ``__iname__``. ``internal_names`` gives the order of the children.
+        """
+        child_type_suffix = self.path[-1][0] + ":"
+        display_names = {}
+        if isinstance(parent_state, dict):
+            for key, value in parent_state.items():
+                if key.startswith(child_type_suffix) and isinstance(value, dict):
+                    name = key[len(child_type_suffix) :]
+                    display_names[value.get("__iname__", name)] = value.get(
+                        "_name_", name
+                    )
+        name_index = {}
+        for internal_name in internal_names or []:
+            if internal_name in display_names:
+                name = display_names.pop(internal_name)
+            else:
+                name_path = self.path[0:-1]
+                name_path.append((self.path[-1][0], internal_name))
+                name_path.append(("_name_", ""))
+                name = PyMenu(self.service, self.rules, name_path).get_state()
+            name_index[name] = internal_name
+        for internal_name, name in display_names.items():
+            name_index[name] = internal_name
+        return name_index
+
+    def _get_parent_state(self, parent: PyMenu) -> Dict[str, Any]:
+        """Get the state of the parent object which is needed to build the
+        name index, from the datamodel cache when the cache is synced with
+        the server."""
+        if self.service.cache.is_synced(self.rules):
+            child_type_suffix = self.path[-1][0] + ":"
+
+            def read_names(state):
+                if DataModelCache.is_unassigned(state):
+                    return None
+                return {
+                    key: {k: value[k] for k in ("__iname__", "_name_") if k in value}
+                    for key, value in state.items()
+                    if key.startswith(child_type_suffix) and isinstance(value, dict)
+                }
+
+            state = self.service.cache.read_state(self.rules, parent, read_names)
+            if state is not None:
+                return state
+        return parent.get_remote_state()
+
+    def _invalidate_name_index(self):
+        _get_named_object_index(self.service, self.rules, self.path).invalidate()
+
+    def _get_name_index(self, refresh: bool = False) -> Dict[str, str]:
+        """Get the display name to internal name map of the child objects.
+
+        The map is built from one ``get_specs`` call, which gives the order
+        of the child objects, and the state of the parent object, which is
+        read from the datamodel cache when the cache is synced with the
+        server. It is shared by the containers of the parent object until a
+        child object of this type is created, deleted or modified.
+        """
+        index = _get_named_object_index(self.service, self.rules, self.path)
+        name_index = index.names
+        if name_index is None or refresh:
+            generation = index.generation
+            subscribed = index.subscribe(self.service, self.rules, self.path)
+            parent = PyMenu(self.service, self.rules, self.path[:-1])
+            name_index = self._build_name_index(
+                self._get_parent_state(parent), self._get_child_object_names()
             )
-        return child_object_display_names
+            if subscribed and generation == index.generation:
+                index.names = name_index
+        return name_index
+
+    def _get_child_object_display_names(self):
+        return list(self._get_name_index())
+
+    def _has_child_object(self, key: str) -> bool:
+        return key in self._get_name_index() or key in self._get_name_index(
+            refresh=True
+        )
+
+    def _get_child_object(self, child_path: Path):
+        return getattr(self.__class__, f"_{self.__class__.__name__}")(
+            self.service, self.rules, child_path
+        )
 
     def get_object_names(self):
         return self._get_child_object_display_names()
@@ -894,7 +1067,22 @@ class PyNamedObjectContainer:
         int
             Count of child objects.
         """
-        return len(self._get_child_object_display_names())
+        return len(self._get_name_index())
+
+    def __contains__(self, key: str) -> bool:
+        """Check whether a child object exists.
+
+        Parameters
+        ----------
+        key : str
+            Name of the child object.
+
+        Returns
+        -------
+        bool
+            Whether the child object exists.
+        """
+        return self._has_child_object(key)
 
     def __iter__(self) -> Iterator[PyMenu]:
         """Return the next child object.
@@ -907,30 +1095,27 @@ class PyNamedObjectContainer:
         for name in self._get_child_object_display_names():
             child_path = self.path[:-1]
             child_path.append((self.path[-1][0], name))
-            yield getattr(self.__class__, f"_{self.__class__.__name__}")(
-                self.service, self.rules, child_path
-            )
+            yield self._get_child_object(child_path)
 
     def _get_item(self, key: str):
-        if key in self._get_child_object_display_names():
+        if self._has_child_object(key):
             child_path = self.path[:-1]
             child_path.append((self.path[-1][0], key))
-            return getattr(self.__class__, f"_{self.__class__.__name__}")(
-                self.service, self.rules, child_path
-            )
+            return self._get_child_object(child_path)
         else:
             raise LookupError(
                 f"{key} is not found at path " f"{convert_path_to_se_path(self.path)}"
             )
 
     def _del_item(self, key: str):
-        if key in self._get_child_object_display_names():
+        if self._has_child_object(key):
             child_path = self.path[:-1]
             child_path.append((self.path[-1][0], key))
             request = DataModelProtoModule.DeleteObjectRequest()
             request.rules = self.rules
             request.path = convert_path_to_se_path(child_path)
             self.service.delete_object(request)
+            self._invalidate_name_index()
         else:
             raise LookupError(
                 f"{key} is not found at path " f"{convert_path_to_se_path(self.path)}"
@@ -965,6 +1150,7 @@ class PyNamedObjectContainer:
             value["_name_"] = key
         parent_state = {f"{self.__class__.__name__}:{key}": value}
         PyMenu(self.service, self.rules, self.path[:-1]).set_state(parent_state)
+        self._invalidate_name_index()
 
     def __delitem__(self, key: str):
         """Delete the child object by name.
@@ -1072,6 +1258,37 @@ class PyCommand:
             pass
 
 
+class LazyPyMenuChild:
+    """Descriptor for a child of the generated ``PyMenu`` classes.
+
+    The child object is created on first access and stored on the parent
+    object. Accessed through the parent class, the descriptor returns the child
+    class.
+    """
+
+    def __init__(self, child_cls):
+        """__init__ method of LazyPyMenuChild class."""
+        self._child_cls = child_cls
+        self._name = None
+
+    def __set_name__(self, owner, name):
+        self._name = name
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self._child_cls
+        if issubclass(self._child_cls, PyCommand):
+            child = self._child_cls(
+                instance.service, instance.rules, self._name, instance.path
+            )
+        else:
+            child = self._child_cls(
+                instance.service, instance.rules, instance.path + [(self._name, "")]
+            )
+        instance.__dict__[self._name] = child
+        return child
+
+
 class PyCommandArgumentsSubItem(PyCallableStateObject):
     """Class representing command argument in datamodel."""
 
@@ -1379,18 +1596,5 @@ class PySimpleMenuGeneric(PyMenu, PyDictionary):
 class PyNamedObjectContainerGeneric(PyNamedObjectContainer):
     """Generic PyNamedObjectContainer class for when generated API code is not available."""
 
-    def __iter__(self):
-        for name in self._get_child_object_display_names():
-            child_path = self.path[:-1]
-            child_path.append((self.path[-1][0], name))
-            yield PyMenuGeneric(self.service, self.rules, child_path)
-
-    def _get_item(self, key: str):
-        if key in self._get_child_object_display_names():
-            child_path = self.path[:-1]
-            child_path.append((self.path[-1][0], key))
-            return PyMenuGeneric(self.service, self.rules, child_path)
-        else:
-            raise LookupError(
-                f"{key} is not found at path " f"{convert_path_to_se_path(self.path)}"
-            )
+    def _get_child_object(self, child_path: Path):
+        return PyMenuGeneric(self.service, self.rules, child_path)
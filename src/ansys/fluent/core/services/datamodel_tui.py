@@ -265,6 +265,31 @@ def _get_static_info_at_level(menu: PyMenu) -> Dict[str, Any]:
     return info
 
 
+class LazyTUIMenu:
+    """Descriptor for a child menu of the generated menu classes.
+
+    The child menu object is created on first access and stored on the parent
+    menu object. Accessed through the parent menu class, the descriptor returns
+    the child menu class.
+    """
+
+    def __init__(self, menu_cls, tui_name: str):
+        """__init__ method of LazyTUIMenu class."""
+        self._menu_cls = menu_cls
+        self._tui_name = tui_name
+        self._name = None
+
+    def __set_name__(self, owner, name):
+        self._name = name
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self._menu_cls
+        menu = self._menu_cls(instance.path + [self._tui_name], instance.service)
+        instance.__dict__[self._name] = menu
+        return menu
+
+
 class TUIMenu:
     """Base class for the generated menu classes."""
 
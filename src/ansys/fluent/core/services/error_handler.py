@@ -5,13 +5,19 @@ import grpc
 
 
 def catch_grpc_error(f: Callable) -> Callable:
-    """Decorator to catch gRPC errors."""
+    """Decorator to catch gRPC errors.
+
+    An rpc which is not implemented by the server raises
+    ``NotImplementedError``, other rpc errors raise ``RuntimeError``.
+    """
 
     @functools.wraps(f)
     def func(*args, **kwargs) -> Callable:
         try:
             return f(*args, **kwargs)
         except grpc.RpcError as ex:
+            if ex.code() == grpc.StatusCode.UNIMPLEMENTED:
+                raise NotImplementedError(ex.details()) from None
             raise RuntimeError(ex.details()) from None
 
     return func
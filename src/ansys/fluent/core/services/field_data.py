@@ -1,7 +1,12 @@
 """Wrappers over FieldData gRPC service of Fluent."""
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from enum import IntEnum
 from functools import reduce
-from typing import Callable, Dict, List, Optional, Tuple, Union
+import threading
+import time
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Union
 
 import grpc
 import numpy as np
@@ -95,6 +100,9 @@ class FieldInfo:
 
     get_surfaces_info(self) -> dict
         Get surfaces information (surface name, ID, and type).
+
+    invalidate_metadata()
+        Discard the metadata snapshot used for name validation.
     """
 
     def __init__(
@@ -105,6 +113,22 @@ class FieldInfo:
         """__init__ method of FieldInfo class."""
         self._service = service
         self._is_data_valid = is_data_valid
+        # Snapshot of the latest fields and surfaces information. It is used to
+        # validate names without a round trip to Fluent for every check, and is
+        # refreshed whenever a name is not found in it.
+        self._metadata = {}
+
+    def _get_metadata(self, kind: str, refresh: bool = False) -> Dict[str, Dict]:
+        """Get the snapshot of ``scalar_fields``, ``vector_fields`` or
+        ``surfaces`` information, fetching it from Fluent if required."""
+        info = None if refresh else self._metadata.get(kind)
+        if info is None:
+            info = getattr(self, f"get_{kind}_info")()
+        return info
+
+    def invalidate_metadata(self, session_id=None, event_info=None) -> None:
+        """Discard the metadata snapshot used for name validation."""
+        self._metadata = {}
 
     def get_scalar_field_range(
         self, field: str, node_value: bool = False, surface_ids: List[int] = None
@@ -143,7 +167,7 @@ class FieldInfo:
         """
         request = FieldDataProtoModule.GetFieldsInfoRequest()
         response = self._service.get_scalar_fields_info(request)
-        return {
+        info = {
             field_info.solverName: {
                 "display_name": field_info.displayName,
                 "section": field_info.section,
@@ -151,6 +175,8 @@ class FieldInfo:
             }
             for field_info in response.fieldInfo
         }
+        self._metadata["scalar_fields"] = info
+        return info
 
     def get_vector_fields_info(self) -> Dict[str, Dict]:
         """Get vector fields information (vector components).
@@ -161,7 +187,7 @@ class FieldInfo:
         """
         request = FieldDataProtoModule.GetVectorFieldsInfoRequest()
         response = self._service.get_vector_fields_info(request)
-        return {
+        info = {
             vector_field_info.displayName: {
                 "x-component": vector_field_info.xComponent,
                 "y-component": vector_field_info.yComponent,
@@ -169,6 +195,8 @@ class FieldInfo:
             }
             for vector_field_info in response.vectorFieldInfo
         }
+        self._metadata["vector_fields"] = info
+        return info
 
     def get_surfaces_info(self) -> Dict[str, Dict]:
         """Get surfaces information (surface name, ID, and type).
@@ -188,21 +216,23 @@ class FieldInfo:
             }
             for surface_info in response.surfaceInfo
         }
+        self._metadata["surfaces"] = info
         return info
 
     def validate_scalar_fields(self, field_name: str):
-        _AllowedScalarFieldNames(
-            self._is_data_valid, info=self.get_scalar_fields_info()
-        ).valid_name(field_name)
+        _AllowedScalarFieldNames(self._is_data_valid, field_info=self).valid_name(
+            field_name
+        )
 
     def validate_vector_fields(self, field_name: str):
-        _AllowedVectorFieldNames(
-            self._is_data_valid, info=self.get_vector_fields_info()
-        ).valid_name(field_name)
+        _AllowedVectorFieldNames(self._is_data_valid, field_info=self).valid_name(
+            field_name
+        )
 
     def validate_surfaces(self, surfaces: List[str]):
+        allowed_surface_names = _AllowedSurfaceNames(field_info=self)
         for surface in surfaces:
-            _AllowedSurfaceNames(info=self.get_surfaces_info()).valid_name(surface)
+            allowed_surface_names.valid_name(surface)
 
 
 def unavailable_field_error_message(context: str, field_name: str) -> str:
@@ -283,6 +313,8 @@ class SurfaceDataType(IntEnum):
 
 
 class _AllowedNames:
+    _metadata_kind = None
+
     def __init__(
         self, field_info: Optional[FieldInfo] = None, info: Optional[Dict] = None
     ):
@@ -291,6 +323,13 @@ class _AllowedNames:
 
     def is_valid(self, name, respect_data_valid=True):
         """Checks validity."""
+        if (
+            not self._info
+            and self._metadata_kind
+            and name not in self(respect_data_valid=False)
+        ):
+            # The metadata snapshot may predate the name, refresh it once.
+            self._field_info._get_metadata(self._metadata_kind, refresh=True)
         return name in self(respect_data_valid)
 
 
@@ -319,8 +358,10 @@ class _AllowedFieldNames(_AllowedNames):
 
 
 class _AllowedSurfaceNames(_AllowedNames):
+    _metadata_kind = "surfaces"
+
     def __call__(self, respect_data_valid: bool = True) -> List[str]:
-        return self._info if self._info else self._field_info.get_surfaces_info()
+        return self._info if self._info else self._field_info._get_metadata("surfaces")
 
     def valid_name(self, surface_name: str) -> str:
         """Returns valid names."""
@@ -337,7 +378,7 @@ class _AllowedSurfaceIDs(_AllowedNames):
         try:
             return [
                 info["surface_id"][0]
-                for _, info in self._field_info.get_surfaces_info().items()
+                for _, info in self._field_info._get_metadata("surfaces").items()
             ]
         except (KeyError, IndexError):
             pass
@@ -346,10 +387,13 @@ class _AllowedSurfaceIDs(_AllowedNames):
 class _AllowedScalarFieldNames(_AllowedFieldNames):
     _field_name_error = ScalarFieldNameError
     _field_unavailable_error = ScalarFieldUnavailable
+    _metadata_kind = "scalar_fields"
 
     def __call__(self, respect_data_valid: bool = True) -> List[str]:
         field_dict = (
-            self._info if self._info else self._field_info.get_scalar_fields_info()
+            self._info
+            if self._info
+            else self._field_info._get_metadata("scalar_fields")
         )
         return (
             field_dict
@@ -365,20 +409,17 @@ class _AllowedScalarFieldNames(_AllowedFieldNames):
 class _AllowedVectorFieldNames(_AllowedFieldNames):
     _field_name_error = VectorFieldNameError
     _field_unavailable_error = VectorFieldUnavailable
+    _metadata_kind = "vector_fields"
 
     def __call__(self, respect_data_valid: bool = True) -> List[str]:
         return (
             self._info
             if self._info
-            else self._field_info.get_vector_fields_info()
+            else self._field_info._get_metadata("vector_fields")
             if (not respect_data_valid or self._is_data_valid())
             else []
         )
 
-    def is_valid(self, name, respect_data_valid=True):
-        """Checks validity."""
-        return name in self(respect_data_valid)
-
 
 class _FieldMethod:
     class _Arg:
@@ -399,7 +440,14 @@ class _FieldMethod:
 
 
 class FieldTransaction:
-    """Populates Fluent field data on surfaces."""
+    """Populates Fluent field data on surfaces.
+
+    Attributes
+    ----------
+    max_concurrent_streams : int
+        Maximum number of concurrent streams over which ``get_fields`` shards the
+        requested surfaces. The default is ``1``.
+    """
 
     def __init__(
         self,
@@ -409,11 +457,13 @@ class FieldTransaction:
         allowed_surface_names,
         allowed_scalar_field_names,
         allowed_vector_field_names,
+        max_concurrent_streams: int = 1,
     ):
         """__init__ method of FieldTransaction class."""
         self._service = service
         self._field_info = field_info
         self._fields_request = get_fields_request()
+        self.max_concurrent_streams = max_concurrent_streams
 
         self._allowed_surface_names = allowed_surface_names
         self._allowed_scalar_field_names = allowed_scalar_field_names
@@ -548,13 +598,12 @@ class FieldTransaction:
             surface_ids=surface_ids,
             surface_names=surface_names,
         )
+        field_name = self._allowed_scalar_field_names.valid_name(field_name)
         self._fields_request.scalarFieldRequest.extend(
             [
                 FieldDataProtoModule.ScalarFieldRequest(
                     surfaceId=surface_id,
-                    scalarFieldName=self._allowed_scalar_field_names.valid_name(
-                        field_name
-                    ),
+                    scalarFieldName=field_name,
                     dataLocation=FieldDataProtoModule.DataLocation.Nodes
                     if node_value
                     else FieldDataProtoModule.DataLocation.Elements,
@@ -591,13 +640,12 @@ class FieldTransaction:
             surface_ids=surface_ids,
             surface_names=surface_names,
         )
+        field_name = self._allowed_vector_field_names.valid_name(field_name)
         self._fields_request.vectorFieldRequest.extend(
             [
                 FieldDataProtoModule.VectorFieldRequest(
                     surfaceId=surface_id,
-                    vectorFieldName=self._allowed_vector_field_names.valid_name(
-                        field_name,
-                    ),
+                    vectorFieldName=field_name,
                 )
                 for surface_id in surface_ids
             ]
@@ -699,8 +747,37 @@ class FieldTransaction:
 
             The tag is a tuple for Fluent 2023 R1 or later.
         """
-        return ChunkParser().extract_fields(
-            self._service.get_fields(self._fields_request)
+        return _extract_fields(
+            self._service, self._fields_request, self.max_concurrent_streams
+        )
+
+    def iter_fields(
+        self, reuse_buffers: Optional[bool] = False
+    ) -> Iterator[Tuple[Union[int, Tuple], int, str, np.array]]:
+        """Get data for previously added requests, yielding each field as soon
+        as it is received from Fluent.
+
+        Unlike ``get_fields``, the data of the whole transaction is never held in
+        memory at once, which suits pipelines that write each field straight to
+        disk or to a renderer.
+
+        Parameters
+        ----------
+        reuse_buffers : bool, optional
+            Whether to read every field into the same buffer. The yielded array
+            is then only valid until the next field is requested, and memory use
+            is bounded by the largest field. The default is ``False``.
+
+        Yields
+        ------
+        Tuple[Union[int, Tuple], int, str, np.array]
+            Tag, surface ID, field name, and field data. The tag has the same
+            structure as the keys of the dictionary returned by ``get_fields``.
+            A field sent by Fluent in several consecutive parts is yielded
+            once, assembled.
+        """
+        return ChunkParser().iter_fields(
+            self._service.get_fields(self._fields_request), reuse_buffers=reuse_buffers
         )
 
     def __call__(self):
@@ -733,6 +810,15 @@ class _FieldDataConstants:
     }
 
 
+def _get_surfaces_info(field_info: FieldInfo, surface_names: List[str]) -> Dict:
+    """Get the surfaces information snapshot, refreshing it if it does not contain
+    all given surface names."""
+    surfaces_info = field_info._get_metadata("surfaces")
+    if any(surface_name not in surfaces_info for surface_name in surface_names):
+        surfaces_info = field_info._get_metadata("surfaces", refresh=True)
+    return surfaces_info
+
+
 def _get_surface_ids(
     field_info: FieldInfo,
     allowed_surface_names,
@@ -761,13 +847,15 @@ def _get_surface_ids(
         surface_ids = []
         if surface_names:
             for surface_name in surface_names:
-                surface_ids.extend(
-                    field_info.get_surfaces_info()[surface_name]["surface_id"]
-                )
-        elif surface_name:
-            surface_ids = field_info.get_surfaces_info()[
                 allowed_surface_names.valid_name(surface_name)
-            ]["surface_id"]
+            surfaces_info = _get_surfaces_info(field_info, surface_names)
+            for surface_name in surface_names:
+                surface_ids.extend(surfaces_info[surface_name]["surface_id"])
+        elif surface_name:
+            allowed_surface_names.valid_name(surface_name)
+            surface_ids = _get_surfaces_info(field_info, [surface_name])[surface_name][
+                "surface_id"
+            ]
         else:
             raise RuntimeError("Please provide either surface names or surface ids.")
     return surface_ids
@@ -781,6 +869,192 @@ def get_fields_request():
     )
 
 
+def _shard_fields_request(
+    fields_request: FieldDataProtoModule.GetFieldsRequest, shards: int
+) -> List[FieldDataProtoModule.GetFieldsRequest]:
+    """Split a field request into at most ``shards`` requests.
+
+    All requests for one surface go to the same shard, so that each surface is
+    assembled by a single parser.
+    """
+    request_fields = (
+        "surfaceRequest",
+        "scalarFieldRequest",
+        "vectorFieldRequest",
+        "pathlinesFieldRequest",
+    )
+    surface_ids = list(
+        dict.fromkeys(
+            request.surfaceId
+            for request_field in request_fields
+            for request in getattr(fields_request, request_field)
+        )
+    )
+    shards = min(shards, len(surface_ids))
+    if shards <= 1:
+        return [fields_request]
+    shard_index = {
+        surface_id: i * shards // len(surface_ids)
+        for i, surface_id in enumerate(surface_ids)
+    }
+    shard_requests = [
+        FieldDataProtoModule.GetFieldsRequest(
+            provideBytesStream=fields_request.provideBytesStream,
+            chunkSize=fields_request.chunkSize,
+        )
+        for _ in range(shards)
+    ]
+    for request_field in request_fields:
+        for request in getattr(fields_request, request_field):
+            getattr(
+                shard_requests[shard_index[request.surfaceId]], request_field
+            ).add().CopyFrom(request)
+    return shard_requests
+
+
+def _extract_fields(
+    service: FieldDataService,
+    fields_request: FieldDataProtoModule.GetFieldsRequest,
+    max_concurrent_streams: int = 1,
+) -> Dict[Union[int, Tuple], Dict[int, Dict[str, np.array]]]:
+    """Get the data for a field request, sharding the surfaces over up to
+    ``max_concurrent_streams`` concurrent ``GetFields`` streams."""
+    shard_requests = _shard_fields_request(fields_request, max_concurrent_streams)
+    if len(shard_requests) == 1:
+        return ChunkParser().extract_fields(service.get_fields(fields_request))
+
+    def _extract_shard(shard_request):
+        return ChunkParser().extract_fields(service.get_fields(shard_request))
+
+    with ThreadPoolExecutor(max_workers=len(shard_requests)) as executor:
+        shard_fields = list(executor.map(_extract_shard, shard_requests))
+    fields_data = {}
+    for fields in shard_fields:
+        for payload_tag_id, payload_data in fields.items():
+            fields_data.setdefault(payload_tag_id, {}).update(payload_data)
+    return fields_data
+
+
+class _FieldBuffer:
+    """Growable buffer into which the payload groups of one field are written.
+
+    The buffer is allocated with the ``fieldSize`` of the first payload group.
+    Further payload groups for the same field grow it geometrically, so a field
+    arriving in many groups is assembled with an amortized constant number of
+    copies per element.
+    """
+
+    def __init__(self, field_datatype, field_size: int):
+        """__init__ method of _FieldBuffer class."""
+        self._buffer = np.empty(field_size, dtype=field_datatype)
+        self._size = 0
+        self.copies = 0
+
+    def reserve(self, field_size: int):
+        """Make room for a payload group of ``field_size`` elements."""
+        required_size = self._size + field_size
+        if required_size > len(self._buffer):
+            buffer = np.empty(
+                max(required_size, 2 * len(self._buffer)), dtype=self._buffer.dtype
+            )
+            buffer[: self._size] = self._buffer[: self._size]
+            self._buffer = buffer
+            self.copies += 1
+
+    def extend(self, chunk_iterator, field_size: int) -> int:
+        """Write the next ``field_size`` elements from the chunk stream.
+
+        Returns the number of payload bytes consumed.
+        """
+        self.reserve(field_size)
+        field_datatype = self._buffer.dtype
+        end = self._size + field_size
+        index = self._size
+        nbytes = 0
+        for chunk in chunk_iterator:
+            if chunk.bytePayload:
+                nbytes += len(chunk.bytePayload)
+                count = min(
+                    len(chunk.bytePayload) // field_datatype.itemsize, end - index
+                )
+                self._buffer[index : index + count] = np.frombuffer(
+                    chunk.bytePayload, field_datatype, count=count
+                )
+            else:
+                payload = (
+                    chunk.floatPayload.payload
+                    or chunk.intPayload.payload
+                    or chunk.doublePayload.payload
+                    or chunk.longPayload.payload
+                )
+                count = min(len(payload), end - index)
+                nbytes += count * field_datatype.itemsize
+                self._buffer[index : index + count] = np.fromiter(
+                    payload, dtype=field_datatype, count=count
+                )
+            index += count
+            if index == end:
+                break
+        self._size = index
+        self.copies += 1
+        return nbytes
+
+    def clear(self):
+        """Discard the assembled data, keeping the allocated buffer."""
+        self._size = 0
+
+    @property
+    def array(self) -> np.ndarray:
+        """Returns the assembled field."""
+        return self._buffer[: self._size]
+
+
+class ChunkParserStatistics:
+    """Transfer statistics of the last field extraction done by a
+    ``ChunkParser``.
+
+    Attributes
+    ----------
+    bytes_received : int
+        Number of payload bytes received.
+    elapsed_time : float
+        Time spent extracting the fields, in seconds.
+    fields : int
+        Number of distinct fields assembled.
+    payload_groups : int
+        Number of payload groups received.
+    copies : int
+        Number of array copies done while assembling the fields.
+    """
+
+    def __init__(self):
+        """__init__ method of ChunkParserStatistics class."""
+        self.bytes_received = 0
+        self.elapsed_time = 0.0
+        self.fields = 0
+        self.payload_groups = 0
+        self.copies = 0
+
+    @property
+    def bytes_per_second(self) -> float:
+        """Returns the extraction throughput in bytes per second."""
+        return self.bytes_received / self.elapsed_time if self.elapsed_time else 0.0
+
+    @property
+    def copies_per_field(self) -> float:
+        """Returns the average number of array copies per field."""
+        return self.copies / self.fields if self.fields else 0.0
+
+    def __repr__(self):
+        return (
+            f"ChunkParserStatistics(bytes_received={self.bytes_received}, "
+            f"elapsed_time={self.elapsed_time:.6f}, "
+            f"bytes_per_second={self.bytes_per_second:.1f}, fields={self.fields}, "
+            f"payload_groups={self.payload_groups}, "
+            f"copies_per_field={self.copies_per_field:.2f})"
+        )
+
+
 class ChunkParser:
     """Class for parsing field data stream received from Fluent.
 
@@ -793,15 +1067,23 @@ class ChunkParser:
         field_name : str
         field : numpy array
 
+    Attributes
+    ----------
+    statistics : ChunkParserStatistics
+        Transfer statistics of the last call to ``extract_fields`` or
+        ``iter_fields``.
     """
 
     def __init__(self, callbacks_provider: object = None):
         """__init__ method of ChunkParser class."""
         self._callbacks_provider = callbacks_provider
+        self.statistics = ChunkParserStatistics()
 
-    def extract_fields(self, chunk_iterator) -> Dict[int, Dict[str, np.array]]:
-        """Extracts field data received from Fluent. if callbacks_provider is set
-        then callbacks are triggered with extracted data.
+    def _iter_payload_groups(self, chunk_iterator, resolve_payload_tags: bool):
+        """Yields the payload tag and payload info of every payload group.
+
+        The chunk iterator is left positioned at the first data chunk of the
+        yielded payload group.
         """
 
         def _get_tag_for_surface_request():
@@ -823,41 +1105,8 @@ class ChunkParser:
                 ("field", pathlines_field_request.field),
             )
 
-        def _extract_field(field_datatype, field_size, chunk_iterator):
-            field_arr = np.empty(field_size, dtype=field_datatype)
-            field_datatype_item_size = np.dtype(field_datatype).itemsize
-            index = 0
-            for chunk in chunk_iterator:
-                if chunk.bytePayload:
-                    count = min(
-                        len(chunk.bytePayload) // field_datatype_item_size,
-                        field_size - index,
-                    )
-                    field_arr[index : index + count] = np.frombuffer(
-                        chunk.bytePayload, field_datatype, count=count
-                    )
-                    index += count
-                    if index == field_size:
-                        return field_arr
-                else:
-                    payload = (
-                        chunk.floatPayload.payload
-                        or chunk.intPayload.payload
-                        or chunk.doublePayload.payload
-                        or chunk.longPayload.payload
-                    )
-                    count = len(payload)
-                    field_arr[index : index + count] = np.fromiter(
-                        payload, dtype=field_datatype
-                    )
-                    index += count
-                    if index == field_size:
-                        return field_arr
-
-        fields_data = {}
         for chunk in chunk_iterator:
             payload_info = chunk.payloadInfo
-            surface_id = payload_info.surfaceId
             field_request_info = payload_info.fieldRequestInfo
             request_type = field_request_info.WhichOneof("request")
             if request_type is not None:
@@ -877,7 +1126,7 @@ class ChunkParser:
                     else None
                 )
             else:
-                if self._callbacks_provider is None:
+                if resolve_payload_tags:
                     payload_tag_id = reduce(
                         lambda x, y: x | y,
                         [
@@ -888,53 +1137,174 @@ class ChunkParser:
                     )
                 else:
                     payload_tag_id = None
-            field = None
-            if payload_tag_id is not None:
-                field = _extract_field(
+            self.statistics.payload_groups += 1
+            yield payload_tag_id, payload_info
+
+    def _iter_fields(
+        self, chunk_iterator, resolve_payload_tags: bool, reuse_buffers: bool
+    ):
+        """Yields each field once it is assembled, which is when the payload
+        group of another field starts or the stream ends."""
+        statistics = self.statistics = ChunkParserStatistics()
+        start_time = time.perf_counter()
+        field_buffers = {}
+        key = field_buffer = None
+        try:
+            for payload_tag_id, payload_info in self._iter_payload_groups(
+                chunk_iterator, resolve_payload_tags
+            ):
+                next_key = (
+                    payload_tag_id,
+                    payload_info.surfaceId,
+                    payload_info.fieldName,
+                )
+                if next_key != key or field_buffer is None:
+                    if key is not None:
+                        yield (
+                            *key,
+                            None if field_buffer is None else field_buffer.array,
+                        )
+                    key, field_buffer = next_key, None
+                if payload_tag_id is None:
+                    continue
+                if field_buffer is None:
+                    field_datatype = (
+                        _FieldDataConstants.proto_field_type_to_np_data_type[
+                            payload_info.fieldType
+                        ]
+                    )
+                    if reuse_buffers:
+                        field_buffer = field_buffers.get(field_datatype)
+                        if field_buffer is None:
+                            field_buffer = field_buffers[field_datatype] = _FieldBuffer(
+                                field_datatype, payload_info.fieldSize
+                            )
+                        field_buffer.clear()
+                    else:
+                        field_buffer = _FieldBuffer(
+                            field_datatype, payload_info.fieldSize
+                        )
+                    statistics.fields += 1
+                copies = field_buffer.copies
+                statistics.bytes_received += field_buffer.extend(
+                    chunk_iterator, payload_info.fieldSize
+                )
+                statistics.copies += field_buffer.copies - copies
+            if key is not None:
+                yield (*key, None if field_buffer is None else field_buffer.array)
+        finally:
+            statistics.elapsed_time = time.perf_counter() - start_time
+
+    def iter_fields(
+        self, chunk_iterator, reuse_buffers: bool = False
+    ) -> Iterator[Tuple[Union[int, Tuple], int, str, np.ndarray]]:
+        """Iterates over field data received from Fluent, yielding each field
+        as soon as it is read from the stream.
+
+        Parameters
+        ----------
+        chunk_iterator :
+            Chunk stream returned by the ``GetFields`` RPC.
+        reuse_buffers : bool, optional
+            Whether to read every field into the same buffer. The yielded array
+            is then only valid until the next field is requested from the
+            iterator, and memory use is bounded by the largest field. The
+            default is ``False``.
+
+        Yields
+        ------
+        Tuple[Union[int, Tuple], int, str, np.array]
+            Tag, surface ID, field name, and field data. A field sent by Fluent
+            in several consecutive payload groups is yielded once, assembled.
+        """
+        return self._iter_fields(
+            chunk_iterator, resolve_payload_tags=True, reuse_buffers=reuse_buffers
+        )
+
+    def extract_fields(self, chunk_iterator) -> Dict[int, Dict[str, np.array]]:
+        """Extracts field data received from Fluent. if callbacks_provider is set
+        then callbacks are triggered with extracted data.
+        """
+        if self._callbacks_provider is not None:
+            for _, surface_id, field_name, field in self._iter_fields(
+                chunk_iterator, resolve_payload_tags=False, reuse_buffers=False
+            ):
+                for callback_data in self._callbacks_provider.callbacks():
+                    callback, args, kwargs = callback_data
+                    callback(surface_id, field_name, field, *args, **kwargs)
+            return {}
+
+        statistics = self.statistics = ChunkParserStatistics()
+        start_time = time.perf_counter()
+        field_buffers = {}
+        for payload_tag_id, payload_info in self._iter_payload_groups(
+            chunk_iterator, resolve_payload_tags=True
+        ):
+            key = (payload_tag_id, payload_info.surfaceId, payload_info.fieldName)
+            if payload_tag_id is None:
+                field_buffers.setdefault(key, None)
+                continue
+            field_buffer = field_buffers.get(key)
+            if field_buffer is None:
+                field_buffer = field_buffers[key] = _FieldBuffer(
                     _FieldDataConstants.proto_field_type_to_np_data_type[
                         payload_info.fieldType
                     ],
                     payload_info.fieldSize,
-                    chunk_iterator,
                 )
+            statistics.bytes_received += field_buffer.extend(
+                chunk_iterator, payload_info.fieldSize
+            )
 
-            if self._callbacks_provider is not None:
-                for callback_data in self._callbacks_provider.callbacks():
-                    callback, args, kwargs = callback_data
-                    # print('cb', surface_id, payload_info.fieldName)
-                    callback(surface_id, payload_info.fieldName, field, *args, **kwargs)
-            else:
-                payload_data = fields_data.get(payload_tag_id)
-                if not payload_data:
-                    payload_data = fields_data[payload_tag_id] = {}
-                surface_data = payload_data.get(surface_id)
-                if surface_data:
-                    if payload_info.fieldName in surface_data:
-                        surface_data.update(
-                            {
-                                payload_info.fieldName: np.concatenate(
-                                    (surface_data[payload_info.fieldName], field)
-                                )
-                            }
-                        )
-                    else:
-                        surface_data.update({payload_info.fieldName: field})
-                else:
-                    payload_data[surface_id] = {payload_info.fieldName: field}
+        fields_data = {}
+        for (
+            payload_tag_id,
+            surface_id,
+            field_name,
+        ), field_buffer in field_buffers.items():
+            surface_data = fields_data.setdefault(payload_tag_id, {}).setdefault(
+                surface_id, {}
+            )
+            if field_buffer is None:
+                surface_data[field_name] = None
+                continue
+            statistics.copies += field_buffer.copies
+            statistics.fields += 1
+            surface_data[field_name] = field_buffer.array
+        statistics.elapsed_time = time.perf_counter() - start_time
         return fields_data
 
 
-class BaseFieldData:
-    """Contains common properties required by all field data types."""
+class BaseFieldData(ABC):
+    """Contains common properties required by all field data types.
+
+    The data received from Fluent is kept as a NumPy array. Per-element Python
+    objects are only created when they are accessed through ``data`` or by
+    indexing, so the array-native accessors never allocate one object per
+    node or face.
+    """
 
     def __init__(self, i_d, data):
         """__init__ method of BaseFieldData class."""
-        self._data = data
+        self._array = data
+        self._data = None
         self._id = i_d
 
+    @abstractmethod
+    def _get_element(self, index):
+        """Create the Python object of the element at ``index``."""
+        pass
+
+    @property
+    def array(self) -> np.ndarray:
+        """Returns the underlying NumPy array without copying."""
+        return self._array
+
     @property
     def data(self):
         """Returns data."""
+        if self._data is None:
+            self._data = [self._get_element(i) for i in range(self.size)]
         return self._data
 
     @property
@@ -945,10 +1315,19 @@ class BaseFieldData:
     @property
     def size(self):
         """Returns size of data."""
-        return len(self._data)
+        return len(self._array)
+
+    def __len__(self):
+        return self.size
 
     def __getitem__(self, item):
-        return self._data[item]
+        if isinstance(item, (int, np.integer)):
+            if item < 0:
+                item += self.size
+            if not 0 <= item < self.size:
+                raise IndexError(f"index {item} is out of range.")
+            return self._get_element(item)
+        return self.data[item]
 
 
 class ScalarFieldData(BaseFieldData):
@@ -961,9 +1340,8 @@ class ScalarFieldData(BaseFieldData):
             """__init__ method of ScalarData class."""
             self.scalar_data = data
 
-    def __init__(self, i_d, data):
-        """__init__ method of ScalarFieldData class."""
-        super().__init__(i_d, [ScalarFieldData.ScalarData(_data) for _data in data])
+    def _get_element(self, index):
+        return ScalarFieldData.ScalarData(self._array[index])
 
 
 class Vector:
@@ -1000,7 +1378,22 @@ def _resolve_into_array_of_vectors(data):
     data.shape = data.size // 3, 3
 
 
-class VectorFieldData(BaseFieldData):
+class _VectorsFieldData(BaseFieldData):
+    """Base container for data resolved as an ``(N, 3)`` array of vectors."""
+
+    _vector_type = Vector
+
+    def __init__(self, i_d, data):
+        """__init__ method of _VectorsFieldData class."""
+        _resolve_into_array_of_vectors(data)
+        super().__init__(i_d, data)
+
+    def _get_element(self, index):
+        x, y, z = self._array[index]
+        return self._vector_type(x, y, z)
+
+
+class VectorFieldData(_VectorsFieldData):
     """Provides a container for vector field data."""
 
     class VectorData(Vector):
@@ -1010,11 +1403,12 @@ class VectorFieldData(BaseFieldData):
             """__init__ method of VectorData class."""
             super().__init__(x, y, z)
 
+    _vector_type = VectorData
+
     def __init__(self, i_d, data, scale):
         """__init__ method of VectorFieldData class."""
-        _resolve_into_array_of_vectors(data)
         self._scale = scale
-        super().__init__(i_d, [VectorFieldData.VectorData(x, y, z) for x, y, z in data])
+        super().__init__(i_d, data)
 
     @property
     def scale(self) -> float:
@@ -1022,7 +1416,7 @@ class VectorFieldData(BaseFieldData):
         return self._scale
 
 
-class Vertices(BaseFieldData):
+class Vertices(_VectorsFieldData):
     """Provides a container for the vertex data."""
 
     class Vertex(Vector):
@@ -1032,13 +1426,10 @@ class Vertices(BaseFieldData):
             """__init__ method of Vertex class."""
             super().__init__(x, y, z)
 
-    def __init__(self, i_d, data):
-        """__init__ method of Vertices class."""
-        _resolve_into_array_of_vectors(data)
-        super().__init__(i_d, [(Vertices.Vertex(x, y, z)) for x, y, z in data])
+    _vector_type = Vertex
 
 
-class FacesCentroid(BaseFieldData):
+class FacesCentroid(_VectorsFieldData):
     """Provides the container for the face centroid data."""
 
     class Centroid(Vector):
@@ -1048,14 +1439,46 @@ class FacesCentroid(BaseFieldData):
             """__init__ method of Centroid class."""
             super().__init__(x, y, z)
 
-    def __init__(self, i_d, data):
-        """__init__ method of FacesCentroid class."""
-        _resolve_into_array_of_vectors(data)
-        super().__init__(i_d, [(FacesCentroid.Centroid(x, y, z)) for x, y, z in data])
+    _vector_type = Centroid
+
+
+def _resolve_into_offsets_and_indices(data) -> Tuple[np.ndarray, np.ndarray]:
+    """Split a Fluent connectivity stream into CSR-style offsets and indices.
+
+    The stream holds, for every face, the node count followed by that many node
+    indices. Streams where all faces have the same node count are resolved
+    without a Python-level loop.
+    """
+    size = len(data)
+    if not size:
+        return np.zeros(1, dtype=np.int64), data[:0]
+    stride = int(data[0]) + 1
+    if stride > 1 and size % stride == 0:
+        faces = data.reshape(-1, stride)
+        if (faces[:, 0] == stride - 1).all():
+            offsets = np.arange(0, faces.size // stride * (stride - 1) + 1, stride - 1)
+            return offsets, faces[:, 1:].ravel()
+    data_list = data.tolist()
+    count_positions = []
+    i = 0
+    while i < size:
+        count_positions.append(i)
+        i += 1 + data_list[i]
+    count_positions = np.array(count_positions, dtype=np.int64)
+    offsets = np.zeros(len(count_positions) + 1, dtype=np.int64)
+    np.cumsum(data[count_positions], out=offsets[1:])
+    mask = np.ones(size, dtype=bool)
+    mask[count_positions] = False
+    return offsets, data[mask]
 
 
 class FacesConnectivity(BaseFieldData):
-    """Provides the container for the face connectivity data."""
+    """Provides the container for the face connectivity data.
+
+    The connectivity is available in CSR form through ``offsets`` and
+    ``indices``; the node indices of face ``i`` are
+    ``indices[offsets[i]:offsets[i + 1]]``.
+    """
 
     class Faces:
         """Stores and provides the face connectivity data as an array."""
@@ -1067,18 +1490,44 @@ class FacesConnectivity(BaseFieldData):
 
     def __init__(self, i_d, data):
         """__init__ method of FacesConnectivity class."""
-        faces_data = []
-        i = 0
+        super().__init__(i_d, data)
+        self._offsets = None
+        self._indices = None
+
+    def _resolve(self):
+        if self._offsets is None:
+            self._offsets, self._indices = _resolve_into_offsets_and_indices(
+                self._array
+            )
 
-        while i < len(data):
-            end = i + 1 + data[i]
-            faces_data.append(FacesConnectivity.Faces(data[i], data[i + 1 : end]))
-            i = end
+    @property
+    def offsets(self) -> np.ndarray:
+        """Returns the offsets of each face into ``indices``."""
+        self._resolve()
+        return self._offsets
 
-        super().__init__(i_d, faces_data)
+    @property
+    def indices(self) -> np.ndarray:
+        """Returns the node indices of all faces."""
+        self._resolve()
+        return self._indices
+
+    @property
+    def node_counts(self) -> np.ndarray:
+        """Returns the node count of each face."""
+        return np.diff(self.offsets)
+
+    @property
+    def size(self):
+        """Returns size of data."""
+        return len(self.offsets) - 1
 
+    def _get_element(self, index):
+        start, end = self.offsets[index], self.offsets[index + 1]
+        return FacesConnectivity.Faces(end - start, self.indices[start:end])
 
-class FacesNormal(BaseFieldData):
+
+class FacesNormal(_VectorsFieldData):
     """Provides the container for the face normal data."""
 
     class Normal(Vector):
@@ -1088,14 +1537,128 @@ class FacesNormal(BaseFieldData):
             """__init__ method of Normal class."""
             super().__init__(x, y, z)
 
-    def __init__(self, i_d, data):
-        """__init__ method of FacesNormal class."""
-        _resolve_into_array_of_vectors(data)
-        super().__init__(i_d, [FacesNormal.Normal(x, y, z) for x, y, z in data])
+    _vector_type = Normal
+
+
+class FieldDataCache:
+    """Least-recently-used cache of field data arrays with a byte budget.
+
+    The cache is disabled until ``max_bytes`` is set to a positive value. Entries
+    are keyed on the request type, surface ID, field name, and the request
+    options (data location, boundary values, or overset mesh).
+
+    Field values are invalidated by ``invalidate_fields``, which the session
+    calls when Fluent reports that an iteration or time step has ended or that
+    the solution was initialized or read. Surface geometry is only invalidated
+    by ``invalidate``, called when a case is read. Cached arrays are read-only.
+
+    Parameters
+    ----------
+    max_bytes : int, optional
+        Maximum total size of the cached arrays in bytes. The default is ``0``,
+        which disables the cache.
+
+    Attributes
+    ----------
+    hits : int
+        Number of lookups served from the cache.
+    misses : int
+        Number of lookups not served from the cache.
+    """
+
+    _geometry_tag = "surface-data"
+
+    def __init__(self, max_bytes: int = 0):
+        """__init__ method of FieldDataCache class."""
+        self._lock = threading.RLock()
+        self._entries = OrderedDict()
+        self._nbytes = 0
+        self._max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def max_bytes(self) -> int:
+        """Maximum total size of the cached arrays in bytes."""
+        return self._max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, max_bytes: int):
+        with self._lock:
+            self._max_bytes = max_bytes
+            self._evict()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the cache stores any data."""
+        return self._max_bytes > 0
+
+    @property
+    def nbytes(self) -> int:
+        """Total size of the cached arrays in bytes."""
+        return self._nbytes
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key: Tuple) -> Optional[np.ndarray]:
+        """Get a cached array, or ``None`` if it is not cached."""
+        if not self.enabled:
+            return None
+        with self._lock:
+            array = self._entries.get(key)
+            if array is None:
+                self.misses += 1
+            else:
+                self._entries.move_to_end(key)
+                self.hits += 1
+            return array
+
+    def put(self, key: Tuple, array: np.ndarray) -> None:
+        """Cache a read-only copy of an array, evicting the least recently used
+        arrays if the byte budget is exceeded."""
+        if not self.enabled or array is None or array.nbytes > self._max_bytes:
+            return
+        array = array.copy()
+        array.flags.writeable = False
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._nbytes -= previous.nbytes
+            self._entries[key] = array
+            self._nbytes += array.nbytes
+            self._evict()
+
+    def _evict(self):
+        while self._nbytes > self._max_bytes and self._entries:
+            _, array = self._entries.popitem(last=False)
+            self._nbytes -= array.nbytes
+
+    def invalidate_fields(self, session_id=None, event_info=None) -> None:
+        """Discard the cached field values, keeping the surface geometry."""
+        with self._lock:
+            for key in [key for key in self._entries if key[0] != self._geometry_tag]:
+                self._nbytes -= self._entries.pop(key).nbytes
+
+    def invalidate(self, session_id=None, event_info=None) -> None:
+        """Discard all cached data."""
+        with self._lock:
+            self._entries.clear()
+            self._nbytes = 0
 
 
 class FieldData:
-    """Provides access to Fluent field data on surfaces."""
+    """Provides access to Fluent field data on surfaces.
+
+    Attributes
+    ----------
+    cache : FieldDataCache
+        Client-side cache of the received data, disabled by default.
+    max_concurrent_streams : int
+        Maximum number of concurrent streams over which the requested surfaces
+        are sharded. New transactions start with this value. The default is
+        ``1``.
+    """
 
     def __init__(
         self,
@@ -1109,6 +1672,8 @@ class FieldData:
         self._field_info = field_info
         self.is_data_valid = is_data_valid
         self.scheme_eval = scheme_eval
+        self.cache = FieldDataCache()
+        self.max_concurrent_streams = 1
 
         self._allowed_surface_names = _AllowedSurfaceNames(field_info)
 
@@ -1162,6 +1727,46 @@ class FieldData:
             self.get_pathlines_field_data,
         )
 
+    def _get_fields(
+        self,
+        surface_ids: List[int],
+        field_names: List[str],
+        cache_key: Callable[[int, str], Tuple],
+        add_requests: Callable[
+            [FieldDataProtoModule.GetFieldsRequest, List[int]], None
+        ],
+    ) -> Dict[int, Dict[str, np.array]]:
+        """Get the given fields on the given surfaces, requesting only the
+        surfaces which are not held in the cache."""
+        surfaces_data = {}
+        surface_ids_to_request = []
+        for surface_id in surface_ids:
+            if self.cache.enabled:
+                cached_data = {
+                    field_name: self.cache.get(cache_key(surface_id, field_name))
+                    for field_name in field_names
+                }
+                if all(field is not None for field in cached_data.values()):
+                    surfaces_data[surface_id] = cached_data
+                    continue
+            surface_ids_to_request.append(surface_id)
+        if surface_ids_to_request:
+            fields_request = get_fields_request()
+            add_requests(fields_request, surface_ids_to_request)
+            fields = _extract_fields(
+                self._service, fields_request, self.max_concurrent_streams
+            )
+            fields_data = next(iter(fields.values()))
+            for surface_id in surface_ids_to_request:
+                surfaces_data[surface_id] = fields_data[surface_id]
+                if self.cache.enabled:
+                    for field_name in field_names:
+                        self.cache.put(
+                            cache_key(surface_id, field_name),
+                            fields_data[surface_id].get(field_name),
+                        )
+        return surfaces_data
+
     def new_transaction(self):
         """Create a new field transaction."""
         return FieldTransaction(
@@ -1171,6 +1776,7 @@ class FieldData:
             self._allowed_surface_names,
             self._allowed_scalar_field_names,
             self._allowed_vector_field_names,
+            self.max_concurrent_streams,
         )
 
     def get_scalar_field_data(
@@ -1211,25 +1817,35 @@ class FieldData:
             surface_ids=surface_ids,
             surface_name=surface_name,
         )
-        fields_request = get_fields_request()
-        fields_request.scalarFieldRequest.extend(
-            [
-                FieldDataProtoModule.ScalarFieldRequest(
-                    surfaceId=surface_id,
-                    scalarFieldName=self._allowed_scalar_field_names.valid_name(
-                        field_name
-                    ),
-                    dataLocation=FieldDataProtoModule.DataLocation.Nodes
-                    if node_value
-                    else FieldDataProtoModule.DataLocation.Elements,
-                    provideBoundaryValues=boundary_value,
-                )
-                for surface_id in surface_ids
-            ]
-        )
+        field_name = self._allowed_scalar_field_names.valid_name(field_name)
+
+        def _add_requests(fields_request, surface_ids):
+            fields_request.scalarFieldRequest.extend(
+                [
+                    FieldDataProtoModule.ScalarFieldRequest(
+                        surfaceId=surface_id,
+                        scalarFieldName=field_name,
+                        dataLocation=FieldDataProtoModule.DataLocation.Nodes
+                        if node_value
+                        else FieldDataProtoModule.DataLocation.Elements,
+                        provideBoundaryValues=boundary_value,
+                    )
+                    for surface_id in surface_ids
+                ]
+            )
 
-        fields = ChunkParser().extract_fields(self._service.get_fields(fields_request))
-        scalar_field_data = next(iter(fields.values()))
+        scalar_field_data = self._get_fields(
+            surface_ids,
+            [field_name],
+            lambda surface_id, name: (
+                "scalar-field",
+                surface_id,
+                name,
+                node_value,
+                boundary_value,
+            ),
+            _add_requests,
+        )
 
         if surface_name:
             return ScalarFieldData(
@@ -1281,28 +1897,39 @@ class FieldData:
             surface_ids=surface_ids,
             surface_name=surface_name,
         )
-        fields_request = get_fields_request()
-        fields_request.surfaceRequest.extend(
-            [
-                FieldDataProtoModule.SurfaceRequest(
-                    surfaceId=surface_id,
-                    oversetMesh=overset_mesh,
-                    provideFaces=data_type == SurfaceDataType.FacesConnectivity,
-                    provideVertices=data_type == SurfaceDataType.Vertices,
-                    provideFacesCentroid=data_type == SurfaceDataType.FacesCentroid,
-                    provideFacesNormal=data_type == SurfaceDataType.FacesNormal,
-                )
-                for surface_id in surface_ids
-            ]
-        )
         enum_to_field_name = {
             SurfaceDataType.FacesConnectivity: "faces",
             SurfaceDataType.Vertices: "vertices",
             SurfaceDataType.FacesCentroid: "centroid",
             SurfaceDataType.FacesNormal: "face-normal",
         }
-        fields = ChunkParser().extract_fields(self._service.get_fields(fields_request))
-        surface_data = next(iter(fields.values()))
+
+        def _add_requests(fields_request, surface_ids):
+            fields_request.surfaceRequest.extend(
+                [
+                    FieldDataProtoModule.SurfaceRequest(
+                        surfaceId=surface_id,
+                        oversetMesh=overset_mesh,
+                        provideFaces=data_type == SurfaceDataType.FacesConnectivity,
+                        provideVertices=data_type == SurfaceDataType.Vertices,
+                        provideFacesCentroid=data_type == SurfaceDataType.FacesCentroid,
+                        provideFacesNormal=data_type == SurfaceDataType.FacesNormal,
+                    )
+                    for surface_id in surface_ids
+                ]
+            )
+
+        surface_data = self._get_fields(
+            surface_ids,
+            [enum_to_field_name[data_type]],
+            lambda surface_id, name: (
+                FieldDataCache._geometry_tag,
+                surface_id,
+                name,
+                overset_mesh,
+            ),
+            _add_requests,
+        )
 
         def _get_surfaces_data(parent_class, surf_id, _data_type):
             return parent_class(
@@ -1385,20 +2012,26 @@ class FieldData:
             surface_ids=surface_ids,
             surface_name=surface_name,
         )
-        fields_request = get_fields_request()
-        fields_request.vectorFieldRequest.extend(
-            [
-                FieldDataProtoModule.VectorFieldRequest(
-                    surfaceId=surface_id,
-                    vectorFieldName=self._allowed_vector_field_names.valid_name(
-                        field_name
-                    ),
-                )
-                for surface_id in surface_ids
-            ]
+        field_name = self._allowed_vector_field_names.valid_name(field_name)
+
+        def _add_requests(fields_request, surface_ids):
+            fields_request.vectorFieldRequest.extend(
+                [
+                    FieldDataProtoModule.VectorFieldRequest(
+                        surfaceId=surface_id,
+                        vectorFieldName=field_name,
+                    )
+                    for surface_id in surface_ids
+                ]
+            )
+
+        vector_field_data = self._get_fields(
+            surface_ids,
+            [field_name, "vector-scale"],
+            # the vector scale depends on the vector field it is sent with
+            lambda surface_id, name: ("vector-field", surface_id, field_name, name),
+            _add_requests,
         )
-        fields = ChunkParser().extract_fields(self._service.get_fields(fields_request))
-        vector_field_data = next(iter(fields.values()))
 
         if surface_name:
             return VectorFieldData(
@@ -1504,7 +2137,9 @@ class FieldData:
                 for surface_id in surface_ids
             ]
         )
-        fields = ChunkParser().extract_fields(self._service.get_fields(fields_request))
+        fields = _extract_fields(
+            self._service, fields_request, self.max_concurrent_streams
+        )
         pathlines_data = next(iter(fields.values()))
 
         def _get_surfaces_data(parent_class, surf_id, _data_type):
@@ -1,9 +1,12 @@
 """Wrappers over Reduction gRPC service of Fluent."""
 
-from typing import Any, List, Tuple
+import inspect
+import threading
+from typing import Any, Iterable, List, Optional, Sequence, Tuple
 
 import grpc
 
+from ansys.api.fluent.v0 import batch_ops_pb2, batch_ops_pb2_grpc
 from ansys.api.fluent.v0 import reduction_pb2 as ReductionProtoModule
 from ansys.api.fluent.v0 import reduction_pb2_grpc as ReductionGrpcModule
 from ansys.fluent.core.services.error_handler import catch_grpc_error
@@ -32,7 +35,9 @@ class ReductionService:
             BatchInterceptor(),
         )
         self._stub = ReductionGrpcModule.ReductionStub(intercept_channel)
+        self._batch_ops_stub = batch_ops_pb2_grpc.BatchOpsStub(channel)
         self._metadata = metadata
+        self._fluent_error_state = fluent_error_state
 
     @catch_grpc_error
     def area(
@@ -174,6 +179,42 @@ class ReductionService:
         """Moment rpc of Reduction service."""
         return self._stub.Moment(request, metadata=self._metadata)
 
+    @catch_grpc_error
+    def execute(self, requests: Sequence[Tuple[str, Any]]) -> List[Tuple[int, bytes]]:
+        """Execute several Reduction rpcs through a single BatchOps call.
+
+        Parameters
+        ----------
+        requests : Sequence[Tuple[str, Any]]
+            Reduction rpc method names and their request messages.
+
+        Returns
+        -------
+        List[Tuple[int, bytes]]
+            Execution status and serialized response of each request, in the
+            order of ``requests``.
+        """
+        if self._fluent_error_state.name == "fatal":
+            details = self._fluent_error_state.details
+            raise RuntimeError(
+                f"Fatal error identified on the Fluent server: {details}."
+            )
+        service = ReductionProtoModule.DESCRIPTOR.services_by_name["Reduction"]
+        package = ReductionProtoModule.DESCRIPTOR.package
+        responses = self._batch_ops_stub.Execute(
+            (
+                batch_ops_pb2.ExecuteRequest(
+                    package=package,
+                    service=service.name,
+                    method=method,
+                    request_body=request.SerializeToString(),
+                )
+                for method, request in requests
+            ),
+            metadata=self._metadata,
+        )
+        return [(response.status, response.response_body) for response in responses]
+
 
 class BadReductionRequest(Exception):
     def __init__(self, err):
@@ -250,6 +291,174 @@ def _locns(locns, ctxt=None):
     return locn_list
 
 
+_REDUCTION_RPCS = {
+    "area": "Area",
+    "area_average": "AreaAve",
+    "area_integral": "AreaInt",
+    "centroid": "Centroid",
+    "count": "Count",
+    "count_if": "CountIf",
+    "force": "Force",
+    "mass_average": "MassAve",
+    "mass_flow_average": "MassFlowAve",
+    "mass_flow_average_absolute": "MassFlowAveAbs",
+    "mass_flow_integral": "MassFlowInt",
+    "mass_integral": "MassInt",
+    "maximum": "Maximum",
+    "minimum": "Minimum",
+    "pressure_force": "PressureForce",
+    "viscous_force": "ViscousForce",
+    "volume": "Volume",
+    "volume_average": "VolumeAve",
+    "volume_integral": "VolumeInt",
+    "moment": "Moment",
+}
+
+
+_EXTENTS = {
+    "area": lambda reduction, locations: reduction.area(locations),
+    "volume": lambda reduction, locations: reduction.volume(locations),
+    "mass": lambda reduction, locations: reduction.mass_integral("1", locations),
+    "mass_flow": lambda reduction, locations: reduction.mass_flow_integral(
+        "1", locations
+    ),
+}
+
+
+class ReductionResult:
+    """Result of a reduction submitted to a ``ReductionBatch``.
+
+    The result is available once the batch has been executed.
+    """
+
+    def __init__(self, function: str):
+        """__init__ method of ReductionResult class."""
+        self.function = function
+        self._done = False
+        self._value = None
+        self._exception = None
+
+    def _set_value(self, value) -> None:
+        self._value = value
+        self._done = True
+
+    def _set_exception(self, exception: Exception) -> None:
+        self._exception = exception
+        self._done = True
+
+    def done(self) -> bool:
+        """Whether the reduction has been evaluated."""
+        return self._done
+
+    def exception(self) -> Optional[Exception]:
+        """Return the error raised by the reduction, if any."""
+        if not self._done:
+            raise RuntimeError(f"Reduction '{self.function}' has not been evaluated.")
+        return self._exception
+
+    def result(self) -> Any:
+        """Return the value of the reduction or raise its error."""
+        if self.exception() is not None:
+            raise self._exception
+        return self._value
+
+
+class ReductionBatch:
+    """Collects reductions and evaluates them with a single request to Fluent.
+
+    Every reduction function of ``Reduction`` is available on the batch with
+    the same arguments. Calling it queues the reduction and returns a
+    ``ReductionResult`` which is filled in when the batch is executed, either
+    explicitly by ``execute()`` or on leaving the ``with`` block. An error in one
+    reduction is reported on its own result and does not affect the others.
+
+    Examples
+    --------
+    >>> with solver.reduction.batch() as batch:
+    >>>     p_in = batch.area_average("AbsolutePressure", ["inlet1"])
+    >>>     t_max = batch.maximum("Temperature", ["outlet"])
+    >>> p_in.result(), t_max.result()
+    """
+
+    def __init__(self, reduction: "Reduction"):
+        """__init__ method of ReductionBatch class."""
+        self._reduction = reduction
+        self._pending = []
+
+    def __getattr__(self, name: str):
+        if name in _REDUCTION_RPCS:
+            return lambda *args, **kwargs: self.add(name, *args, **kwargs)
+        raise AttributeError(
+            f"'{type(self).__name__}' object has no attribute '{name}'"
+        )
+
+    def __dir__(self):
+        return sorted(set(super().__dir__()) | _REDUCTION_RPCS.keys())
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_tb):
+        if not exc_type:
+            self.execute()
+
+    def add(self, function: str, *args, **kwargs) -> ReductionResult:
+        """Queue a reduction.
+
+        Parameters
+        ----------
+        function : str
+            Name of the reduction function, e.g. ``"area_average"``.
+        *args, **kwargs
+            Arguments of the reduction function.
+
+        Returns
+        -------
+        ReductionResult
+            Handle to the result of the reduction.
+        """
+        result = ReductionResult(function)
+        try:
+            method, request = self._reduction._make_request(function, *args, **kwargs)
+        except (BadReductionRequest, TypeError) as ex:
+            result._set_exception(ex)
+        else:
+            self._pending.append((method, request, result))
+        return result
+
+    def execute(self) -> None:
+        """Evaluate the queued reductions with a single request to Fluent."""
+        pending, self._pending = self._pending, []
+        if not pending:
+            return
+        responses = self._reduction.service.execute(
+            [(method, request) for method, request, _ in pending]
+        )
+        for i, (method, _, result) in enumerate(pending):
+            if i >= len(responses):
+                result._set_exception(
+                    RuntimeError(f"No response received for {method} reduction.")
+                )
+                continue
+            status, data = responses[i]
+            if status != batch_ops_pb2.STATUS_SUCCESSFUL:
+                status_name = batch_ops_pb2.ExecuteStatus.Name(status)
+                result._set_exception(
+                    BadReductionRequest(f"{method} failed with status {status_name}")
+                )
+                continue
+            response = getattr(ReductionProtoModule, f"{method}Response")()
+            try:
+                response.ParseFromString(data)
+            except Exception as ex:
+                result._set_exception(BadReductionRequest(ex))
+            else:
+                result._set_value(response.value)
+
+
 class Reduction:
     """
     Reduction.
@@ -258,6 +467,9 @@ class Reduction:
     def __init__(self, service: ReductionService):
         """__init__ method of Reduction class."""
         self.service = service
+        self._extents = {}
+        self._extents_generation = 0
+        self._extents_lock = threading.Lock()
 
     docstring = None
 
@@ -268,6 +480,108 @@ class Reduction:
         except BadReductionRequest:
             return locations
 
+    def _make_request(self, function: str, *args, **kwargs) -> Tuple[str, Any]:
+        """Build the request message of a reduction function.
+
+        Returns
+        -------
+        Tuple[str, Any]
+            Reduction rpc method name and request message.
+        """
+        method = _REDUCTION_RPCS.get(function)
+        if method is None:
+            raise BadReductionRequest(f"Unknown reduction function '{function}'")
+        arguments = inspect.signature(getattr(self, function)).bind(*args, **kwargs)
+        arguments.apply_defaults()
+        request = getattr(ReductionProtoModule, f"{method}Request")()
+        if "expression" in arguments.arguments:
+            request.expression = arguments.arguments["expression"]
+        request.locations.extend(
+            self._get_location_string(
+                arguments.arguments["locations"], arguments.arguments["ctxt"]
+            )
+        )
+        return method, request
+
+    def invalidate_cache(self, session_id=None, event_info=None) -> None:
+        """Discard the cached extents."""
+        with self._extents_lock:
+            self._extents.clear()
+            self._extents_generation += 1
+
+    def extent(self, name: str, locations, ctxt=None) -> Any:
+        """Get the area, volume, mass or mass flow of the given locations.
+
+        The value is cached per location set until ``invalidate_cache()`` is
+        called, which the solver session does whenever the case or data
+        changes.
+
+        Parameters
+        ----------
+        name : str
+            Extent name, one of ``"area"``, ``"volume"``, ``"mass"`` and
+            ``"mass_flow"``.
+        locations : Any
+            Locations of the extent.
+        ctxt : Any, optional
+            Context of the locations.
+
+        Returns
+        -------
+        Any
+            Extent value.
+        """
+        if name not in _EXTENTS:
+            raise BadReductionRequest(f"Unknown extent '{name}'")
+        locations = self._get_location_string(locations, ctxt)
+        key = (name, tuple(locations))
+        with self._extents_lock:
+            if key in self._extents:
+                return self._extents[key]
+            generation = self._extents_generation
+        value = _EXTENTS[name](self, locations)
+        with self._extents_lock:
+            if generation == self._extents_generation:
+                self._extents[key] = value
+        return value
+
+    def batch(self) -> ReductionBatch:
+        """Return a batch collecting reductions to be evaluated together.
+
+        Returns
+        -------
+        ReductionBatch
+            Batch of reductions, usable as a context manager.
+        """
+        return ReductionBatch(self)
+
+    def evaluate_many(
+        self, requests: Iterable[Sequence], return_exceptions: bool = False
+    ) -> List[Any]:
+        """Evaluate several reductions with a single request to Fluent.
+
+        Parameters
+        ----------
+        requests : Iterable[Sequence]
+            Reductions to evaluate, each given as the name of the reduction
+            function followed by its arguments, e.g.
+            ``("area_average", "AbsolutePressure", ["inlet1"])``.
+        return_exceptions : bool, optional
+            Whether to return the error of a failed reduction in place of its
+            value. Otherwise the first error is raised. The default is ``False``.
+
+        Returns
+        -------
+        List[Any]
+            Values of the reductions, in the order of ``requests``.
+        """
+        batch = self.batch()
+        results = [batch.add(*request) for request in requests]
+        batch.execute()
+        if return_exceptions:
+            return [result.exception() or result.result() for result in results]
+        return [result.result() for result in results]
+
     def area(self, locations, ctxt=None) -> Any:
         """Get area."""
         request = ReductionProtoModule.AreaRequest()
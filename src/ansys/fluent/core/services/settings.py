@@ -1,18 +1,27 @@
 """Wrapper to settings gRPC service of Fluent."""
 import collections.abc
 from functools import wraps
-from typing import Any, List, Tuple
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+from typing import Any, List, Optional, Tuple
 
 import grpc
 
 from ansys.api.fluent.v0 import settings_pb2 as SettingsModule
 from ansys.api.fluent.v0 import settings_pb2_grpc as SettingsGrpcModule
+import ansys.fluent.core as pyfluent
 from ansys.fluent.core.services.error_handler import catch_grpc_error
 from ansys.fluent.core.services.interceptors import (
     BatchInterceptor,
     ErrorStateInterceptor,
     TracingInterceptor,
 )
+from ansys.fluent.core.utils.hashing import gethash
+
+settings_logger = logging.getLogger("pyfluent.settings_api")
 
 
 class _SettingsServiceImpl:
@@ -104,6 +113,88 @@ def _trace(fn):
     return _fn
 
 
+class _StaticInfoCache:
+    """On-disk cache of the settings static-info.
+
+    Entries are stored per PyFluent and Fluent version under a key derived
+    from the serialized static-info response, so that a changed settings tree
+    never hits a stale entry. Entries are written atomically and can be shared
+    between processes. Only the ``max_entries`` most recently used entries are
+    kept.
+    """
+
+    # Increment when the format of the cached entries changes.
+    format_version = 1
+
+    def __init__(self, cache_dir: str, max_entries: int):
+        """__init__ method of _StaticInfoCache class."""
+        self._cache_dir = cache_dir
+        self._max_entries = max_entries
+
+    def _get_file_path(self, fluent_version: str, info_bytes: bytes) -> str:
+        key = hashlib.sha256(info_bytes).hexdigest()
+        return os.path.join(
+            self._cache_dir,
+            f"v{self.format_version}",
+            pyfluent.__version__,
+            fluent_version,
+            f"{key}.pickle",
+        )
+
+    def get(self, fluent_version: str, info_bytes: bytes) -> Optional[dict]:
+        """Get the cached entry, or ``None`` if it is not available."""
+        file_path = self._get_file_path(fluent_version, info_bytes)
+        try:
+            with open(file_path, "rb") as f:
+                entry = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as ex:
+            settings_logger.warning(f"Unable to read cached static-info: {ex}")
+            return None
+        try:
+            # Mark the entry as recently used for pruning.
+            os.utime(file_path)
+        except OSError:
+            pass
+        return entry
+
+    def put(self, fluent_version: str, info_bytes: bytes, entry: dict) -> None:
+        """Store the entry and prune the least recently used entries."""
+        file_path = self._get_file_path(fluent_version, info_bytes)
+        try:
+            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(file_path))
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_path, file_path)
+            except BaseException:
+                os.remove(tmp_path)
+                raise
+        except OSError as ex:
+            settings_logger.warning(f"Unable to cache static-info: {ex}")
+            return
+        self._prune()
+
+    def _prune(self) -> None:
+        entries = []
+        for dir_path, _, file_names in os.walk(self._cache_dir):
+            for file_name in file_names:
+                if file_name.endswith(".pickle"):
+                    file_path = os.path.join(dir_path, file_name)
+                    try:
+                        entries.append((os.path.getmtime(file_path), file_path))
+                    except OSError:
+                        pass
+        entries.sort(reverse=True)
+        for _, file_path in entries[self._max_entries :]:
+            try:
+                os.remove(file_path)
+            except OSError:
+                pass
+
+
 def _get_request_instance_for_path(request_class, path):
     request = request_class()
     request.path_info.path = path
@@ -118,6 +209,7 @@ class SettingsService:
         """__init__ method of SettingsService class."""
         self._service_impl = _SettingsServiceImpl(channel, metadata, fluent_error_state)
         self._scheme_eval = scheme_eval
+        self._static_info_hash = None
 
     @_trace
     def _set_state_from_value(self, state, value):
@@ -277,7 +369,14 @@ class SettingsService:
 
     @_trace
     def get_static_info(self):
-        """Get static-info for settings."""
+        """Get static-info for settings.
+
+        If ``pyfluent.SETTINGS_USE_STATIC_INFO_CACHE`` is set, the extracted
+        static-info is cached on disk under
+        ``pyfluent.SETTINGS_STATIC_INFO_CACHE_PATH`` and reused by later
+        sessions of the same PyFluent version and Fluent build. At most
+        ``pyfluent.SETTINGS_STATIC_INFO_CACHE_MAX_ENTRIES`` entries are kept.
+        """
         request = SettingsModule.GetStaticInfoRequest()
         request.root = "fluent"
         response = self._service_impl.get_static_info(request)
@@ -285,7 +384,27 @@ class SettingsService:
         # type is empty
         if not response.info.type:
             raise RuntimeError
-        return self._extract_static_info(response.info)
+        if not pyfluent.SETTINGS_USE_STATIC_INFO_CACHE:
+            self._static_info_hash = None
+            return self._extract_static_info(response.info)
+        cache = _StaticInfoCache(
+            pyfluent.SETTINGS_STATIC_INFO_CACHE_PATH,
+            pyfluent.SETTINGS_STATIC_INFO_CACHE_MAX_ENTRIES,
+        )
+        fluent_version = str(self._scheme_eval.version)
+        info_bytes = response.info.SerializeToString(deterministic=True)
+        entry = cache.get(fluent_version, info_bytes)
+        if entry is None:
+            static_info = self._extract_static_info(response.info)
+            entry = {"static_info": static_info, "hash": gethash(static_info)}
+            cache.put(fluent_version, info_bytes, entry)
+        self._static_info_hash = entry["hash"]
+        return entry["static_info"]
+
+    def get_static_info_hash(self) -> Optional[str]:
+        """Get the hash of the static-info returned by the last
+        ``get_static_info`` call if it is known without recomputing it."""
+        return self._static_info_hash
 
     @_trace
     def execute_cmd(self, path: str, command: str, **kwds) -> Any:
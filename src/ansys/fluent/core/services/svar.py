@@ -1,6 +1,5 @@
 """Wrappers over SVAR gRPC service of Fluent."""
 
-import math
 from typing import Dict, List, Optional
 
 import grpc
@@ -175,6 +174,46 @@ class SVARInfo:
         service: SVARService,
     ):
         self._service = service
+        self._zones_info = None
+        self._svars_info = {}
+
+    def _get_zones_info(self, refresh: bool = False) -> ZonesInfo:
+        """Get the cached zones information, fetching it from Fluent if
+        required."""
+        zones_info = None if refresh else self._zones_info
+        if zones_info is None:
+            zones_info = self.get_zones_info()
+        return zones_info
+
+    def _get_svars_info(
+        self, zone_names: List[str], domain_name: str = "mixture", refresh=False
+    ) -> SVARS:
+        """Get SVARs info for zones in the domain, fetching only the zones
+        which are not cached yet."""
+        allowed_zone_names = _AllowedZoneNames(self)
+        domain_id = _AllowedDomainNames(self).valid_name(domain_name)
+        svars_info = None
+        for zone_name in zone_names:
+            zone_id = allowed_zone_names.valid_name(zone_name)
+            zone_svars_info = (
+                None if refresh else self._svars_info.get((domain_id, zone_id))
+            )
+            if zone_svars_info is None:
+                request = SvarProtoModule.GetSvarsInfoRequest(
+                    domainId=domain_id, zoneId=zone_id
+                )
+                zone_svars_info = self._service.get_svars_info(request).svarsInfo
+                self._svars_info[(domain_id, zone_id)] = zone_svars_info
+            if svars_info is None:
+                svars_info = SVARInfo.SVARS(zone_svars_info)
+            else:
+                svars_info._filter(zone_svars_info)
+        return svars_info
+
+    def invalidate_metadata(self, session_id=None, event_info=None) -> None:
+        """Discard the cached zones and SVARs information."""
+        self._zones_info = None
+        self._svars_info = {}
 
     def get_svars_info(
         self, zone_names: List[str], domain_name: str = "mixture"
@@ -193,21 +232,7 @@ class SVARInfo:
         SVARInfo.SVARS
             Object containing information for SVARs which are common for list of zone names.
         """
-
-        allowed_zone_names = _AllowedZoneNames(self)
-        allowed_domain_names = _AllowedDomainNames(self)
-        svars_info = None
-        for zone_name in zone_names:
-            request = SvarProtoModule.GetSvarsInfoRequest(
-                domainId=allowed_domain_names.valid_name(domain_name),
-                zoneId=allowed_zone_names.valid_name(zone_name),
-            )
-            response = self._service.get_svars_info(request)
-            if svars_info is None:
-                svars_info = SVARInfo.SVARS(response.svarsInfo)
-            else:
-                svars_info._filter(response.svarsInfo)
-        return svars_info
+        return self._get_svars_info(zone_names, domain_name, refresh=True)
 
     def get_zones_info(self) -> ZonesInfo:
         """Get Zones info.
@@ -223,7 +248,8 @@ class SVARInfo:
         """
         request = SvarProtoModule.GetZonesInfoRequest()
         response = self._service.get_zones_info(request)
-        return SVARInfo.ZonesInfo(response.zonesInfo, response.domainsInfo)
+        self._zones_info = SVARInfo.ZonesInfo(response.zonesInfo, response.domainsInfo)
+        return self._zones_info
 
 
 class SvarError(ValueError):
@@ -243,7 +269,17 @@ class ZoneError(ValueError):
 
 
 class _AllowedNames:
+    def __init__(self, svar_info: SVARInfo):
+        self._svar_info = svar_info
+
+    @property
+    def _zones_info(self):
+        return self._svar_info._get_zones_info()
+
     def is_valid(self, name):
+        if name not in self():
+            # The cached zones info may predate the name, refresh it once.
+            self._svar_info._get_zones_info(refresh=True)
         return name in self()
 
 
@@ -254,11 +290,16 @@ class _AllowedSvarNames:
     def __call__(
         self, zone_names: List[str], domain_name: str = "mixture"
     ) -> List[str]:
-        return self._svar_info.get_svars_info(
+        return self._svar_info._get_svars_info(
             zone_names=zone_names, domain_name=domain_name
         ).svars
 
     def is_valid(self, svar_name, zone_names: List[str], domain_name: str = "mixture"):
+        if svar_name not in self(zone_names=zone_names, domain_name=domain_name):
+            # The cached SVARs info may predate the SVAR, refresh it once.
+            self._svar_info._get_svars_info(
+                zone_names=zone_names, domain_name=domain_name, refresh=True
+            )
         return svar_name in self(zone_names=zone_names, domain_name=domain_name)
 
     def valid_name(
@@ -273,9 +314,6 @@ class _AllowedSvarNames:
 
 
 class _AllowedZoneNames(_AllowedNames):
-    def __init__(self, svar_info: SVARInfo):
-        self._zones_info = svar_info.get_zones_info()
-
     def __call__(self) -> List[str]:
         return self._zones_info.zones
 
@@ -289,9 +327,6 @@ class _AllowedZoneNames(_AllowedNames):
 
 
 class _AllowedDomainNames(_AllowedNames):
-    def __init__(self, svar_info: SVARInfo):
-        self._zones_info = svar_info.get_zones_info()
-
     def __call__(self) -> List[str]:
         return self._zones_info.domains
 
@@ -435,6 +470,7 @@ class SVARData:
     ):
         self._service = service
         self._svar_info = svar_info
+        svar_info._get_zones_info()
 
         self._allowed_zone_names = _AllowedZoneNames(svar_info)
 
@@ -461,16 +497,39 @@ class SVARData:
         This array can be populated  with values to set SVAR data.
         """
 
-        zones_info = self._svar_info.get_zones_info()
-        if zone_name in zones_info.zones:
-            svars_info = self._svar_info.get_svars_info(
-                zone_names=[zone_name], domain_name=domain_name
-            )
-            if svar_name in svars_info.svars:
-                return np.zeros(
-                    zones_info[zone_name].count * svars_info[svar_name].dimension,
-                    dtype=svars_info[svar_name].field_type,
-                )
+        # the cached zones and SVARs info is refreshed once for unknown names
+        if not self._allowed_zone_names.is_valid(zone_name):
+            return
+        if not self._allowed_svar_names.is_valid(
+            svar_name, zone_names=[zone_name], domain_name=domain_name
+        ):
+            return
+        zones_info = self._svar_info._get_zones_info()
+        svars_info = self._svar_info._get_svars_info(
+            zone_names=[zone_name], domain_name=domain_name
+        )
+        return np.zeros(
+            zones_info[zone_name].count * svars_info[svar_name].dimension,
+            dtype=svars_info[svar_name].field_type,
+        )
+
+    def _get_svar_data_request(
+        self, svar_name: str, zone_names: List[str], domain_name: str
+    ):
+        svars_request = SvarProtoModule.GetSvarDataRequest(
+            provideBytesStream=_FieldDataConstants.bytes_stream,
+            chunkSize=_FieldDataConstants.chunk_size,
+        )
+        svars_request.domainId = self._allowed_domain_names.valid_name(domain_name)
+        svars_request.name = self._allowed_svar_names.valid_name(
+            svar_name, zone_names, domain_name
+        )
+        zone_id_name_map = {}
+        for zone_name in zone_names:
+            zone_id = self._allowed_zone_names.valid_name(zone_name)
+            zone_id_name_map[zone_id] = zone_name
+            svars_request.zones.append(zone_id)
+        return svars_request, zone_id_name_map
 
     def get_svar_data(
         self,
@@ -494,31 +553,63 @@ class SVARData:
         SVARData.Data
             Object containing SVAR data.
         """
-        svars_request = SvarProtoModule.GetSvarDataRequest(
-            provideBytesStream=_FieldDataConstants.bytes_stream,
-            chunkSize=_FieldDataConstants.chunk_size,
-        )
-        svars_request.domainId = self._allowed_domain_names.valid_name(domain_name)
-        svars_request.name = self._allowed_svar_names.valid_name(
+        svars_request, zone_id_name_map = self._get_svar_data_request(
             svar_name, zone_names, domain_name
         )
-        zone_id_name_map = {}
-        for zone_name in zone_names:
-            zone_id = self._allowed_zone_names.valid_name(zone_name)
-            zone_id_name_map[zone_id] = zone_name
-            svars_request.zones.append(zone_id)
-
         return SVARData.Data(
             domain_name,
             zone_id_name_map,
             extract_svars(self._service.get_svar_data(svars_request)),
         )
 
+    def get_svars_data(
+        self,
+        svar_names: List[str],
+        zone_names: List[str],
+        domain_name: Optional[str] = "mixture",
+    ) -> Dict[str, Data]:
+        """Get data of multiple SVARs on zones.
+
+        All the requests are issued before any response is read, so the
+        SVARs are streamed back in a single pipelined pass instead of one
+        round trip after another.
+
+        Parameters
+        ----------
+        svar_names : List[str]
+            Names of the SVARs.
+        zone_names: List[str]
+            Zone names list for SVAR data.
+        domain_name : str, optional
+            Domain name. The default is ``mixture``.
+
+        Returns
+        -------
+        Dict[str, SVARData.Data]
+            Dictionary containing SVAR data objects keyed by SVAR name.
+        """
+        responses = {}
+        for svar_name in svar_names:
+            svars_request, zone_id_name_map = self._get_svar_data_request(
+                svar_name, zone_names, domain_name
+            )
+            responses[svar_name] = (
+                zone_id_name_map,
+                self._service.get_svar_data(svars_request),
+            )
+        return {
+            svar_name: SVARData.Data(
+                domain_name, zone_id_name_map, extract_svars(svars_data)
+            )
+            for svar_name, (zone_id_name_map, svars_data) in responses.items()
+        }
+
     def set_svar_data(
         self,
         svar_name: str,
         zone_names_to_svar_data: Dict[str, np.array],
         domain_name: str = "mixture",
+        chunk_size: Optional[int] = None,
     ) -> None:
         """Set SVAR data on zones.
 
@@ -530,6 +621,9 @@ class SVARData:
             Dictionary containing zone names for SVAR data.
         domain_name : str, optional
             Domain name. The default is ``mixture``.
+        chunk_size : int, optional
+            Size in bytes of the chunks in which the data is streamed to Fluent.
+            The default is the chunk size used to receive field data.
 
         Returns
         -------
@@ -540,67 +634,81 @@ class SVARData:
             self._allowed_zone_names.valid_name(zone_name): svar_data
             for zone_name, svar_data in zone_names_to_svar_data.items()
         }
+        if chunk_size is None:
+            chunk_size = _FieldDataConstants.chunk_size
 
-        def generate_set_svar_data_requests():
-            set_svar_data_requests = []
-
-            set_svar_data_requests.append(
-                SvarProtoModule.SetSvarDataRequest(
-                    header=SvarProtoModule.SvarHeader(
-                        name=svar_name, domainId=domain_id
-                    )
-                )
+        self._service.set_svar_data(
+            _generate_set_svar_data_requests(
+                svar_name, domain_id, zone_ids_to_svar_data, chunk_size
             )
+        )
 
-            for zone_id, svar_data in zone_ids_to_svar_data.items():
-                max_array_size = (
-                    _FieldDataConstants.chunk_size / np.dtype(svar_data.dtype).itemsize
-                )
-                svar_data_list = np.array_split(
-                    svar_data, math.ceil(svar_data.size / max_array_size)
-                )
-                set_svar_data_requests.append(
-                    SvarProtoModule.SetSvarDataRequest(
-                        payloadInfo=SvarProtoModule.Info(
-                            fieldType=_FieldDataConstants.np_data_type_to_proto_field_type[
-                                svar_data.dtype.type
-                            ],
-                            fieldSize=svar_data.size,
-                            zone=zone_id,
-                        )
+
+def _generate_set_svar_data_requests(
+    svar_name: str,
+    domain_id: int,
+    zone_ids_to_svar_data: Dict[int, np.array],
+    chunk_size: int,
+):
+    """Generate the SetSvarData request stream.
+
+    Requests are created lazily as the stream is consumed. With a bytes stream,
+    the contiguous array is sliced through a memoryview and every chunk is sent
+    as a raw ``bytePayload``, which is the only copy of the data made on the
+    client.
+    """
+    yield SvarProtoModule.SetSvarDataRequest(
+        header=SvarProtoModule.SvarHeader(name=svar_name, domainId=domain_id)
+    )
+
+    for zone_id, svar_data in zone_ids_to_svar_data.items():
+        svar_data = np.ascontiguousarray(svar_data)
+        yield SvarProtoModule.SetSvarDataRequest(
+            payloadInfo=SvarProtoModule.Info(
+                fieldType=_FieldDataConstants.np_data_type_to_proto_field_type[
+                    svar_data.dtype.type
+                ],
+                fieldSize=svar_data.size,
+                zone=zone_id,
+            )
+        )
+        itemsize = svar_data.dtype.itemsize
+        chunk_elements = max(chunk_size // itemsize, 1)
+        if _FieldDataConstants.bytes_stream:
+            svar_bytes = memoryview(svar_data.reshape(-1)).cast("B")
+            chunk_bytes = chunk_elements * itemsize
+            for start in range(0, len(svar_bytes), chunk_bytes):
+                yield SvarProtoModule.SetSvarDataRequest(
+                    payload=SvarProtoModule.Payload(
+                        bytePayload=svar_bytes[start : start + chunk_bytes].tobytes()
                     )
                 )
-                set_svar_data_requests += [
-                    SvarProtoModule.SetSvarDataRequest(
-                        payload=SvarProtoModule.Payload(
-                            floatPayload=FieldDataProtoModule.FloatPayload(
-                                payload=svar_data
-                            )
+        else:
+            svar_data = svar_data.reshape(-1)
+            for start in range(0, svar_data.size, chunk_elements):
+                svar_data_chunk = svar_data[start : start + chunk_elements]
+                yield SvarProtoModule.SetSvarDataRequest(
+                    payload=SvarProtoModule.Payload(
+                        floatPayload=FieldDataProtoModule.FloatPayload(
+                            payload=svar_data_chunk
                         )
-                        if svar_data.dtype.type == np.float32
-                        else SvarProtoModule.Payload(
-                            doublePayload=FieldDataProtoModule.DoublePayload(
-                                payload=svar_data
-                            )
+                    )
+                    if svar_data.dtype.type == np.float32
+                    else SvarProtoModule.Payload(
+                        doublePayload=FieldDataProtoModule.DoublePayload(
+                            payload=svar_data_chunk
                         )
-                        if svar_data.dtype.type == np.float64
-                        else SvarProtoModule.Payload(
-                            intPayload=FieldDataProtoModule.IntPayload(
-                                payload=svar_data
-                            )
+                    )
+                    if svar_data.dtype.type == np.float64
+                    else SvarProtoModule.Payload(
+                        intPayload=FieldDataProtoModule.IntPayload(
+                            payload=svar_data_chunk
                         )
-                        if svar_data.dtype.type == np.int32
-                        else SvarProtoModule.Payload(
-                            longPayload=FieldDataProtoModule.LongPayload(
-                                payload=svar_data
-                            )
+                    )
+                    if svar_data.dtype.type == np.int32
+                    else SvarProtoModule.Payload(
+                        longPayload=FieldDataProtoModule.LongPayload(
+                            payload=svar_data_chunk
                         )
                     )
-                    for svar_data in svar_data_list
-                    if svar_data.size > 0
-                ]
-
-            for set_svar_data_request in set_svar_data_requests:
-                yield set_svar_data_request
-
-        self._service.set_svar_data(generate_set_svar_data_requests())
+                )
@@ -148,10 +148,10 @@ class BaseSession:
             self.fluent_connection._id, self._monitors_service
         )
 
-        self.events_manager.register_callback(
+        self.events_manager._register_internal_callback(
             "InitializedEvent", self.monitors_manager.refresh
         )
-        self.events_manager.register_callback(
+        self.events_manager._register_internal_callback(
             "DataReadEvent", self.monitors_manager.refresh
         )
 
@@ -172,6 +172,22 @@ class BaseSession:
         self.field_data_streaming = FieldDataStreaming(
             self.fluent_connection._id, self._field_data_service
         )
+        for event_name in (
+            "IterationEndedEvent",
+            "TimestepEndedEvent",
+            "InitializedEvent",
+            "DataReadEvent",
+        ):
+            self.events_manager._register_internal_callback(
+                event_name, self.field_data.cache.invalidate_fields
+            )
+        self.events_manager._register_internal_callback(
+            "CaseReadEvent", self.field_data.cache.invalidate
+        )
+        for event_name in ("CaseReadEvent", "DataReadEvent"):
+            self.events_manager._register_internal_callback(
+                event_name, self.field_info.invalidate_metadata
+            )
 
         self.settings_service = self.fluent_connection.create_service(
             SettingsService, self.scheme_eval, self.error_state
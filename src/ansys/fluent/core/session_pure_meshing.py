@@ -5,7 +5,6 @@
 import functools
 
 import ansys.fluent.core as pyfluent
-from ansys.fluent.core.data_model_cache import DataModelCache
 from ansys.fluent.core.fluent_connection import FluentConnection
 from ansys.fluent.core.services.meshing_queries import (
     MeshingQueries,
@@ -25,8 +24,6 @@ class PureMeshing(BaseSession):
     in this mode."""
 
     rules = ["workflow", "meshing", "PartManagement", "PMFileManagement"]
-    for r in rules:
-        DataModelCache.set_config(r, "internal_names_as_keys", True)
 
     def __init__(self, fluent_connection: FluentConnection):
         """PureMeshing session.
@@ -49,12 +46,17 @@ class PureMeshing(BaseSession):
         self.meshing_queries = MeshingQueries(self.meshing_queries_service)
 
         datamodel_service_se = self.datamodel_service_se
+        for rules in self.__class__.rules:
+            datamodel_service_se.cache.set_config(rules, "internal_names_as_keys", True)
         self.datamodel_streams = {}
         if pyfluent.DATAMODEL_USE_STATE_CACHE:
             for rules in self.__class__.rules:
                 stream = DatamodelStream(datamodel_service_se)
                 stream.register_callback(
-                    functools.partial(DataModelCache.update_cache, rules=rules)
+                    functools.partial(
+                        datamodel_service_se.cache.update_cache_from_stream,
+                        rules=rules,
+                    )
                 )
                 self.datamodel_streams[rules] = stream
                 stream.start(
@@ -62,6 +64,11 @@ class PureMeshing(BaseSession):
                     no_commands_diff_state=pyfluent.DATAMODEL_USE_NOCOMMANDS_DIFF_STATE,
                 )
                 self.fluent_connection.register_finalizer_cb(stream.stop)
+                self.fluent_connection.register_finalizer_cb(
+                    functools.partial(
+                        datamodel_service_se.cache.set_synced, rules, False
+                    )
+                )
 
     @property
     def tui(self):
@@ -56,10 +56,24 @@ class Solver(BaseSession):
         self._lck = threading.Lock()
         self.svar_service = self.fluent_connection.create_service(SVARService)
         self.svar_info = SVARInfo(self.svar_service)
+        for event_name in ("CaseReadEvent", "DataReadEvent", "InitializedEvent"):
+            self.events_manager._register_internal_callback(
+                event_name, self.svar_info.invalidate_metadata
+            )
         self._reduction_service = self.fluent_connection.create_service(
             ReductionService, self.error_state
         )
         self.reduction = Reduction(self._reduction_service)
+        for event_name in (
+            "CaseReadEvent",
+            "DataReadEvent",
+            "InitializedEvent",
+            "IterationEndedEvent",
+            "TimestepEndedEvent",
+        ):
+            self.events_manager._register_internal_callback(
+                event_name, self.reduction.invalidate_cache
+            )
 
     def build_from_fluent_connection(self, fluent_connection):
         """Build a solver session object from fluent_connection object."""
@@ -121,7 +135,9 @@ class Solver(BaseSession):
         """Root settings object."""
         if self._settings_root is None:
             self._settings_root = settings_get_root(
-                flproxy=self._settings_service, version=self.version
+                flproxy=self._settings_service,
+                version=self.version,
+                reduction=self.reduction,
             )
         return self._settings_root
 
@@ -16,17 +16,20 @@ Example
 >>> r.boundary_conditions.velocity_inlet['inlet'].vmag.constant = 20
 """
 import collections
+import contextlib
 import fnmatch
-import hashlib
+import functools
 import importlib
 import keyword
 import logging
-import pickle
 import string
 import sys
+import threading
 from typing import Any, Dict, Generic, List, NewType, Tuple, TypeVar, Union
 import weakref
 
+from ansys.fluent.core.utils.hashing import gethash as _gethash
+
 from .error_message import allowed_name_error_message, allowed_values_error
 
 settings_logger = logging.getLogger("pyfluent.settings_api")
@@ -69,6 +72,64 @@ def to_python_name(fluent_name: str) -> str:
     return name
 
 
+_attrs_cache = threading.local()
+
+
+@contextlib.contextmanager
+def settings_cache():
+    """Cache the attributes of settings objects within a block.
+
+    Within the block, ``get_attrs`` queries (including the ``active?`` query
+    made on every child attribute access of a ``Group``) are answered from a
+    local cache after the first request for a path. The cache is cleared when
+    a settings object is modified or a command is executed through the
+    settings API, and it is discarded on leaving the outermost block. Changes
+    made to Fluent by other means within the block are not detected.
+
+    The cache is local to the thread which entered the block.
+
+    Example
+    -------
+    >>> with settings_cache():
+    ...     for name in solver.setup.boundary_conditions.velocity_inlet:
+    ...         print(solver.setup.boundary_conditions.velocity_inlet[name]())
+    """
+    outermost = getattr(_attrs_cache, "attrs", None) is None
+    if outermost:
+        _attrs_cache.attrs = {}
+    try:
+        yield
+    finally:
+        if outermost:
+            _attrs_cache.attrs = None
+
+
+def _clear_attrs_cache():
+    """Clear the attributes cached within a ``settings_cache`` block."""
+    attrs = getattr(_attrs_cache, "attrs", None)
+    if attrs:
+        attrs.clear()
+
+
+def _cache_attrs(cache: dict, flproxy_id: int, path: str, attrs_info: dict):
+    """Store the response of a recursive ``get_attrs`` query per path."""
+    attrs = attrs_info.get("attrs")
+    if isinstance(attrs, collections.abc.Mapping):
+        cache.setdefault((flproxy_id, path), {}).update(attrs)
+    prefix = path + "/" if path else ""
+    for children_type in (
+        "group_children",
+        "named_object_children",
+        "commands",
+        "queries",
+        "arguments",
+    ):
+        for name, child_info in attrs_info.get(children_type, {}).items():
+            _cache_attrs(cache, flproxy_id, prefix + name, child_info)
+    for index, child_info in enumerate(attrs_info.get("list_object_children", [])):
+        _cache_attrs(cache, flproxy_id, prefix + str(index), child_info)
+
+
 class Base:
     """Base class for settings and command objects.
 
@@ -110,6 +171,8 @@ class Base:
 
     _name = None
     fluent_name = None
+    # Whether child objects are created on first access, see _LazyChildClass
+    _lazy_children = False
 
     @property
     def parent(self):
@@ -143,7 +206,46 @@ class Base:
 
     def get_attrs(self, attrs, recursive=False) -> Any:
         """Get the requested attributes for the object."""
-        return self.flproxy.get_attrs(self.path, attrs, recursive)
+        cache = getattr(_attrs_cache, "attrs", None)
+        if cache is None or recursive:
+            return self.flproxy.get_attrs(self.path, attrs, recursive)
+        flproxy = self.flproxy
+        key = (id(flproxy), self.path)
+        cached = cache.get(key)
+        if cached is not None and all(attr in cached for attr in attrs):
+            return {attr: cached[attr] for attr in attrs}
+        ret = flproxy.get_attrs(self.path, attrs, recursive)
+        if isinstance(ret, collections.abc.Mapping):
+            cache.setdefault(key, {}).update(ret)
+        return ret
+
+    def prefetch_attrs(self, attrs: List[str]) -> None:
+        """Fetch the requested attributes for the object and all its
+        descendants in a single request.
+
+        The attributes are stored in the cache of the enclosing
+        ``settings_cache`` block, where they are used by the attribute
+        queries of the individual objects, such as ``is_active()``.
+
+        Parameters
+        ----------
+        attrs : List[str]
+            Names of the attributes, for example ``["active?", "read-only?"]``.
+
+        Raises
+        ------
+        RuntimeError
+            If called outside of a ``settings_cache`` block.
+        """
+        cache = getattr(_attrs_cache, "attrs", None)
+        if cache is None:
+            raise RuntimeError(
+                "prefetch_attrs must be called within a settings_cache block."
+            )
+        flproxy = self.flproxy
+        _cache_attrs(
+            cache, id(flproxy), self.path, flproxy.get_attrs(self.path, attrs, True)
+        )
 
     def get_attr(self, attr, attr_type_or_types=None) -> Any:
         """Get the requested attribute for the object."""
@@ -256,6 +358,7 @@ class SettingsBase(Base, Generic[StateT]):
 
     def set_state(self, state: StateT = None, **kwargs):
         """Set the state of the object."""
+        _clear_attrs_cache()
         if kwargs:
             return self.flproxy.set_var(self.path, self.to_scheme_keys(kwargs))
         else:
@@ -390,6 +493,8 @@ class Group(SettingsBase[DictStateType]):
     def __init__(self, name: str = None, parent=None):
         """__init__ of Group class."""
         super().__init__(name, parent)
+        if self._lazy_children:
+            return
         for child in self.child_names:
             cls = getattr(self.__class__, child)
             self._setattr(child, cls(None, self))
@@ -646,6 +751,8 @@ class NamedObject(SettingsBase[DictStateType], Generic[ChildTypeT]):
         """__init__ of NamedObject class."""
         super().__init__(name, parent)
         self._setattr("_objects", {})
+        if self._lazy_children:
+            return
         for cmd in self.command_names:
             cls = getattr(self.__class__, cmd)
             self._setattr(cmd, cls(None, self))
@@ -704,12 +811,14 @@ class NamedObject(SettingsBase[DictStateType], Generic[ChildTypeT]):
         old : str
             Current name.
         """
+        _clear_attrs_cache()
         self.flproxy.rename(self.path, new, old)
         if old in self._objects:
             del self._objects[old]
         self._create_child_object(new)
 
     def __delitem__(self, name: str):
+        _clear_attrs_cache()
         self.flproxy.delete(self.path, name)
         if name in self._objects:
             del self._objects[name]
@@ -811,6 +920,8 @@ class ListObject(SettingsBase[ListStateType], Generic[ChildTypeT]):
         """__init__ of ListObject class."""
         super().__init__(name, parent)
         self._setattr("_objects", [])
+        if self._lazy_children:
+            return
         for cmd in self.command_names:
             cls = getattr(self.__class__, cmd)
             self._setattr(cmd, cls(None, self))
@@ -865,6 +976,7 @@ class ListObject(SettingsBase[ListStateType], Generic[ChildTypeT]):
         size: int
             New size
         """
+        _clear_attrs_cache()
         self.flproxy.resize_list_object(self.path, size)
 
     def __getitem__(self, index: int) -> ChildTypeT:
@@ -948,6 +1060,7 @@ class Command(Action):
                         print("Enter y[es]/n[o]")
                 if response in ["n", "N", "no"]:
                     return
+        _clear_attrs_cache()
         return self.flproxy.execute_cmd(self._parent.path, self.obj_name, **newkwds)
 
 
@@ -1064,11 +1177,13 @@ class _CreatableNamedObjectMixin(collections.abc.MutableMapping, Generic[ChildTy
         Object
             Object that has been created.
         """
+        _clear_attrs_cache()
         self.flproxy.create(self.path, name)
         return self._create_child_object(name)
 
     def __setitem__(self, name: str, value):
         if name not in self.get_object_names():
+            _clear_attrs_cache()
             self.flproxy.create(self.path, name)
         child = self._objects.get(name)
         if not child:
@@ -1097,8 +1212,41 @@ class _HasAllowedValuesMixin:
             return []
 
 
-def get_cls(name, info, parent=None, version=None):
-    """Create a class for the object identified by "path"."""
+class _LazyChildClass:
+    """Descriptor which builds the class of a child object on first access.
+
+    Accessed through the parent class, the descriptor returns the child class.
+    Accessed through a parent object, it also creates the child object and
+    stores it on the parent object, which then takes precedence over the
+    descriptor.
+    """
+
+    def __init__(self, name: str, factory, create_object: bool = True):
+        """__init__ of _LazyChildClass class."""
+        self._name = name
+        self._factory = factory
+        self._create_object = create_object
+        self._cls = None
+        self._lock = threading.Lock()
+
+    def __get__(self, instance, owner):
+        if self._cls is None:
+            with self._lock:
+                if self._cls is None:
+                    self._cls = self._factory(owner)
+        if instance is None or not self._create_object:
+            return self._cls
+        obj = self._cls(None, instance)
+        instance._setattr(self._name, obj)
+        return obj
+
+
+def get_cls(name, info, parent=None, version=None, lazy=False):
+    """Create a class for the object identified by "path".
+
+    If ``lazy`` is ``True``, the classes of the children, commands, queries
+    and child object type are built when they are first accessed.
+    """
     try:
         if name == "":
             pname = "root"
@@ -1114,6 +1262,8 @@ def get_cls(name, info, parent=None, version=None):
             )
             base = String
         dct = {"fluent_name": name}
+        if lazy:
+            dct["_lazy_children"] = True
         helpinfo = info.get("help")
         if helpinfo:
             dct["__doc__"] = _clean_helpinfo(helpinfo)
@@ -1157,13 +1307,23 @@ def get_cls(name, info, parent=None, version=None):
 
         doc = ""
 
+        def _get_child_cls(cname, cinfo, ccls_name, owner):
+            ccls = get_cls(cname, cinfo, owner, version=version, lazy=True)
+            ccls.__name__ = ccls_name
+            return ccls
+
         def _process_cls_names(info_dict, names, write_doc=False):
             nonlocal taboo
             nonlocal cls
 
             for cname, cinfo in info_dict.items():
-                ccls = get_cls(cname, cinfo, cls, version=version)
-                ccls_name = ccls.__name__
+                # The documentation of arguments needs their classes upfront
+                if lazy and not write_doc:
+                    ccls = None
+                    ccls_name = to_python_name(cname)
+                else:
+                    ccls = get_cls(cname, cinfo, cls, version=version, lazy=lazy)
+                    ccls_name = ccls.__name__
 
                 i = 0
                 if write_doc:
@@ -1178,10 +1338,16 @@ def get_cls(name, info, parent=None, version=None):
                         ccls_name = ccls_name[: ccls_name.rfind("_")]
                     i += 1
                     ccls_name += f"_{str(i)}"
-                ccls.__name__ = ccls_name
-                names.append(ccls.__name__)
+                names.append(ccls_name)
                 taboo.add(ccls_name)
-                setattr(cls, ccls.__name__, ccls)
+                if ccls is None:
+                    ccls = _LazyChildClass(
+                        ccls_name,
+                        functools.partial(_get_child_cls, cname, cinfo, ccls_name),
+                    )
+                else:
+                    ccls.__name__ = ccls_name
+                setattr(cls, ccls_name, ccls)
 
         children = info.get("children")
         if children:
@@ -1211,13 +1377,23 @@ def get_cls(name, info, parent=None, version=None):
 
         object_type = info.get("object-type", False) or info.get("object_type", False)
         if object_type:
-            cls.child_object_type = get_cls(
-                "child-object-type", object_type, cls, version=version
-            )
-            cls.child_object_type.rename = lambda self, name: self._parent.rename(
-                name, self._name
-            )
-            cls.child_object_type.get_name = lambda self: self._name
+
+            def _get_child_object_type(owner):
+                child_object_type = get_cls(
+                    "child-object-type", object_type, owner, version=version, lazy=lazy
+                )
+                child_object_type.rename = lambda self, name: self._parent.rename(
+                    name, self._name
+                )
+                child_object_type.get_name = lambda self: self._name
+                return child_object_type
+
+            if lazy:
+                cls.child_object_type = _LazyChildClass(
+                    "child_object_type", _get_child_object_type, create_object=False
+                )
+            else:
+                cls.child_object_type = _get_child_object_type(cls)
     except Exception:
         print(
             f"Unable to construct class for '{name}' of "
@@ -1227,31 +1403,38 @@ def get_cls(name, info, parent=None, version=None):
     return cls
 
 
-def _gethash(obj_info):
-    dhash = hashlib.sha256()
-    dhash.update(pickle.dumps(obj_info))
-    return dhash.hexdigest()
+# Dynamically created root classes keyed by version and static-info hash,
+# shared by the sessions of this process
+_root_classes = {}
 
 
-def get_root(flproxy, version: str = "") -> Group:
+def get_root(flproxy, version: str = "", reduction=None) -> Group:
     """Get the root settings object.
 
     Parameters
     ----------
     flproxy: Proxy
         Object that interfaces with the Fluent backend.
+    version: str, optional
+        Fluent version.
+    reduction: Reduction, optional
+        Reduction service wrapper used by
+        ``ansys.fluent.core.solver.function.reduction`` for locations given
+        as settings objects.
 
     Returns
     -------
     root object
     """
     obj_info = flproxy.get_static_info()
+    get_static_info_hash = getattr(flproxy, "get_static_info_hash", None)
+    shash = (get_static_info_hash and get_static_info_hash()) or _gethash(obj_info)
     try:
         settings = importlib.import_module(
             f"ansys.fluent.core.solver.settings_{version}"
         )
 
-        if settings.SHASH != _gethash(obj_info):
+        if settings.SHASH != shash:
             settings_logger.warning(
                 "Mismatch between generated file and server object "
                 "info. Dynamically created settings classes will "
@@ -1260,10 +1443,15 @@ def get_root(flproxy, version: str = "") -> Group:
             raise RuntimeError("Mismatch in hash values")
         cls = settings.root
     except Exception:
-        cls = get_cls("", obj_info, version=version)
+        cls = _root_classes.get((version, shash))
+        if cls is None:
+            cls = _root_classes[(version, shash)] = get_cls(
+                "", obj_info, version=version, lazy=True
+            )
     root = cls()
     root.set_flproxy(flproxy)
     root._setattr("_static_info", obj_info)
+    root._setattr("_reduction", reduction)
     return root
 
 
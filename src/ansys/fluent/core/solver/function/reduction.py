@@ -1,6 +1,10 @@
 """Module providing reductions functions that can be applied to Fluent data
 from one or across multiple remote Fluent sessions.
 
+Reductions are evaluated through the Reduction service of each solver
+session. The area, volume, mass and mass flow extents used to combine
+results across sessions are cached until the case or data changes.
+
 The following parameters are relevant for the reduction functions. The
 expr parameter is not relevant to all reductions functions.
 
@@ -59,8 +63,43 @@ Examples
 19.28151
 """
 
+from concurrent.futures import ThreadPoolExecutor
+
 from numpy import array
 
+from ansys.fluent.core.services.datamodel_se import _convert_variant_to_value
+from ansys.fluent.core.solver.flobject import Base
+
+# Fluent reduction functions which have a native Reduction service rpc
+_NATIVE_REDUCTIONS = {
+    "Area": "area",
+    "AreaAve": "area_average",
+    "AreaInt": "area_integral",
+    "Centroid": "centroid",
+    "Count": "count",
+    "Force": "force",
+    "MassAve": "mass_average",
+    "MassFlowAve": "mass_flow_average",
+    "MassFlowInt": "mass_flow_integral",
+    "MassInt": "mass_integral",
+    "Maximum": "maximum",
+    "Minimum": "minimum",
+    "Moment": "moment",
+    "PressureForce": "pressure_force",
+    "ViscousForce": "viscous_force",
+    "Volume": "volume",
+    "VolumeAve": "volume_average",
+    "VolumeInt": "volume_integral",
+}
+
+# Extents which are cached by the Reduction service wrapper
+_NATIVE_EXTENTS = {
+    "Area": "area",
+    "Volume": "volume",
+    "Mass": "mass",
+    "MassFlow": "mass_flow",
+}
+
 
 class BadReductionRequest(Exception):
     def __init__(self, err):
@@ -154,8 +193,33 @@ def _expr_to_expr_str(expr):
     return getattr(expr, "definition", expr) if expr is not None else expr
 
 
+def _native_reduction(solver):
+    if isinstance(solver, Base):
+        # passed by the solver session to flobject.get_root
+        return solver.__dict__.get("_reduction")
+    return getattr(solver, "reduction", None)
+
+
+def _native_value(value):
+    if value.DESCRIPTOR.name == "Point":
+        return [value.x, value.y, value.z]
+    return _convert_variant_to_value(value)
+
+
 def _eval_reduction(solver, reduction, locations, expr=None):
     expr_str = _expr_to_expr_str(expr)
+    native = _native_reduction(solver)
+    if native is not None and reduction in _NATIVE_REDUCTIONS:
+        method = getattr(native, _NATIVE_REDUCTIONS[reduction])
+        try:
+            return _native_value(
+                method(locations)
+                if expr_str is None
+                else method(str(expr_str), locations)
+            )
+        except NotImplementedError:
+            # the Fluent server does not provide the rpc, evaluate an expression
+            pass
     return _eval_expr(
         solver,
         (
@@ -166,14 +230,42 @@ def _eval_reduction(solver, reduction, locations, expr=None):
     )
 
 
+def _eval_extent(solver, extent_name, locations):
+    native = _native_reduction(solver)
+    if native is not None and extent_name in _NATIVE_EXTENTS:
+        try:
+            return _native_value(native.extent(_NATIVE_EXTENTS[extent_name], locations))
+        except NotImplementedError:
+            # the Fluent server does not provide the rpc, evaluate an expression
+            pass
+    return _eval_reduction(solver, extent_name, locations)
+
+
+def _eval_per_solver(evaluate, locns, ctxt):
+    """Call ``evaluate(solver, names)`` for each solver of ``locns`` and
+    return the results in the order of ``locns``.
+
+    The solvers are evaluated concurrently when the locations span several
+    of them.
+    """
+    solvers_and_names = [(solver or _root(ctxt), names) for solver, names in locns]
+    if len(solvers_and_names) == 1:
+        return [evaluate(*solvers_and_names[0])]
+    with ThreadPoolExecutor(max_workers=len(solvers_and_names)) as executor:
+        return list(executor.map(lambda args: evaluate(*args), solvers_and_names))
+
+
 def _extent_expression(f_string, extent_name, expr, locations, ctxt):
     locns = _locns(locations, ctxt)
+
+    def evaluate(solver, names):
+        val = _eval_reduction(solver, f_string, names, expr)
+        extent = _eval_extent(solver, extent_name, names) if len(locns) > 1 else 1
+        return val, extent
+
     numerator = 0.0
     denominator = 0.0
-    for solver, names in locns:
-        solver = solver or _root(ctxt)
-        val = _eval_reduction(solver, f_string, names, expr)
-        extent = _eval_reduction(solver, extent_name, names) if len(locns) > 1 else 1
+    for val, extent in _eval_per_solver(evaluate, locns, ctxt):
         try:
             numerator += val * extent
             denominator += extent
@@ -187,9 +279,11 @@ def _extent_expression(f_string, extent_name, expr, locations, ctxt):
 def _extent_moment_vector(f_string, expr, locations, ctxt):
     locns = _locns(locations, ctxt)
     total = array([0.0, 0.0, 0.0])
-    for solver, names in locns:
-        solver = solver or _root(ctxt)
-        extent = _eval_reduction(solver, f_string, names, expr)
+    for extent in _eval_per_solver(
+        lambda solver, names: _eval_reduction(solver, f_string, names, expr),
+        locns,
+        ctxt,
+    ):
         try:
             total += array(extent)
         except TypeError:
@@ -208,9 +302,9 @@ def _extent_integrated_average(extent_name, expr, locations, ctxt):
 def _extent(extent_name, locations, ctxt):
     locns = _locns(locations, ctxt)
     total = 0.0
-    for solver, names in locns:
-        solver = solver or _root(ctxt)
-        extent = _eval_expr(solver, f"{extent_name}({names})")
+    for extent in _eval_per_solver(
+        lambda solver, names: _eval_extent(solver, extent_name, names), locns, ctxt
+    ):
         try:
             total += extent
         except TypeError:
@@ -221,9 +315,9 @@ def _extent(extent_name, locations, ctxt):
 def _extent_vectors(extent_name, locations, ctxt):
     locns = _locns(locations, ctxt)
     total = array([0.0, 0.0, 0.0])
-    for solver, names in locns:
-        solver = solver or _root(ctxt)
-        extent = _eval_expr(solver, f"{extent_name}({names})")
+    for extent in _eval_per_solver(
+        lambda solver, names: _eval_reduction(solver, extent_name, names), locns, ctxt
+    ):
         try:
             total += array(extent)
         except TypeError:
@@ -234,11 +328,13 @@ def _extent_vectors(extent_name, locations, ctxt):
 def _limit(limit, expr, locations, ctxt):
     locns = _locns(locations, ctxt)
     limit_val = None
-    for solver, names in locns:
-        solver = solver or _root(ctxt)
-        val = _eval_reduction(
+    for val in _eval_per_solver(
+        lambda solver, names: _eval_reduction(
             solver, "Minimum" if limit is min else "Maximum", names, expr
-        )
+        ),
+        locns,
+        ctxt,
+    ):
         limit_val = val if limit_val is None else limit(val, limit_val)
     return limit_val
 
@@ -1,13 +1,29 @@
-import threading
+import logging
 from typing import Callable
 
 from ansys.api.fluent.v0 import datamodel_se_pb2 as DataModelProtoModule
+import ansys.fluent.core as pyfluent
 from ansys.fluent.core.services.datamodel_se import _convert_variant_to_value
-from ansys.fluent.core.streaming_services.streaming import StreamingService
+from ansys.fluent.core.streaming_services.streaming import (
+    CallbackDispatcher,
+    DispatchPolicy,
+    StreamingService,
+)
+
+logger = logging.getLogger("pyfluent.datamodel")
 
 
 class DatamodelEvents(StreamingService):
-    """Encapsulates a datamodel events streaming service."""
+    """Encapsulates a datamodel events streaming service.
+
+    Streamed events are routed to their callback by subscription tag and run
+    outside of the stream thread, so slow callbacks do not stall the stream.
+    At most ``pyfluent.DATAMODEL_EVENTS_QUEUE_SIZE`` events wait for their
+    callbacks; once it is reached the oldest waiting event is dropped. This
+    can be changed with ``set_dispatch_policy``. Callbacks registered with
+    ``dispatch=False``, which keep client-side caches up to date, are never
+    queued or dropped.
+    """
 
     def __init__(self, service):
         """Initialize DatamodelEvents."""
@@ -18,18 +34,85 @@ class DatamodelEvents(StreamingService):
         )
         self._cbs = {}
         service.event_streaming = self
-        self._lock = threading.RLock()
+        self._dispatcher = CallbackDispatcher(
+            DispatchPolicy.DROP_OLDEST, pyfluent.DATAMODEL_EVENTS_QUEUE_SIZE
+        )
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of events waiting to be dispatched."""
+        return self.dispatch_metrics.queue_depth
+
+    @property
+    def dispatched_events(self) -> int:
+        """Number of events whose callback has run."""
+        return self.dispatch_metrics.dispatched
+
+    @property
+    def dropped_events(self) -> int:
+        """Number of events dropped because too many were waiting."""
+        return self.dispatch_metrics.dropped
 
-    def register_callback(self, tag: str, obj, cb: Callable):
-        """Register a callback."""
+    def register_callback(self, tag: str, obj, cb: Callable, dispatch: bool = True):
+        """Register a callback.
+
+        Parameters
+        ----------
+        tag : str
+            Subscription tag of the event.
+        obj : Any
+            Datamodel object of the subscription.
+        cb : Callable
+            Callback.
+        dispatch : bool, optional
+            Whether to run the callback outside of the stream thread. Otherwise
+            it is called with ``obj`` only, on the stream thread, as soon as the
+            event arrives. This is meant for cheap cache invalidation. The
+            default is ``True``.
+        """
         with self._lock:
-            self._cbs[tag] = obj, cb
+            self._cbs[tag] = obj, cb, dispatch
 
     def unregister_callback(self, tag: str):
         """Unregister a callback."""
         with self._lock:
             self._cbs.pop(tag, None)
 
+    def _enqueue(self, response: DataModelProtoModule.EventResponse) -> None:
+        with self._lock:
+            cb = self._cbs.get(response.tag)
+        if cb is None:
+            return
+        if not cb[2]:
+            try:
+                cb[1](cb[0])
+            except Exception:
+                logger.exception(
+                    f"Error in datamodel event callback for {response.tag}."
+                )
+            return
+        self._dispatch(response.tag, DatamodelEvents._call_callback, cb, response)
+
+    @staticmethod
+    def _call_callback(cb, response: DataModelProtoModule.EventResponse) -> None:
+        if response.HasField("createdEventResponse"):
+            childtype = response.createdEventResponse.childtype
+            childname = response.createdEventResponse.childname
+            child = getattr(cb[0], childtype)[childname]
+            cb[1](child)
+        elif (
+            response.HasField("modifiedEventResponse")
+            or response.HasField("deletedEventResponse")
+            or response.HasField("affectedEventResponse")
+            or response.HasField("attributeChangedEventResponse")
+            or response.HasField("commandAttributeChangedEventResponse")
+        ):
+            cb[1](cb[0])
+        elif response.HasField("commandExecutedEventResponse"):
+            command = response.commandExecutedEventResponse.command
+            args = _convert_variant_to_value(response.commandExecutedEventResponse.args)
+            cb[1](cb[0], command, args)
+
     def _process_streaming(self, id, stream_begin_method, started_evt, *args, **kwargs):
         """Processes datamodel events."""
         request = DataModelProtoModule.EventRequest(*args, **kwargs)
@@ -41,28 +124,6 @@ class DatamodelEvents(StreamingService):
                 response: DataModelProtoModule.EventResponse = next(responses)
                 with self._lock:
                     self._streaming = True
-                    for tag, cb in self._cbs.items():
-                        if tag == response.tag:
-                            if response.HasField("createdEventResponse"):
-                                childtype = response.createdEventResponse.childtype
-                                childname = response.createdEventResponse.childname
-                                child = getattr(cb[0], childtype)[childname]
-                                cb[1](child)
-                            elif (
-                                response.HasField("modifiedEventResponse")
-                                or response.HasField("deletedEventResponse")
-                                or response.HasField("affectedEventResponse")
-                                or response.HasField("attributeChangedEventResponse")
-                                or response.HasField(
-                                    "commandAttributeChangedEventResponse"
-                                )
-                            ):
-                                cb[1](cb[0])
-                            elif response.HasField("commandExecutedEventResponse"):
-                                command = response.commandExecutedEventResponse.command
-                                args = _convert_variant_to_value(
-                                    response.commandExecutedEventResponse.args
-                                )
-                                cb[1](cb[0], command, args)
+                self._enqueue(response)
             except StopIteration:
                 break
@@ -1,7 +1,7 @@
 """Module for events management."""
 from functools import partial
 import logging
-from typing import Callable, List
+from typing import Callable, Dict, List
 
 from ansys.api.fluent.v0 import events_pb2 as EventsProtoModule
 from ansys.fluent.core.streaming_services.streaming import StreamingService
@@ -37,6 +37,7 @@ class EventsManager(StreamingService):
         self._events_list: List[str] = [
             attr for attr in dir(EventsProtoModule) if attr.endswith("Event")
         ]
+        self._internal_callbacks: Dict[str, List[Callable]] = {}
 
     def _process_streaming(self, id, stream_begin_method, started_evt, *args, **kwargs):
         request = EventsProtoModule.BeginStreamingRequest(*args, **kwargs)
@@ -57,12 +58,27 @@ class EventsManager(StreamingService):
                         )
                         self._fluent_error_state.set("fatal", error_message)
                         continue
-                    callbacks_map = self._service_callbacks.get(event_name, {})
-                    for call_back in callbacks_map.values():
-                        call_back(
-                            session_id=self._session_id,
-                            event_info=getattr(response, event_name),
+                    internal_callbacks = list(
+                        self._internal_callbacks.get(event_name, [])
+                    )
+                    callbacks = list(
+                        self._service_callbacks.get(event_name, {}).items()
+                    )
+                event_info = getattr(response, event_name)
+                for call_back in internal_callbacks:
+                    try:
+                        call_back(session_id=self._session_id, event_info=event_info)
+                    except Exception:
+                        network_logger.exception(
+                            f"Error in internal callback {call_back}."
                         )
+                for callback_id, call_back in callbacks:
+                    self._dispatch(
+                        callback_id,
+                        call_back,
+                        session_id=self._session_id,
+                        event_info=event_info,
+                    )
             except StopIteration:
                 break
 
@@ -107,6 +123,20 @@ class EventsManager(StreamingService):
                     callback_id: partial(call_back, *args, **kwargs)
                 }
 
+    def _register_internal_callback(self, event_name: str, call_back: Callable):
+        """Register a callback which keeps client-side state up to date.
+
+        Unlike the callbacks registered with ``register_callback``, it runs on
+        the stream thread, before them and in order of registration, and it is
+        not subject to the dispatch policy.
+        """
+        if event_name not in self.events_list:
+            raise RuntimeError(f"{event_name} is not a valid event.")
+        with self._lock:
+            self._internal_callbacks.setdefault(event_name.lower(), []).append(
+                call_back
+            )
+
     def unregister_callback(self, callback_id: str):
         """Unregister the callback.
 
@@ -1,5 +1,6 @@
 """Module for Field data streaming."""
 
+import functools
 import threading
 from typing import Callable, Dict, List, Union
 
@@ -38,5 +39,31 @@ class FieldDataStreaming(StreamingService):
         )
 
     def callbacks(self) -> List[List[Union[Callable, List, Dict]]]:
-        """Get list of callbacks along with arguments and keyword arguments"""
-        return self._service_callbacks.values()
+        """Get list of callbacks along with arguments and keyword arguments.
+
+        Calling a returned callback queues the registered one to run outside
+        of the stream thread.
+        """
+        with self._lock:
+            callbacks = list(self._service_callbacks.items())
+        return [
+            [
+                functools.partial(self._dispatch_field, callback_id, callback),
+                args,
+                kwargs,
+            ]
+            for callback_id, (callback, args, kwargs) in callbacks
+        ]
+
+    def _dispatch_field(
+        self, callback_id, callback, surface_id, field_name, field, *args, **kwargs
+    ):
+        self._dispatch(
+            (callback_id, surface_id, field_name),
+            callback,
+            surface_id,
+            field_name,
+            field,
+            *args,
+            **kwargs,
+        )
@@ -1,15 +1,89 @@
 """Module for monitors management."""
 
 import threading
-from typing import Dict, List, Tuple, Union
+from typing import Dict, List, Optional, Sequence, Tuple, Union
 
 import numpy as np
 import pandas as pd
 
 from ansys.api.fluent.v0 import monitor_pb2 as MonitorModule
+import ansys.fluent.core as pyfluent
 from ansys.fluent.core.streaming_services.streaming import StreamingService
 
 
+class _MonitorSetBuffer:
+    """Growable columnar storage of the streamed values of one monitor set.
+
+    The x-axis values and the monitor values are kept in NumPy arrays which
+    grow geometrically, so appending an iteration has an amortized constant
+    cost. When ``max_history`` is set, only the values of the last
+    ``max_history`` iterations are kept and the arrays stop growing at twice
+    that size.
+    """
+
+    _initial_capacity = 64
+
+    def __init__(self, monitors: List[str], max_history: Optional[int] = None):
+        """__init__ method of _MonitorSetBuffer class."""
+        if max_history is not None and max_history < 1:
+            raise ValueError("max_history must be a positive integer.")
+        self.monitors = monitors
+        self.max_history = max_history
+        capacity = self._initial_capacity
+        if max_history is not None:
+            capacity = min(capacity, 2 * max_history)
+        self._xvalues = np.empty(capacity, dtype=np.int64)
+        self._values = np.empty((capacity, len(monitors)), dtype=np.float64)
+        self._size = 0
+
+    def __len__(self) -> int:
+        if self.max_history is None:
+            return self._size
+        return min(self._size, self.max_history)
+
+    def append(self, xvalue: int, values: Sequence[float]) -> None:
+        """Append the values of one iteration."""
+        if self._size == len(self._xvalues):
+            self._make_room()
+        self._xvalues[self._size] = xvalue
+        self._values[self._size] = values
+        self._size += 1
+
+    def _make_room(self) -> None:
+        size = self._size
+        capacity = 2 * size
+        if self.max_history is not None:
+            if size >= 2 * self.max_history:
+                # move the iterations still in the window to the front
+                keep = self.max_history - 1
+                self._xvalues[:keep] = self._xvalues[size - keep : size]
+                self._values[:keep] = self._values[size - keep : size]
+                self._size = keep
+                return
+            capacity = min(capacity, 2 * self.max_history)
+        xvalues = np.empty(capacity, dtype=self._xvalues.dtype)
+        xvalues[:size] = self._xvalues[:size]
+        values = np.empty((capacity, len(self.monitors)), dtype=self._values.dtype)
+        values[:size] = self._values[:size]
+        self._xvalues = xvalues
+        self._values = values
+
+    def arrays(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Views of the x-axis values and the monitor values in the window."""
+        start = self._size - len(self)
+        return self._xvalues[start : self._size], self._values[start : self._size]
+
+    def data_frame(self) -> pd.DataFrame:
+        """DataFrame of the monitor values indexed by the x-axis values."""
+        xvalues, values = self.arrays()
+        return pd.DataFrame(
+            values,
+            index=pd.Index(xvalues, name="xvalues"),
+            columns=self.monitors,
+            copy=True,
+        )
+
+
 class MonitorsManager(StreamingService):
     """Manages monitors (Fluent residuals and report definitions monitors).
 
@@ -31,7 +105,7 @@ class MonitorsManager(StreamingService):
         self._session_id: str = session_id
         self._lock_refresh: threading.Lock = threading.Lock()
         self._monitors_info = None
-        self._data_frames = {}
+        self._buffers: Dict[str, _MonitorSetBuffer] = {}
 
     def get_monitor_set_names(self) -> List[str]:
         """Get monitor set names.
@@ -46,7 +120,7 @@ class MonitorsManager(StreamingService):
             List of all monitor set names.
         """
         with self._lock:
-            return list(self._data_frames)
+            return list(self._buffers)
 
     def get_monitor_set_prop(self, monitor_set_name: str, property: str) -> str:
         """Get monitor set property.
@@ -83,8 +157,8 @@ class MonitorsManager(StreamingService):
             is empty. Otherwise, it returns the plot object, depending on the ``plotting.backend``.
         """
         with self._lock:
-            df = self._data_frames[monitor_set_name]["df"]
-            return None if df.empty else df.plot(*args, **kwargs)
+            df = self._buffers[monitor_set_name].data_frame()
+        return None if df.empty else df.plot(*args, **kwargs)
 
     def get_monitor_set_data(
         self, monitor_set_name, start_index: int = 0, end_index: int = None
@@ -107,18 +181,18 @@ class MonitorsManager(StreamingService):
             associating monitor names of type ``str`` to numpy arrays of y-axis values.
         """
         with self._lock:
-            df_data = self._data_frames[monitor_set_name]
-            try:
-                df = df_data["df"].iloc[start_index:end_index]
-            except IndexError:
+            buffer = self._buffers[monitor_set_name]
+            xvalues, values = buffer.arrays()
+            xvalues = xvalues[start_index:end_index]
+            if not len(xvalues):
                 return (np.array([]), {})
+            values = values[start_index:end_index]
             return (
-                (np.array([]), {})
-                if df.empty
-                else (
-                    df.index.to_numpy(),
-                    {column: df[[column]].to_numpy() for column in df.columns},
-                )
+                xvalues.copy(),
+                {
+                    monitor_name: values[:, [i]]
+                    for i, monitor_name in enumerate(buffer.monitors)
+                },
             )
 
     def refresh(self, session_id, event_info) -> None:
@@ -156,30 +230,26 @@ class MonitorsManager(StreamingService):
             try:
                 data_received = {}
                 response = next(responses)
-                x_axis_type = response.xaxisdata.xaxistype
                 x_axis_index = response.xaxisdata.xaxisindex
-                data_received["xvalues"] = x_axis_index
                 for y_axis_value in response.yaxisvalues:
                     data_received[y_axis_value.name] = y_axis_value.value
+                updated_monitor_sets = 0
                 with self._lock:
                     self._streaming = True
-                    for monitor_set_name, df_data in self._data_frames.items():
-                        df = df_data["df"]
-                        monitors = df_data["monitors"]
-                        monitor_data = []
-                        for monitor_name in monitors:
-                            if monitor_name not in data_received:
-                                monitor_data = []
-                                break
-                            monitor_data.append(data_received[monitor_name])
-
-                        if monitor_data:
-                            new_df = pd.DataFrame([monitor_data], columns=monitors)
-                            new_df.set_index("xvalues", inplace=True)
-                            df_data["df"] = pd.concat([df, new_df])
-                            for callback_map in self._service_callbacks.values():
-                                callback, args, kwargs = callback_map
-                                callback(*args, **kwargs)
+                    for buffer in self._buffers.values():
+                        try:
+                            monitor_data = [
+                                data_received[monitor_name]
+                                for monitor_name in buffer.monitors
+                            ]
+                        except KeyError:
+                            continue
+                        buffer.append(x_axis_index, monitor_data)
+                        updated_monitor_sets += 1
+                    callbacks = list(self._service_callbacks.items())
+                for _ in range(updated_monitor_sets):
+                    for callback_id, (callback, args, kwargs) in callbacks:
+                        self._dispatch(callback_id, callback, *args, **kwargs)
 
             except StopIteration:
                 break
@@ -187,11 +257,10 @@ class MonitorsManager(StreamingService):
     def _update_dataframe(self):
         with self._lock:
             self._monitors_info = self._streaming_service.get_monitors_info()
-            self._data_frames = {}
-            for monitor_set_name, monitor_set_info in self._monitors_info.items():
-                self._data_frames[monitor_set_name] = {}
-                monitors_name = list(monitor_set_info["monitors"]) + ["xvalues"]
-                df = pd.DataFrame([], columns=monitors_name)
-                df.set_index("xvalues", inplace=True)
-                self._data_frames[monitor_set_name]["df"] = df
-                self._data_frames[monitor_set_name]["monitors"] = monitors_name
+            self._buffers = {
+                monitor_set_name: _MonitorSetBuffer(
+                    list(monitor_set_info["monitors"]),
+                    max_history=pyfluent.MONITORS_MAX_HISTORY,
+                )
+                for monitor_set_name, monitor_set_info in self._monitors_info.items()
+            }
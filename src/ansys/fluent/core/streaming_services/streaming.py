@@ -1,6 +1,241 @@
+from collections import OrderedDict
+from concurrent.futures import Executor
+from enum import Enum
 import itertools
+import logging
 import threading
-from typing import Callable, Optional
+import time
+from typing import Callable, Hashable, Optional, Union
+
+import ansys.fluent.core as pyfluent
+
+network_logger = logging.getLogger("pyfluent.networking")
+
+
+class DispatchPolicy(Enum):
+    """Policy applied by a ``CallbackDispatcher`` when callbacks are queued
+    faster than they run."""
+
+    # Keep only the latest pending callback of each key.
+    COALESCE = "coalesce"
+    # Drop the oldest pending callback once the queue is full.
+    DROP_OLDEST = "drop_oldest"
+    # Block the stream until the queue has room.
+    BLOCK = "block"
+
+
+class DispatchMetrics:
+    """Metrics of a ``CallbackDispatcher``.
+
+    Attributes
+    ----------
+    queue_depth : int
+        Number of callbacks waiting to run.
+    max_queue_depth : int
+        Largest number of callbacks which have been waiting to run.
+    dispatched : int
+        Number of callbacks which have run.
+    dropped : int
+        Number of callbacks dropped because the queue was full.
+    coalesced : int
+        Number of callbacks replaced by a later one with the same key.
+    errors : int
+        Number of callbacks which raised an exception.
+    last_latency : float
+        Time between queueing and completion of the last callback, in seconds.
+    max_latency : float
+        Largest latency of a callback, in seconds.
+    total_latency : float
+        Sum of the latencies of all callbacks, in seconds.
+    """
+
+    def __init__(self):
+        """__init__ method of DispatchMetrics class."""
+        self.queue_depth = 0
+        self.max_queue_depth = 0
+        self.dispatched = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self.errors = 0
+        self.last_latency = 0.0
+        self.max_latency = 0.0
+        self.total_latency = 0.0
+
+    @property
+    def mean_latency(self) -> float:
+        """Returns the mean latency of the callbacks, in seconds."""
+        return self.total_latency / self.dispatched if self.dispatched else 0.0
+
+
+class CallbackDispatcher:
+    """Runs the callbacks of a streaming service outside of the stream thread.
+
+    Callbacks are queued by the stream thread and run in order by a
+    dispatcher thread, or handed from it to ``executor`` if one is given.
+    The queue holds at most ``max_queue_size`` callbacks; what happens when
+    it is full is decided by ``policy``. A callback which queues another one
+    while the queue is full drops the oldest queued callback even under the
+    ``BLOCK`` policy, since it would otherwise wait for itself.
+
+    Parameters
+    ----------
+    policy : DispatchPolicy or str, optional
+        Queueing policy. The default is ``pyfluent.STREAMING_DISPATCH_POLICY``.
+    max_queue_size : int, optional
+        Maximum number of queued callbacks. The default is
+        ``pyfluent.STREAMING_DISPATCH_QUEUE_SIZE``.
+    executor : Executor, optional
+        Executor running the callbacks. Callbacks run on an executor with
+        several workers can complete out of order.
+    max_workers : int, optional
+        Maximum number of callbacks handed to ``executor`` at a time, normally
+        its number of workers. The others wait in the queue. The default is
+        ``1``.
+    """
+
+    def __init__(
+        self,
+        policy: Optional[Union[DispatchPolicy, str]] = None,
+        max_queue_size: Optional[int] = None,
+        executor: Optional[Executor] = None,
+        max_workers: Optional[int] = None,
+    ):
+        """__init__ method of CallbackDispatcher class."""
+        self.policy = DispatchPolicy(policy or pyfluent.STREAMING_DISPATCH_POLICY)
+        self.max_queue_size = max_queue_size or pyfluent.STREAMING_DISPATCH_QUEUE_SIZE
+        self.executor = executor
+        self.max_workers = (max_workers or 1) if executor is not None else 1
+        self.metrics = DispatchMetrics()
+        self._pending = OrderedDict()
+        self._key_counter = itertools.count()
+        self._running = 0
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = False
+        self._in_callback = threading.local()
+
+    def submit(self, key: Optional[Hashable], fn: Callable, *args, **kwargs) -> None:
+        """Queue a callback.
+
+        Parameters
+        ----------
+        key : Hashable, optional
+            Key under which callbacks are coalesced by the ``COALESCE`` policy.
+        fn : Callable
+            Callback.
+        *args, **kwargs
+            Arguments of the callback.
+        """
+        item = (fn, args, kwargs, time.perf_counter())
+        metrics = self.metrics
+        with self._condition:
+            if self.policy is DispatchPolicy.COALESCE and key is not None:
+                key = ("key", key)
+                if key in self._pending:
+                    self._pending[key] = item
+                    metrics.coalesced += 1
+                    return
+            else:
+                key = ("seq", next(self._key_counter))
+            if self.policy is DispatchPolicy.BLOCK and not getattr(
+                self._in_callback, "value", False
+            ):
+                while len(self._pending) >= self.max_queue_size:
+                    self._ensure_thread()
+                    self._condition.wait()
+            elif len(self._pending) >= self.max_queue_size:
+                self._pending.popitem(last=False)
+                metrics.dropped += 1
+            self._pending[key] = item
+            metrics.queue_depth = len(self._pending)
+            metrics.max_queue_depth = max(metrics.max_queue_depth, metrics.queue_depth)
+            self._ensure_thread()
+            self._condition.notify_all()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Wait until all queued callbacks have run.
+
+        Returns
+        -------
+        bool
+            ``False`` if the timeout expired first.
+        """
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: not self._pending and not self._running, timeout
+            )
+
+    def stop(self, wait: bool = True) -> None:
+        """Stop the dispatcher thread once it has run the queued callbacks.
+
+        Parameters
+        ----------
+        wait : bool, optional
+            Whether to wait for the queued callbacks to run. Otherwise the
+            dispatcher thread runs them, and any queued in the meantime, in the
+            background and exits once the queue is empty. The default is
+            ``True``.
+        """
+        with self._condition:
+            thread = self._thread
+            if thread is None:
+                return
+            self._stopping = True
+            self._condition.notify_all()
+        if wait and thread is not threading.current_thread():
+            thread.join()
+
+    def _ensure_thread(self) -> None:
+        if self._thread is None:
+            self._stopping = False
+            self._thread = threading.Thread(target=self._dispatch, daemon=True)
+            self._thread.start()
+
+    def _dispatch(self) -> None:
+        while True:
+            with self._condition:
+                while not self._stopping and (
+                    not self._pending or self._running >= self.max_workers
+                ):
+                    self._condition.wait()
+                if not self._pending:
+                    # stopped and drained
+                    self._thread = None
+                    self._condition.notify_all()
+                    return
+                while self._running >= self.max_workers:
+                    self._condition.wait()
+                _, item = self._pending.popitem(last=False)
+                self.metrics.queue_depth = len(self._pending)
+                self._running += 1
+                self._condition.notify_all()
+            if self.executor is None:
+                self._run(item)
+            else:
+                self.executor.submit(self._run, item)
+
+    def _run(self, item) -> None:
+        fn, args, kwargs, queued_time = item
+        self._in_callback.value = True
+        try:
+            fn(*args, **kwargs)
+        except Exception:
+            network_logger.exception(f"Error in streaming callback {fn}.")
+            error = True
+        else:
+            error = False
+        finally:
+            self._in_callback.value = False
+        latency = time.perf_counter() - queued_time
+        metrics = self.metrics
+        with self._condition:
+            self._running -= 1
+            metrics.dispatched += 1
+            metrics.errors += error
+            metrics.last_latency = latency
+            metrics.max_latency = max(metrics.max_latency, latency)
+            metrics.total_latency += latency
+            self._condition.notify_all()
 
 
 class StreamingService:
@@ -19,6 +254,7 @@ class StreamingService:
         self._stream_thread: Optional[threading.Thread] = None
         self._service_callback_id = itertools.count()
         self._service_callbacks: dict = {}
+        self._dispatcher = CallbackDispatcher()
 
     @property
     def is_streaming(self):
@@ -26,6 +262,62 @@ class StreamingService:
         with self._lock:
             return self._streaming
 
+    @property
+    def dispatch_metrics(self) -> DispatchMetrics:
+        """Queue-depth and latency metrics of the callbacks."""
+        return self._dispatcher.metrics
+
+    def set_dispatch_policy(
+        self,
+        policy: Optional[Union[DispatchPolicy, str]] = None,
+        max_queue_size: Optional[int] = None,
+        executor: Optional[Executor] = None,
+        max_workers: Optional[int] = None,
+    ) -> None:
+        """Set how the callbacks are run outside of the stream thread.
+
+        Parameters
+        ----------
+        policy : DispatchPolicy or str, optional
+            Policy applied when callbacks are queued faster than they run:
+            ``"coalesce"`` keeps only the latest pending call of each callback,
+            ``"drop_oldest"`` drops the oldest pending call once the queue is
+            full and ``"block"`` makes the stream wait for room in the queue.
+            The default is ``pyfluent.STREAMING_DISPATCH_POLICY``.
+        max_queue_size : int, optional
+            Maximum number of pending calls. The default is
+            ``pyfluent.STREAMING_DISPATCH_QUEUE_SIZE``.
+        executor : Executor, optional
+            Executor running the callbacks. By default they run in order on
+            a dedicated thread.
+        max_workers : int, optional
+            Maximum number of callbacks running on ``executor`` at a time. The
+            default is ``1``.
+        """
+        dispatcher = CallbackDispatcher(policy, max_queue_size, executor, max_workers)
+        with self._lock:
+            self._dispatcher, previous = dispatcher, self._dispatcher
+        previous.stop()
+
+    def wait_for_callbacks(self, timeout: Optional[float] = None) -> bool:
+        """Wait until the queued callbacks have run.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            Maximum time to wait, in seconds.
+
+        Returns
+        -------
+        bool
+            ``False`` if the timeout expired first.
+        """
+        return self._dispatcher.wait(timeout)
+
+    def _dispatch(self, key: Optional[Hashable], fn: Callable, *args, **kwargs):
+        """Queue a callback to be run outside of the stream thread."""
+        self._dispatcher.submit(key, fn, *args, **kwargs)
+
     def register_callback(self, call_back: Callable, *args, **kwargs) -> str:
         """Register the callback.
 
@@ -84,6 +376,9 @@ class StreamingService:
             self._stream_thread.join()
             self._streaming = False
             self._stream_thread = None
+            # may be called from a callback of another stream, so the queued
+            # callbacks are left to run in the background
+            self._dispatcher.stop(wait=False)
 
     def refresh(self, session_id, event_info) -> None:
         """Refresh stream.
@@ -0,0 +1,11 @@
+"""Module providing hashing of picklable objects."""
+import hashlib
+import pickle
+from typing import Any
+
+
+def gethash(obj: Any) -> str:
+    """Get the SHA-256 hex digest of the pickled object."""
+    dhash = hashlib.sha256()
+    dhash.update(pickle.dumps(obj))
+    return dhash.hexdigest()
@@ -1,11 +1,21 @@
+import gzip
+import io
 from os.path import dirname, join
 import pathlib
 import shutil
+import time
+import tracemalloc
 
+import h5py
+import numpy as np
 import pytest
 
 from ansys.fluent.core import examples
-from ansys.fluent.core.filereader import lispy
+from ansys.fluent.core.filereader import case_file, lispy
+from ansys.fluent.core.filereader.case_file import (
+    _get_rp_vars_section,
+    _read_rp_vars_section,
+)
 from ansys.fluent.core.filereader.casereader import (
     CaseReader,
     InputParameter,
@@ -145,6 +155,96 @@ def test_processed_string():
     )
 
 
+_RP_VARS_SECTION = b"""(0 "Variables:")
+(37 (
+(case-config ((rp-seg? . #t) (rp-3d? . #t) (rp-double? . #f)))
+(number-of-iterations 42)
+(title "a (tricky) \\"title\\" ))")
+(named-expressions ())
+(parameters/output-parameters ())
+))"""
+
+
+def _write_legacy_case_file(filepath, open_file, mesh_size):
+    mesh = bytes(range(256)) * (mesh_size // 256)
+    with open_file(filepath, "wb") as file:
+        file.write(b'(0 "fluent")\n(2 3)\n(12 (0 1 ' + mesh[:1024] + b"))\n")
+        file.write(_RP_VARS_SECTION)
+        file.write(b"\n(13 (0 1 " + mesh + b"))\n")
+
+
+@pytest.mark.parametrize("suffix, open_file", [(".cas", open), (".cas.gz", gzip.open)])
+def test_casereader_reads_only_rp_vars_section(tmp_path, suffix, open_file):
+    mesh_size = 32 * 1024 * 1024
+    case_filepath = str(tmp_path / f"mesh{suffix}")
+    _write_legacy_case_file(case_filepath, open_file, mesh_size)
+    tracemalloc.start()
+    reader = CaseReader(case_filepath=case_filepath)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert reader.precision() == 1
+    assert reader.num_dimensions() == 3
+    assert reader.iter_count() == 42
+    assert reader.rp_var("title") == '"a (tricky) \\"title\\" ))"'
+    assert peak < mesh_size / 8
+
+
+def test_read_rp_vars_section_in_chunks():
+    data = b"(12 (\x28))" + _RP_VARS_SECTION + b"(13 ((("
+    expected = data[data.index(b"(37 (") : data.index(b"(13 (((")]
+    assert _get_rp_vars_section(data) == expected
+    for chunk_size in range(1, 12):
+        assert _read_rp_vars_section(io.BytesIO(data), chunk_size) == (
+            data.index(b"(37 ("),
+            expected,
+        )
+    with pytest.raises(RuntimeError):
+        _read_rp_vars_section(io.BytesIO(data[:-20]))
+    with pytest.raises(RuntimeError):
+        _get_rp_vars_section(b"(12 ())")
+
+
+def _write_h5_case_file(filepath, mesh_size):
+    with h5py.File(filepath, "w") as file:
+        file.create_dataset(
+            "settings/Rampant Variables",
+            data=np.array([_RP_VARS_SECTION[_RP_VARS_SECTION.index(b"(37 (") :]]),
+        )
+
+
+@pytest.mark.parametrize(
+    "suffix, write_case_file",
+    [
+        (".cas", lambda f, n: _write_legacy_case_file(f, open, n)),
+        (".cas.gz", lambda f, n: _write_legacy_case_file(f, gzip.open, n)),
+        (".cas.h5", _write_h5_case_file),
+    ],
+)
+def test_casereader_lazy_rp_vars(tmp_path, monkeypatch, suffix, write_case_file):
+    case_filepath = str(tmp_path / f"mesh{suffix}")
+    write_case_file(case_filepath, 1024 * 1024)
+    eager_reader = CaseReader(case_filepath=case_filepath)
+    reader = CaseReader(case_filepath=case_filepath, lazy=True, cache_index=True)
+    assert set(reader._rp_vars._values) == {"case-config"}
+    assert reader.precision() == 1
+    assert reader.num_dimensions() == 3
+    assert reader.has_rp_var("title")
+    assert not reader.has_rp_var("case")
+    assert set(reader._rp_vars._values) == {"case-config"}
+    assert reader.rp_var("number-of-iterations") == 42
+    assert reader.rp_vars() == eager_reader.rp_vars()
+    assert reader.config_vars() == eager_reader.config_vars()
+    assert pathlib.Path(f"{case_filepath}.rpvars-index.json").is_file()
+
+    def index_rp_vars_section(section):
+        raise AssertionError("The cached index is not used.")
+
+    monkeypatch.setattr(case_file, "_index_rp_vars_section", index_rp_vars_section)
+    reader = CaseReader(case_filepath=case_filepath, lazy=True, cache_index=True)
+    assert reader.iter_count() == 42
+    assert reader.rp_vars() == eager_reader.rp_vars()
+
+
 def test_casereader_no_file():
     with pytest.raises(FileNotFoundError):
         call_casereader("no_file.cas.h5")
@@ -259,3 +359,40 @@ def test_lispy_for_quotes():
         "x",
         '"\n(format \\"\n-------------------------\nRunning Original Settings\n------------------------\n\\")"',
     ]
+
+
+def test_lispy_for_multiline_string_with_escaped_quotes_and_comments():
+    assert lispy.parse('(a ; comment "\n"b  \n\\"c\\" d\n  e" ; "\nf)') == [
+        "a",
+        '"b\n\\"c\\" d\n  e"',
+        "f",
+    ]
+    with pytest.raises(SyntaxError):
+        lispy.parse('(a "b\nc')
+
+
+def test_lispy_tokenizer_is_linear_on_long_lines():
+    def _payload(count):
+        entries = " ".join(
+            f'(var-{i} ((a . {i}) (b . "s \\"{i}\\" (x)") (c #t 1.5 sym)))'
+            for i in range(count)
+        )
+        return f"(37 ({entries}))"
+
+    def _parse_time(payload):
+        elapsed = []
+        for _ in range(3):
+            start = time.perf_counter()
+            lispy.parse(payload)
+            elapsed.append(time.perf_counter() - start)
+        return min(elapsed)
+
+    rp_vars = lispy.parse(_payload(8000))[1]
+    assert len(rp_vars) == 8000
+    assert rp_vars[-1] == [
+        "var-7999",
+        [("a", 7999), ("b", '"s \\"7999\\" (x)"'), ["c", True, 1.5, "sym"]],
+    ]
+    # a 4 times longer line takes about 4 times as long, not 16 times
+    ratio = _parse_time(_payload(8000)) / _parse_time(_payload(2000))
+    assert ratio < 8
@@ -1,3 +1,6 @@
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter
+
 import pytest
 
 from ansys.api.fluent.v0.variant_pb2 import Variant
@@ -11,11 +14,19 @@ class Fake:
 
 
 def test_data_model_cache():
-    DataModelCache.set_state("x", Fake([("A", ""), ("x", "")]), 42.0)
-    assert 42.0 == DataModelCache.get_state("x", Fake([("A", ""), ("x", "")]))
-    assert dict(x=42.0) == DataModelCache.get_state("x", Fake([("A", "")]))
-    assert DataModelCache.Empty == DataModelCache.get_state("x", Fake([("B", "")]))
-    assert DataModelCache.Empty == DataModelCache.get_state("y", Fake([]))
+    cache = DataModelCache()
+    cache.set_state("x", Fake([("A", ""), ("x", "")]), 42.0)
+    assert 42.0 == cache.get_state("x", Fake([("A", ""), ("x", "")]))
+    assert dict(x=42.0) == cache.get_state("x", Fake([("A", "")]))
+    assert DataModelCache.Empty == cache.get_state("x", Fake([("B", "")]))
+    assert DataModelCache.Empty == cache.get_state("y", Fake([]))
+    state = cache.get_state("x", Fake([("A", "")]))
+    assert state is not cache.rules_str_to_cache["x"]["A"]
+    assert (
+        cache.read_state("x", Fake([("A", "")]), lambda state: state)
+        is cache.rules_str_to_cache["x"]["A"]
+    )
+    assert cache.read_state("x", Fake([("B", "")]), DataModelCache.is_unassigned)
 
 
 @pytest.mark.parametrize(
@@ -95,17 +106,24 @@ def test_data_model_cache():
             ["B:B1"],
             {"r1": {"B:B-2": {"__iname__": "B1", "_name_": "B-2", "C": 5.0}}},
         ),
+        (
+            {"r1": {"B:B-1": {"__iname__": "B1", "_name_": "B-1", "C": 5.0}}},
+            "r1",
+            {"B:B1": {"_name_": "B-2"}},
+            [],
+            {"r1": {"B:B-2": {"__iname__": "B1", "_name_": "B-2", "C": 5.0}}},
+        ),
     ],
 )
 def test_update_cache_display_names_as_keys(
     initial_cache, rules, state, deleted_paths, final_cache
 ):
-    DataModelCache.rules_str_to_cache.clear()
-    DataModelCache.rules_str_to_cache.update(initial_cache)
+    cache = DataModelCache()
+    cache.rules_str_to_cache.update(initial_cache)
     var = Variant()
     _convert_value_to_variant(state, var)
-    DataModelCache.update_cache(rules, var, deleted_paths)
-    assert DataModelCache.rules_str_to_cache == final_cache
+    cache.update_cache(rules, var, deleted_paths)
+    assert cache.rules_str_to_cache == final_cache
 
 
 @pytest.mark.parametrize(
@@ -189,13 +207,120 @@ def test_update_cache_display_names_as_keys(
 def test_update_cache_internal_names_as_keys(
     initial_cache, rules, state, deleted_paths, final_cache
 ):
-    DataModelCache.set_config("r1", "internal_names_as_keys", True)
-    DataModelCache.rules_str_to_cache.clear()
-    DataModelCache.rules_str_to_cache.update(initial_cache)
+    cache = DataModelCache()
+    cache.set_config("r1", "internal_names_as_keys", True)
+    cache.rules_str_to_cache.update(initial_cache)
     var = Variant()
     _convert_value_to_variant(state, var)
-    DataModelCache.update_cache(rules, var, deleted_paths)
-    assert DataModelCache.rules_str_to_cache == final_cache
+    cache.update_cache(rules, var, deleted_paths)
+    assert cache.rules_str_to_cache == final_cache
+
+
+def test_update_cache_named_object_index():
+    rules = "r1"
+    n = 10000
+    data_model_cache = DataModelCache()
+
+    def update(state, deleted_paths=()):
+        var = Variant()
+        _convert_value_to_variant(state, var)
+        data_model_cache.update_cache(rules, var, list(deleted_paths))
+
+    update({"A": {f"B:B{i}": {"_name_": f"B-{i}", "C": i} for i in range(n)}})
+    update(
+        {"A": {f"B:B{i}": {"C": -i} for i in range(1, n, 2)}},
+        [f"A/B:B{i}" for i in range(0, n, 2)],
+    )
+    cache = data_model_cache.rules_str_to_cache[rules]["A"]
+    update({"A": {"B:B1": {"_name_": "B-one"}, "C:B3": {"_name_": "C-3"}}})
+    assert len(cache) == n // 2 + 1
+    assert "B:B-1" not in cache
+    assert cache["B:B-one"] == {"__iname__": "B1", "_name_": "B-one", "C": -1}
+    assert cache["B:B-3"] == {"__iname__": "B3", "_name_": "B-3", "C": -3}
+    assert cache["C:C-3"] == {"__iname__": "B3", "_name_": "C-3"}
+    assert cache.inames == {
+        k.split(":")[0] + ":" + v["__iname__"]: k for k, v in cache.items()
+    }
+
+
+def test_update_cache_named_object_cost_is_independent_of_siblings():
+    def diff_time(n):
+        data_model_cache = DataModelCache()
+
+        def update(state, deleted_paths=()):
+            var = Variant()
+            _convert_value_to_variant(state, var)
+            data_model_cache.update_cache("r1", var, list(deleted_paths))
+
+        update({"A": {f"B:B{i}": {"_name_": f"B-{i}", "C": i} for i in range(n)}})
+        elapsed = []
+        for suffix in ("x", "y", "z"):
+            # modify, rename and delete 100 of the n named objects
+            start = perf_counter()
+            update(
+                {
+                    "A": {
+                        f"B:B{i}": {"_name_": f"B-{i}-{suffix}", "C": -i}
+                        for i in range(100)
+                    }
+                },
+                [f"A/B:B{i}" for i in range(100, 200)],
+            )
+            elapsed.append(perf_counter() - start)
+            update({"A": {f"B:B{i}": {"_name_": f"B-{i}"} for i in range(100, 200)}})
+        return min(elapsed)
+
+    # scanning or rebuilding the parent would take about 16 times as long
+    assert diff_time(16000) / diff_time(1000) < 4
+
+
+def test_update_cache_from_stream_syncs_cache():
+    cache = DataModelCache()
+    var = Variant()
+    _convert_value_to_variant({"A": {"B": 1}}, var)
+    cache.update_cache("r1", var, [])
+    assert not cache.is_synced("r1")
+    cache.update_cache_from_stream("r1", var, [])
+    assert cache.is_synced("r1")
+    assert not cache.is_synced("r2")
+    assert cache.get_state("r1", Fake([("A", "")])) == {"B": 1}
+    cache.set_synced("r1", False)
+    assert not cache.is_synced("r1")
+
+
+def test_data_model_cache_per_session_and_thread_safe():
+    caches = [DataModelCache(), DataModelCache()]
+    caches[0].set_config("meshing", "internal_names_as_keys", True)
+    assert not caches[1].get_config("meshing", "internal_names_as_keys")
+
+    def write(cache, offset):
+        for i in range(500):
+            var = Variant()
+            _convert_value_to_variant({"A": {"B": offset + i, "C": [offset + i]}}, var)
+            cache.update_cache("meshing", var, [])
+
+    def read(cache):
+        for _ in range(500):
+            state = cache.get_state("meshing", Fake([("A", "")]))
+            if not DataModelCache.is_unassigned(state):
+                assert state["C"] == [state["B"]]
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = [
+            executor.submit(write, cache, 1000 * i) for i, cache in enumerate(caches)
+        ]
+        futures += [executor.submit(read, cache) for cache in caches for _ in range(3)]
+        for future in futures:
+            future.result()
+
+    state = caches[0].get_state("meshing", Fake([("A", "")]))
+    assert state == {"B": 499, "C": [499]}
+    assert caches[1].get_state("meshing", Fake([("A", "")])) == {
+        "B": 1499,
+        "C": [1499],
+    }
+    state["B"] = 0
+    assert caches[0].get_state("meshing", Fake([("A", "")]))["B"] == 499
 
 
 @pytest.mark.fluent_version(">=23.1")
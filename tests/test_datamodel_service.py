@@ -1,15 +1,29 @@
-from time import sleep
+import threading
+from time import perf_counter, sleep
+import tracemalloc
 
 import pytest
 from util.meshing_workflow import new_mesh_session  # noqa: F401
 
 from ansys.api.fluent.v0 import datamodel_se_pb2
+from ansys.api.fluent.v0.variant_pb2 import Variant
 import ansys.fluent.core as pyfluent
 from ansys.fluent.core import examples
+from ansys.fluent.core.data_model_cache import DataModelCache
 from ansys.fluent.core.services.datamodel_se import (
+    DatamodelService,
+    LazyPyMenuChild,
+    PyCommand,
+    PyMenu,
+    PyNamedObjectContainer,
+    PyTextual,
+    _convert_value_to_variant,
     _convert_variant_to_value,
     convert_path_to_se_path,
 )
+from ansys.fluent.core.streaming_services.datamodel_event_streaming import (
+    DatamodelEvents,
+)
 from ansys.fluent.core.streaming_services.datamodel_streaming import DatamodelStream
 
 
@@ -306,3 +320,358 @@ def test_get_object_names_wtm(new_mesh_session):
     ]
 
     assert meshing.workflow.TaskObject.get_object_names() == child_object_names
+
+
+class _Root(PyMenu):
+    def __init__(self, service, rules, path):
+        super().__init__(service, rules, path)
+
+    class TaskObject(PyNamedObjectContainer):
+        class _TaskObject(PyMenu):
+            def __init__(self, service, rules, path):
+                super().__init__(service, rules, path)
+
+    TaskObject = LazyPyMenuChild(TaskObject)
+
+    class Name(PyTextual):
+        pass
+
+    Name = LazyPyMenuChild(Name)
+
+    class InitializeWorkflow(PyCommand):
+        pass
+
+    InitializeWorkflow = LazyPyMenuChild(InitializeWorkflow)
+
+
+def test_lazy_datamodel_children():
+    service = object()
+    root = _Root(service, "workflow", [])
+    assert not {"TaskObject", "Name", "InitializeWorkflow"} & set(root.__dict__)
+    assert _Root.TaskObject._TaskObject.__name__ == "_TaskObject"
+
+    assert isinstance(root.TaskObject, _Root.TaskObject)
+    assert root.TaskObject.path == [("TaskObject", "")]
+    assert root.Name.path == [("Name", "")]
+    assert root.Name.rules == "workflow"
+    assert root.InitializeWorkflow.command == "InitializeWorkflow"
+    assert root.InitializeWorkflow.path == []
+    assert root.Name is root.__dict__["Name"]
+
+
+def _create_all_children(menu):
+    # what the generated __init__ methods did before the children were lazy
+    for name, attr in vars(type(menu)).items():
+        if isinstance(attr, LazyPyMenuChild):
+            _create_all_children(getattr(menu, name))
+    return menu
+
+
+def _measure(create):
+    tracemalloc.start()
+    start = perf_counter()
+    create()
+    elapsed = perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+@pytest.mark.nightly
+@pytest.mark.codegen_required
+@pytest.mark.fluent_version(">=23.2")
+def test_meshing_first_access_benchmark(new_mesh_session, record_property):
+    session = new_mesh_session
+    # the generated module is imported by the first access
+    meshing = session.meshing
+    root = type(meshing)
+    eager_elapsed, eager_peak = _measure(
+        lambda: _create_all_children(root(meshing.service, meshing.rules, meshing.path))
+    )
+    lazy_elapsed, lazy_peak = _measure(
+        lambda: root(meshing.service, meshing.rules, meshing.path)
+    )
+    record_property("eager_elapsed", eager_elapsed)
+    record_property("eager_peak", eager_peak)
+    record_property("lazy_elapsed", lazy_elapsed)
+    record_property("lazy_peak", lazy_peak)
+    assert lazy_elapsed * 10 < eager_elapsed
+    assert lazy_peak * 10 < eager_peak
+    assert not any(
+        isinstance(child, (PyMenu, PyCommand, PyNamedObjectContainer))
+        for child in vars(meshing).values()
+    )
+
+
+class _FakeNamedObjectService:
+    def __init__(self, parent_state):
+        self.parent_state = parent_state
+        self.calls = []
+        self.event_streaming = self
+        self.events = {}
+        self.callbacks = {}
+        self.cache = DataModelCache()
+        self._name_indices = {}
+
+    unsubscribe_all_events = DatamodelService.unsubscribe_all_events
+
+    def register_callback(self, tag, obj, cb, dispatch=True):
+        self.callbacks[tag] = obj, cb, dispatch
+
+    def unregister_callback(self, tag):
+        self.callbacks.pop(tag, None)
+
+    def unsubscribe_events(self, request):
+        response = datamodel_se_pb2.UnsubscribeEventsResponse()
+        response.response.add(status=datamodel_se_pb2.STATUS_UNSUBSCRIBED)
+        return response
+
+    def subscribe_events(self, request):
+        self.calls.append("subscribe_events")
+        response = datamodel_se_pb2.SubscribeEventsResponse()
+        for _ in request.eventrequest:
+            response.response.add(
+                status=datamodel_se_pb2.STATUS_SUBSCRIBED,
+                tag=f"tag{len(self.events) + len(response.response)}",
+            )
+        return response
+
+    def get_specs(self, request):
+        self.calls.append("get_specs")
+        response = datamodel_se_pb2.GetSpecsResponse()
+        response.member.singleton.members.extend(self.parent_state)
+        return response
+
+    def get_state(self, request):
+        self.calls.append("get_state")
+        response = datamodel_se_pb2.GetStateResponse()
+        _convert_value_to_variant(self.parent_state, response.state)
+        return response
+
+
+def test_named_object_listing_is_batched():
+    service = _FakeNamedObjectService(
+        {
+            f"TaskObject:TaskObject{i}": {"_name_": f"Task {i}", "State": "Up-to-date"}
+            for i in range(1, 101)
+        }
+    )
+    task_object = _Root(service, "workflow", []).TaskObject
+
+    assert len(task_object) == 100
+    assert service.calls.count("get_specs") == 1
+    assert service.calls.count("get_state") == 1
+    # created and affected events of the parent, with one request
+    assert service.calls.count("subscribe_events") == 1
+    assert len(service.events) == 2
+    assert all(not dispatch for _, _, dispatch in service.callbacks.values())
+    service.calls.clear()
+
+    # the index is shared by the containers of the same parent
+    assert len(_Root(service, "workflow", []).TaskObject) == 100
+    assert not service.calls
+
+    assert task_object.get_object_names()[:2] == ["Task 1", "Task 2"]
+    assert "Task 50" in task_object
+    assert task_object["Task 50"].path == [("TaskObject", "Task 50")]
+    assert [x.path[-1][1] for x in task_object][-1] == "Task 100"
+    assert not service.calls
+
+    service.parent_state["TaskObject:TaskObject101"] = {"_name_": "Task 101"}
+    for obj, cb, _ in list(service.callbacks.values()):
+        cb(obj)
+    assert not service.calls
+    assert len(task_object) == 101
+    assert sorted(service.calls) == ["get_specs", "get_state"]
+    service.calls.clear()
+
+    with pytest.raises(LookupError):
+        task_object["Task 0"]
+    assert sorted(service.calls) == ["get_specs", "get_state"]
+    service.calls.clear()
+
+    service.unsubscribe_all_events()
+    assert not service.events and not service.callbacks
+    assert len(task_object) == 101
+    assert sorted(service.calls) == ["get_specs", "get_state", "subscribe_events"]
+
+
+def test_named_object_index_is_dropped_when_unsubscribing_fails():
+    service = _FakeNamedObjectService({"TaskObject:TaskObject1": {"_name_": "Task 1"}})
+    assert len(_Root(service, "workflow", []).TaskObject) == 1
+    assert service._name_indices and service.events
+    unsubscribe_events = service.unsubscribe_events
+
+    def fail_once(request):
+        service.unsubscribe_events = unsubscribe_events
+        raise RuntimeError("Fluent server has exited.")
+
+    service.unsubscribe_events = fail_once
+    with pytest.raises(RuntimeError):
+        service.unsubscribe_all_events()
+    assert not service._name_indices and not service.events
+
+
+def test_named_object_listing_from_datamodel_cache():
+    service = _FakeNamedObjectService(
+        {
+            f"TaskObject:TaskObject{i}": {"_name_": f"Task {i}", "State": "Up-to-date"}
+            for i in range(1, 4)
+        }
+    )
+    task_object = _Root(service, "workflow", []).TaskObject
+
+    def update(state, from_stream=True):
+        var = Variant()
+        _convert_value_to_variant(state, var)
+        if from_stream:
+            service.cache.update_cache_from_stream("workflow", var, [])
+        else:
+            service.cache.update_cache("workflow", var, [])
+
+    def invalidate():
+        for obj, cb, _ in list(service.callbacks.values()):
+            cb(obj)
+        service.calls.clear()
+
+    # a cache which is not synced with the server is not used
+    update({"TaskObject:TaskObject2": {"_name_": "Stale"}}, from_stream=False)
+    assert task_object.get_object_names() == ["Task 1", "Task 2", "Task 3"]
+    assert "get_state" in service.calls
+
+    service.cache.rules_str_to_cache.clear()
+    update(service.parent_state)
+    invalidate()
+    assert task_object.get_object_names() == ["Task 1", "Task 2", "Task 3"]
+    assert service.calls == ["get_specs"]
+
+    # a renamed object keeps the position given by the server
+    update({"TaskObject:TaskObject1": {"_name_": "Task one"}})
+    invalidate()
+    assert task_object._get_name_index() == {
+        "Task one": "TaskObject1",
+        "Task 2": "TaskObject2",
+        "Task 3": "TaskObject3",
+    }
+    assert list(task_object._get_name_index()) == ["Task one", "Task 2", "Task 3"]
+    assert "Task 3" in task_object
+    assert service.calls == ["get_specs"]
+
+    service.cache.set_synced("workflow", False)
+    invalidate()
+    assert task_object.get_object_names() == ["Task 1", "Task 2", "Task 3"]
+    assert sorted(service.calls) == ["get_specs", "get_state"]
+
+
+class _FakeEventStreamingService:
+    def __init__(self, responses, callback_entered):
+        self.responses = responses
+        self.callback_entered = callback_entered
+
+    def begin_streaming(self, request, started_evt, id, stream_begin_method):
+        started_evt.set()
+        yield self.responses[0]
+        self.callback_entered.wait()
+        yield from self.responses[1:]
+
+    def end_streaming(self, id, stream_begin_method):
+        pass
+
+
+def test_datamodel_events_dispatch(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(pyfluent, "DATAMODEL_EVENTS_QUEUE_SIZE", 2)
+    callback_entered = threading.Event()
+    release_callback = threading.Event()
+    responses = []
+    for tag in ["tag0"] * 5 + ["unknown"]:
+        response = datamodel_se_pb2.EventResponse(tag=tag)
+        response.modifiedEventResponse.SetInParent()
+        responses.append(response)
+    events = DatamodelEvents(_FakeEventStreamingService(responses, callback_entered))
+    data = []
+
+    def slow_callback(obj):
+        data.append(obj)
+        callback_entered.set()
+        release_callback.wait()
+
+    for i in range(1000):
+        events.register_callback(f"tag{i}", i, slow_callback)
+    events.start()
+    events._stream_thread.join(timeout=5)
+    assert not events._stream_thread.is_alive()
+    assert events.queue_depth == 2
+    assert events.dropped_events == 2
+    release_callback.set()
+    events.stop()
+    assert events.wait_for_callbacks(timeout=5)
+    assert data == [0, 0, 0]
+    assert events.dispatched_events == 3
+    assert events.queue_depth == 0
+
+    # the dispatch policy of the datamodel events can be changed
+    events.set_dispatch_policy("coalesce")
+    assert events.dispatch_metrics.dispatched == 0
+    release_callback.clear()
+    callback_entered.clear()
+    data.clear()
+    events.start()
+    events._stream_thread.join(timeout=5)
+    release_callback.set()
+    assert events.wait_for_callbacks(timeout=5)
+    assert data == [0, 0]
+    assert events.dispatch_metrics.coalesced == 3
+    events.stop()
+
+
+def test_datamodel_events_invalidation_is_never_dropped(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setattr(pyfluent, "DATAMODEL_EVENTS_QUEUE_SIZE", 1)
+    callback_entered = threading.Event()
+    release_callback = threading.Event()
+    responses = []
+    for tag in ["tag0"] * 3 + ["tag1"] * 3:
+        response = datamodel_se_pb2.EventResponse(tag=tag)
+        response.modifiedEventResponse.SetInParent()
+        responses.append(response)
+    events = DatamodelEvents(_FakeEventStreamingService(responses, callback_entered))
+    invalidated = []
+
+    def stopping_callback(obj):
+        callback_entered.set()
+        release_callback.wait()
+        # must not block on the full queue or join its own thread
+        events.stop()
+
+    events.register_callback("tag0", 0, stopping_callback)
+    events.register_callback("tag1", 1, invalidated.append, dispatch=False)
+    events.start()
+    events._stream_thread.join(timeout=5)
+    assert not events._stream_thread.is_alive()
+    assert invalidated == [1, 1, 1]
+    assert events.queue_depth == 1
+    assert events.dropped_events == 1
+    release_callback.set()
+    assert events.wait_for_callbacks(timeout=5)
+    assert events.dispatched_events == 2
+
+
+def test_datamodel_events_restart_after_stop_from_callback():
+    callback_entered = threading.Event()
+    callback_entered.set()
+    response = datamodel_se_pb2.EventResponse(tag="tag0")
+    response.modifiedEventResponse.SetInParent()
+    events = DatamodelEvents(_FakeEventStreamingService([response], callback_entered))
+    delivered = threading.Semaphore(0)
+
+    def callback(obj):
+        # stopped with nothing left in the queue
+        events.stop()
+        delivered.release()
+
+    events.register_callback("tag0", 0, callback)
+    for _ in range(3):
+        events.start()
+        assert delivered.acquire(timeout=5)
+    events.stop()
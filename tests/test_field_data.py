@@ -1,14 +1,29 @@
+import threading
+import time
+
 import numpy as np
 import pytest
 from util.solver_workflow import new_solver_session  # noqa: F401
 
+from ansys.api.fluent.v0 import field_data_pb2 as FieldDataProtoModule
 from ansys.fluent.core import examples
 from ansys.fluent.core.services.field_data import (
+    BaseFieldData,
+    ChunkParser,
+    FacesConnectivity,
+    FieldData,
+    FieldDataCache,
+    FieldInfo,
+    ScalarFieldData,
     ScalarFieldNameError,
     ScalarFieldUnavailable,
     SurfaceDataType,
     SurfaceNameError,
+    VectorFieldData,
     VectorFieldNameError,
+    Vertices,
+    _extract_fields,
+    get_fields_request,
 )
 
 HOT_INLET_TEMPERATURE = 313.15
@@ -363,3 +378,366 @@ def test_field_info_validators(new_solver_session) -> None:
     with pytest.raises(SurfaceNameError) as surface_error:
         solver.field_info.validate_surfaces(["out"])
     assert surface_error.value.surface_name == "out"
+
+
+def test_field_data_containers_are_array_backed() -> None:
+    with pytest.raises(TypeError):
+        BaseFieldData(3, np.array([1.0, 2.0, 3.0]))
+
+    scalar_data = ScalarFieldData(3, np.array([1.0, 2.0, 3.0]))
+    assert scalar_data.size == 3
+    assert scalar_data[1].scalar_data == 2.0
+    assert scalar_data[-1].scalar_data == 3.0
+    assert scalar_data.array is scalar_data._array
+    assert scalar_data._data is None
+
+    raw_vertices = np.arange(12, dtype=np.float32)
+    vertices = Vertices(3, raw_vertices)
+    assert vertices.array.shape == (4, 3)
+    assert np.shares_memory(vertices.array, raw_vertices)
+    assert vertices[2].y == 7.0
+    assert [vertex.z for vertex in vertices[1:3]] == [5.0, 8.0]
+
+    vector_data = VectorFieldData(3, np.arange(6, dtype=np.float64), 2.0)
+    assert vector_data.size == 2
+    assert vector_data.scale == 2.0
+    assert vector_data[1].x == 3.0
+
+    with pytest.raises(IndexError):
+        vertices[4]
+
+
+@pytest.mark.parametrize(
+    "stream,offsets,indices",
+    [
+        ([], [0], []),
+        ([2, 0, 1, 2, 1, 2], [0, 2, 4], [0, 1, 1, 2]),
+        (
+            [4, 12, 13, 17, 16, 3, 1, 2, 3, 2, 5, 6],
+            [0, 4, 7, 9],
+            [12, 13, 17, 16, 1, 2, 3, 5, 6],
+        ),
+        ([3, 0, 1, 2, 1, 3], [0, 3, 4], [0, 1, 2, 3]),
+    ],
+)
+def test_faces_connectivity_offsets_and_indices(stream, offsets, indices) -> None:
+    faces = FacesConnectivity(1, np.array(stream, dtype=np.int32))
+    assert faces.offsets.tolist() == offsets
+    assert faces.indices.tolist() == indices
+    assert faces.size == len(offsets) - 1
+    for i, face in enumerate(faces.data):
+        assert face.node_count == offsets[i + 1] - offsets[i]
+        assert face.node_indices.tolist() == indices[offsets[i] : offsets[i + 1]]
+
+
+def _field_chunks(surface_id, field_name, values, chunk_elements=2):
+    field_info = FieldDataProtoModule.PayloadInfo(
+        surfaceId=surface_id,
+        fieldName=field_name,
+        fieldType=FieldDataProtoModule.FieldType.DOUBLE_ARRAY,
+        fieldSize=len(values),
+        fieldRequestInfo=FieldDataProtoModule.FieldRequestInfo(
+            surfaceRequest=FieldDataProtoModule.SurfaceRequest(surfaceId=surface_id)
+        ),
+    )
+    chunks = [FieldDataProtoModule.GetFieldsResponse(payloadInfo=field_info)]
+    values = np.array(values, dtype=np.float64)
+    for i in range(0, len(values), chunk_elements):
+        chunks.append(
+            FieldDataProtoModule.GetFieldsResponse(
+                bytePayload=values[i : i + chunk_elements].tobytes()
+            )
+        )
+    return chunks
+
+
+def test_chunk_parser_assembles_multi_group_fields() -> None:
+    chunks = (
+        _field_chunks(1, "vertices", [1.0, 2.0, 3.0])
+        + _field_chunks(2, "vertices", [7.0])
+        + _field_chunks(1, "vertices", [4.0, 5.0])
+        + _field_chunks(1, "vertices", [6.0])
+    )
+    parser = ChunkParser()
+    fields = parser.extract_fields(iter(chunks))
+    surface_data = fields[(("type", "surface-data"),)]
+    assert surface_data[1]["vertices"].tolist() == [1.0, 2.0, 3.0, 4.0, 5.0, 6.0]
+    assert surface_data[2]["vertices"].tolist() == [7.0]
+    assert parser.statistics.fields == 2
+    assert parser.statistics.payload_groups == 4
+    assert parser.statistics.bytes_received == 7 * 8
+    # one copy per payload group plus one buffer growth for surface 1
+    assert parser.statistics.copies == 5
+
+
+def test_chunk_parser_iter_fields() -> None:
+    chunks = (
+        _field_chunks(1, "vertices", [1.0, 2.0, 3.0])
+        + _field_chunks(2, "vertices", [4.0, 5.0, 6.0, 7.0, 8.0])
+        + _field_chunks(3, "vertices", [9.0])
+    )
+    fields = [
+        (tag, surface_id, field_name, field.tolist())
+        for tag, surface_id, field_name, field in ChunkParser().iter_fields(
+            iter(chunks)
+        )
+    ]
+    tag = (("type", "surface-data"),)
+    assert fields == [
+        (tag, 1, "vertices", [1.0, 2.0, 3.0]),
+        (tag, 2, "vertices", [4.0, 5.0, 6.0, 7.0, 8.0]),
+        (tag, 3, "vertices", [9.0]),
+    ]
+
+    parser = ChunkParser()
+    fields = [
+        field for _, _, _, field in parser.iter_fields(iter(chunks), reuse_buffers=True)
+    ]
+    assert np.shares_memory(fields[1], fields[2])
+    assert parser.statistics.fields == 3
+    assert parser.statistics.copies == 4
+
+    chunks = (
+        _field_chunks(1, "vertices", [1.0, 2.0])
+        + _field_chunks(1, "vertices", [3.0])
+        + _field_chunks(2, "vertices", [4.0])
+        + _field_chunks(2, "vertices", [5.0, 6.0])
+    )
+    parser = ChunkParser()
+    fields = [
+        (surface_id, field.tolist())
+        for _, surface_id, _, field in parser.iter_fields(
+            iter(chunks), reuse_buffers=True
+        )
+    ]
+    assert fields == [(1, [1.0, 2.0, 3.0]), (2, [4.0, 5.0, 6.0])]
+    assert parser.statistics.fields == 2
+    assert parser.statistics.payload_groups == 4
+
+
+def test_field_data_cache_lru_and_invalidation() -> None:
+    cache = FieldDataCache()
+    assert not cache.enabled
+    cache.put(("scalar-field", 1, "temperature", True, False), np.zeros(4))
+    assert len(cache) == 0
+
+    cache.max_bytes = 64
+    geometry_key = ("surface-data", 1, "vertices", False)
+    field_key = ("scalar-field", 1, "temperature", True, False)
+    vertices = np.zeros(4)
+    cache.put(geometry_key, vertices)
+    cache.put(field_key, np.ones(4))
+    assert cache.nbytes == 64
+    assert cache.get(geometry_key) is not None
+    assert not cache.get(geometry_key).flags.writeable
+    # the caller's array is left writeable and is not shared with the cache
+    vertices[0] = 1.0
+    assert cache.get(geometry_key)[0] == 0.0
+
+    cache.put(("scalar-field", 2, "temperature", True, False), np.ones(2))
+    assert cache.get(field_key) is None
+    assert cache.get(geometry_key) is not None
+    assert cache.nbytes == 48
+
+    cache.invalidate_fields()
+    assert len(cache) == 1 and cache.get(geometry_key) is not None
+    cache.invalidate()
+    assert len(cache) == 0 and cache.nbytes == 0
+
+
+def test_field_data_requests_only_uncached_surfaces() -> None:
+    class _Service:
+        def __init__(self):
+            self.requested_surface_ids = []
+
+        def get_scalar_fields_info(self, request):
+            return FieldDataProtoModule.GetFieldsInfoResponse(
+                fieldInfo=[
+                    FieldDataProtoModule.FieldInfo(
+                        solverName="temperature", section="Temperature..."
+                    )
+                ]
+            )
+
+        def get_fields(self, request):
+            surface_ids = [r.surfaceId for r in request.scalarFieldRequest]
+            self.requested_surface_ids.append(surface_ids)
+            chunks = []
+            for surface_id in surface_ids:
+                chunks += _field_chunks(surface_id, "temperature", [surface_id] * 3)
+            return iter(chunks)
+
+    service = _Service()
+    field_data = FieldData(service, FieldInfo(service, lambda: True), lambda: True)
+    field_data.get_scalar_field_data("temperature", surface_ids=[1, 2])
+    field_data.get_scalar_field_data("temperature", surface_ids=[1, 2])
+    assert service.requested_surface_ids == [[1, 2], [1, 2]]
+
+    field_data.cache.max_bytes = 1024
+    field_data.get_scalar_field_data("temperature", surface_ids=[1])
+    data = field_data.get_scalar_field_data("temperature", surface_ids=[1, 2])
+    assert service.requested_surface_ids[2:] == [[1], [2]]
+    assert data[2].array.tolist() == [2.0, 2.0, 2.0]
+
+    field_data.get_scalar_field_data("temperature", surface_ids=[1, 2])
+    field_data.get_scalar_field_data("temperature", surface_ids=[1], node_value=False)
+    assert service.requested_surface_ids[4:] == [[1]]
+
+    field_data.cache.invalidate_fields()
+    field_data.get_scalar_field_data("temperature", surface_ids=[2])
+    assert service.requested_surface_ids[5:] == [[2]]
+
+
+def test_field_data_caches_vector_scale_per_vector_field() -> None:
+    class _Service:
+        def get_vector_fields_info(self, request):
+            return FieldDataProtoModule.GetVectorFieldsInfoResponse(
+                vectorFieldInfo=[
+                    FieldDataProtoModule.VectorFieldInfo(displayName=name)
+                    for name in ("velocity", "relative-velocity")
+                ]
+            )
+
+        def get_fields(self, request):
+            chunks = []
+            for r in request.vectorFieldRequest:
+                scale = 2.0 if r.vectorFieldName == "velocity" else 3.0
+                chunks += _field_chunks(r.surfaceId, r.vectorFieldName, [scale] * 3)
+                chunks += _field_chunks(r.surfaceId, "vector-scale", [scale])
+            return iter(chunks)
+
+    class _SchemeEval:
+        def string_eval(self, expression):
+            pass
+
+    service = _Service()
+    field_data = FieldData(
+        service, FieldInfo(service, lambda: True), lambda: True, _SchemeEval()
+    )
+    field_data.cache.max_bytes = 1024
+    for _ in range(2):
+        for name, scale in (("velocity", 2.0), ("relative-velocity", 3.0)):
+            data = field_data.get_vector_field_data(name, surface_ids=[1])[1]
+            assert data.scale == scale
+
+
+def test_field_info_validates_names_from_metadata_snapshot() -> None:
+    class _Service:
+        def __init__(self):
+            self.surface_names = [f"surface-{i}" for i in range(500)]
+            self.calls = 0
+
+        def get_surfaces_info(self, request):
+            self.calls += 1
+            return FieldDataProtoModule.GetSurfacesInfoResponse(
+                surfaceInfo=[
+                    FieldDataProtoModule.SurfaceInfo(
+                        surfaceName=name,
+                        surfaceId=[FieldDataProtoModule.SurfaceId(id=i)],
+                    )
+                    for i, name in enumerate(self.surface_names)
+                ]
+            )
+
+    service = _Service()
+    field_info = FieldInfo(service, lambda: True)
+    field_data = FieldData(service, field_info, lambda: True)
+    transaction = field_data.new_transaction()
+    transaction.add_surfaces_request(surface_names=service.surface_names)
+    field_info.validate_surfaces(service.surface_names)
+    assert service.calls == 1
+    assert len(transaction._fields_request.surfaceRequest) == 500
+
+    service.surface_names.append("new-surface")
+    transaction.add_surfaces_request(surface_names=["new-surface"])
+    assert service.calls == 2
+    assert transaction._fields_request.surfaceRequest[-1].surfaceId == 500
+
+    with pytest.raises(SurfaceNameError):
+        transaction.add_surfaces_request(surface_names=["unknown-surface"])
+    assert service.calls == 3
+
+    field_info.invalidate_metadata()
+    field_info.validate_surfaces(["surface-0"])
+    assert service.calls == 4
+
+
+def test_field_request_sharded_over_concurrent_streams() -> None:
+    class _Service:
+        def __init__(self):
+            self.requests = []
+            self._lock = threading.Lock()
+
+        def get_fields(self, request):
+            with self._lock:
+                self.requests.append(request)
+            chunks = []
+            for surface_request in request.surfaceRequest:
+                surface_id = surface_request.surfaceId
+                chunks += _field_chunks(surface_id, "vertices", [surface_id] * 3)
+            return iter(chunks)
+
+    service = _Service()
+    fields_request = get_fields_request()
+    fields_request.surfaceRequest.extend(
+        [FieldDataProtoModule.SurfaceRequest(surfaceId=i) for i in range(10)]
+    )
+    fields = _extract_fields(service, fields_request, max_concurrent_streams=4)
+    assert len(service.requests) == 4
+    assert sorted(
+        r.surfaceId for request in service.requests for r in request.surfaceRequest
+    ) == list(range(10))
+    surface_data = fields[(("type", "surface-data"),)]
+    assert sorted(surface_data) == list(range(10))
+    assert all(surface_data[i]["vertices"].tolist() == [i] * 3 for i in range(10))
+
+    service.requests.clear()
+    _extract_fields(service, fields_request)
+    assert service.requests == [fields_request]
+
+
+@pytest.mark.nightly
+@pytest.mark.fluent_version(">=23.2")
+def test_field_data_concurrent_streams_throughput(new_solver_session) -> None:
+    solver = new_solver_session
+    import_filename = examples.download_file(
+        "mixing_elbow.msh.h5", "pyfluent/mixing_elbow"
+    )
+    solver.file.read(file_type="case", file_name=import_filename)
+    solver.solution.initialization.hybrid_initialize()
+
+    field_data = solver.field_data
+    surface_ids = sorted(
+        info["surface_id"][0] for info in solver.field_info.get_surfaces_info().values()
+    )
+    for surface_count in (1, len(surface_ids) // 2, len(surface_ids)):
+        reference = None
+        throughputs = {}
+        for streams in (1, 2, 4):
+            transaction = field_data.new_transaction()
+            transaction.max_concurrent_streams = streams
+            transaction.add_surfaces_request(surface_ids=surface_ids[:surface_count])
+            transaction.add_scalar_fields_request(
+                field_name="absolute-pressure", surface_ids=surface_ids[:surface_count]
+            )
+            start_time = time.perf_counter()
+            fields = transaction.get_fields()
+            elapsed_time = time.perf_counter() - start_time
+            nbytes = sum(
+                field.nbytes
+                for payload_data in fields.values()
+                for surface_data in payload_data.values()
+                for field in surface_data.values()
+            )
+            assert nbytes > 0
+            throughputs[streams] = nbytes / elapsed_time
+            if reference is None:
+                reference = fields
+            for tag, payload_data in reference.items():
+                for surface_id, surface_data in payload_data.items():
+                    for field_name, field in surface_data.items():
+                        assert np.array_equal(
+                            fields[tag][surface_id][field_name], field
+                        )
+        # sharding over concurrent streams must not slow the transfer down
+        assert max(throughputs[2], throughputs[4]) > 0.5 * throughputs[1]
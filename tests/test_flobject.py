@@ -10,6 +10,7 @@ from util.solver_workflow import new_solver_session_no_transcript  # noqa: F401
 from ansys.fluent.core.examples import download_file
 from ansys.fluent.core.solver import flobject
 from ansys.fluent.core.solver.flobject import find_children
+from ansys.fluent.core.solver.function.reduction import _native_reduction
 
 
 class Setting:
@@ -500,6 +501,14 @@ def test_command():
     assert r.g_1.r_1() == 2.4 + 2.3 - 2.3 + 3.2 - 4.5
 
 
+def test_root_reduction():
+    r = flobject.get_root(Proxy())
+    assert _native_reduction(r) is None
+    reduction = object()
+    r = flobject.get_root(Proxy(), reduction=reduction)
+    assert _native_reduction(r) is reduction
+
+
 def test_attrs():
     r = flobject.get_root(Proxy())
     assert r.g_1.s_4.get_attr("active?")
@@ -511,6 +520,107 @@ def test_attrs():
     assert einfo.value.args == ("Object is not active",)
 
 
+class _CountingProxy(Proxy):
+    def __init__(self):
+        super().__init__()
+        self.get_attrs_calls = 0
+
+    def get_attrs(self, path, attrs, recursive=False):
+        self.get_attrs_calls += 1
+        if recursive:
+            return self._get_attrs_recursive(self.get_obj(path), attrs)
+        return super().get_attrs(path, attrs, recursive)
+
+    def _get_attrs_recursive(self, obj, attrs):
+        ret = {"attrs": obj.get_attrs([attr for attr in attrs if attr in obj.attrs])}
+        if isinstance(obj, Group):
+            ret["group_children"] = {
+                name: self._get_attrs_recursive(child, attrs)
+                for name, child in obj.objs.items()
+            }
+        elif isinstance(obj, NamedObject):
+            ret["named_object_children"] = {
+                name: self._get_attrs_recursive(child, attrs)
+                for name, child in obj._objs.items()
+            }
+        elif isinstance(obj, ListObject):
+            ret["list_object_children"] = [
+                self._get_attrs_recursive(child, attrs) for child in obj._objs
+            ]
+        return ret
+
+
+def test_settings_cache():
+    proxy = _CountingProxy()
+    r = flobject.get_root(proxy)
+    r.g_1.s_4.get_attr("active?")
+    r.g_1.s_4.get_attr("active?")
+    assert proxy.get_attrs_calls > 2
+
+    with flobject.settings_cache():
+        proxy.get_attrs_calls = 0
+        for _ in range(3):
+            assert r.g_1.s_4.get_attr("active?")
+            assert r.g_1.s_4.get_attr("allowed-values") == ["foo", "bar"]
+        calls = proxy.get_attrs_calls
+        with flobject.settings_cache():
+            r.g_1.s_4.get_attr("active?")
+        r.g_1.s_4.get_attr("active?")
+        assert proxy.get_attrs_calls == calls
+
+        r.g_1.b_3 = True
+        assert not r.g_1.s_4.get_attr("active?")
+        assert proxy.get_attrs_calls > calls
+
+    calls = proxy.get_attrs_calls
+    r.g_1.s_4.get_attr("active?")
+    assert proxy.get_attrs_calls > calls
+
+
+def test_prefetch_attrs():
+    proxy = _CountingProxy()
+    r = flobject.get_root(proxy)
+    r.n_1["n1"] = {}
+    r.l_1.resize(2)
+    with pytest.raises(RuntimeError):
+        r.prefetch_attrs(["active?"])
+
+    with flobject.settings_cache():
+        r.prefetch_attrs(["active?", "allowed-values"])
+        proxy.get_attrs_calls = 0
+        assert r.g_1.get_active_child_names() == ["r_1", "i_2", "b_3", "s_4"]
+        assert r.g_1.s_4.get_attr("allowed-values") == ["foo", "bar"]
+        assert r.n_1["n1"].is_active()
+        assert r.l_1[1].is_active()
+        assert proxy.get_attrs_calls == 0
+
+        r.g_1.b_3 = True
+        assert r.g_1.get_active_child_names() == ["r_1", "i_2", "b_3"]
+        assert proxy.get_attrs_calls > 0
+
+
+def test_lazy_get_cls():
+    info = Proxy.get_static_info()
+    eager_cls = flobject.get_cls("", info)
+    lazy_cls = flobject.get_cls("", info, lazy=True)
+    assert isinstance(lazy_cls.__dict__["g_1"], flobject._LazyChildClass)
+    assert isinstance(lazy_cls.__dict__["n_1"], flobject._LazyChildClass)
+    assert lazy_cls.child_names == eager_cls.child_names
+    assert lazy_cls.command_names == eager_cls.command_names
+
+    r = lazy_cls()
+    r.set_flproxy(Proxy())
+    assert "g_1" not in r.__dict__
+    assert lazy_cls.__dict__["n_1"]._cls is None
+    r.g_1.r_1 = 3.2
+    assert r.g_1.r_1() == 3.2
+    assert r.__dict__["g_1"] is r.g_1
+    assert r.g_1.__class__ is lazy_cls.g_1
+    r.n_1["n1"] = {"rl_1": [1.2]}
+    assert r.n_1["n1"].rl_1() == [1.2]
+    assert find_children(r) == find_children(eager_cls())
+
+
 # The following test is commented out as codegen module is not packaged in the
 # install
 def _disabled_test_settings_gen():
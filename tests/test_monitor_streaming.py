@@ -0,0 +1,107 @@
+import threading
+import time
+
+import numpy as np
+
+from ansys.api.fluent.v0 import monitor_pb2 as MonitorModule
+import ansys.fluent.core as pyfluent
+from ansys.fluent.core.streaming_services.monitor_streaming import MonitorsManager
+
+
+class _FakeMonitorsService:
+    def __init__(self, monitors_info, iterations):
+        self.monitors_info = monitors_info
+        self.iterations = iterations
+
+    def get_monitors_info(self):
+        return self.monitors_info
+
+    def begin_streaming(self, request, started_evt, id, stream_begin_method):
+        started_evt.set()
+        for iteration in range(1, self.iterations + 1):
+            response = MonitorModule.StreamingResponse()
+            response.xaxisdata.xaxisindex = iteration
+            for name in ("continuity", "x-velocity", "cd"):
+                response.yaxisvalues.add(name=name, value=iteration * 0.5)
+            yield response
+
+
+def _stream(iterations, max_history=None, callback=None):
+    monitors_info = {
+        "residual": {"monitors": ["continuity", "x-velocity"]},
+        "report": {"monitors": ["cd"]},
+        "missing": {"monitors": ["cl"]},
+    }
+    manager = MonitorsManager(
+        "session", _FakeMonitorsService(monitors_info, iterations)
+    )
+    default_max_history = pyfluent.MONITORS_MAX_HISTORY
+    pyfluent.MONITORS_MAX_HISTORY = max_history
+    try:
+        manager._prepare()
+    finally:
+        pyfluent.MONITORS_MAX_HISTORY = default_max_history
+    if callback:
+        manager.register_callback(callback, manager)
+    manager._process_streaming("id", "BeginStreaming", threading.Event())
+    return manager
+
+
+def test_monitors_manager_data():
+    manager = _stream(100)
+    assert manager.get_monitor_set_names() == ["residual", "report", "missing"]
+
+    xvalues, yvalues = manager.get_monitor_set_data("residual", 10, 20)
+    assert xvalues.tolist() == list(range(11, 21))
+    assert list(yvalues) == ["continuity", "x-velocity"]
+    assert yvalues["continuity"].shape == (10, 1)
+    assert yvalues["x-velocity"][:, 0].tolist() == [i * 0.5 for i in range(11, 21)]
+
+    xvalues, yvalues = manager.get_monitor_set_data("report", start_index=-3)
+    assert xvalues.tolist() == [98, 99, 100]
+    assert yvalues["cd"][:, 0].tolist() == [49.0, 49.5, 50.0]
+
+    assert manager.get_monitor_set_data("missing")[0].size == 0
+    assert manager.get_monitor_set_data("residual", 200)[0].size == 0
+
+    df = manager._buffers["residual"].data_frame()
+    assert df.index.name == "xvalues"
+    assert list(df.columns) == ["continuity", "x-velocity"]
+    assert df.index.tolist() == list(range(1, 101))
+
+
+def test_monitors_manager_max_history():
+    manager = _stream(1000, max_history=30)
+    xvalues, yvalues = manager.get_monitor_set_data("residual")
+    assert xvalues.tolist() == list(range(971, 1001))
+    assert np.array_equal(yvalues["continuity"][:, 0], xvalues * 0.5)
+    assert len(manager._buffers["residual"]._xvalues) == 60
+
+
+def test_monitors_manager_append_is_constant_time():
+    start = time.perf_counter()
+    manager = _stream(50000)
+    elapsed = time.perf_counter() - start
+    xvalues, _ = manager.get_monitor_set_data("residual", start_index=-1)
+    assert xvalues.tolist() == [50000]
+    # appending by concatenating DataFrames took minutes for this history
+    assert elapsed < 20
+
+
+def test_monitors_manager_callbacks_run_off_stream_thread():
+    stream_thread = threading.current_thread()
+    calls = []
+
+    def callback(manager):
+        assert threading.current_thread() is not stream_thread
+        # the manager is not locked while its callbacks run
+        xvalues, _ = manager.get_monitor_set_data("residual", start_index=-1)
+        calls.append(xvalues[0])
+
+    manager = _stream(100, callback=callback)
+    assert manager.wait_for_callbacks(timeout=10)
+    # called for each of the two monitor sets updated on each iteration
+    assert len(calls) == 200
+    assert calls == sorted(calls)
+    assert manager.dispatch_metrics.dispatched == 200
+    assert manager.dispatch_metrics.errors == 0
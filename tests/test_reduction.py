@@ -1,7 +1,20 @@
+import threading
+from types import SimpleNamespace
+
+import grpc
 import pytest
 from util.fixture_fluent import load_static_mixer_case  # noqa: F401
 
-from ansys.fluent.core.services.reduction import _locn_names_and_objs
+from ansys.api.fluent.v0 import batch_ops_pb2
+from ansys.api.fluent.v0 import reduction_pb2 as ReductionProtoModule
+from ansys.fluent.core.services.error_handler import catch_grpc_error
+from ansys.fluent.core.services.reduction import (
+    BadReductionRequest,
+    Reduction,
+    ReductionService,
+    _locn_names_and_objs,
+)
+from ansys.fluent.core.solver.function import reduction as reduction_functions
 
 load_static_mixer_case_2 = load_static_mixer_case
 
@@ -317,3 +330,196 @@ def test_reductions(load_static_mixer_case, load_static_mixer_case_2) -> None:
     _test_error_handling(solver1)
     _test_force(solver1)
     _test_moment(solver1)
+
+
+class _FakeBatchOpsStub:
+    def __init__(self):
+        self.calls = []
+
+    def Execute(self, requests, metadata=None):
+        requests = list(requests)
+        self.calls.append(requests)
+        for request in requests:
+            request_cls = getattr(ReductionProtoModule, f"{request.method}Request")
+            reduction_request = request_cls.FromString(request.request_body)
+            if "missing" in reduction_request.locations:
+                yield batch_ops_pb2.ExecuteResponse(status=batch_ops_pb2.STATUS_FAILED)
+                continue
+            response = getattr(ReductionProtoModule, f"{request.method}Response")()
+            response.value.string_state = ",".join(
+                [request.method, getattr(reduction_request, "expression", "")]
+                + list(reduction_request.locations)
+            )
+            yield batch_ops_pb2.ExecuteResponse(
+                status=batch_ops_pb2.STATUS_SUCCESSFUL,
+                response_body=response.SerializeToString(),
+            )
+
+
+def test_reduction_batch() -> None:
+    service = ReductionService(
+        grpc.insecure_channel("localhost:0"), [], SimpleNamespace(name="")
+    )
+    stub = service._batch_ops_stub = _FakeBatchOpsStub()
+    reduction = Reduction(service)
+
+    with reduction.batch() as batch:
+        area = batch.area(["inlet1"])
+        area_average = batch.area_average("AbsolutePressure", locations=["inlet2"])
+        failed = batch.maximum("Temperature", ["missing"])
+        invalid = batch.add("not_a_reduction", ["inlet1"])
+        assert not area.done()
+    assert len(stub.calls) == 1
+    assert [request.method for request in stub.calls[0]] == [
+        "Area",
+        "AreaAve",
+        "Maximum",
+    ]
+    assert area.result().string_state == "Area,,inlet1"
+    assert area_average.result().string_state == "AreaAve,AbsolutePressure,inlet2"
+    assert isinstance(failed.exception(), BadReductionRequest)
+    with pytest.raises(BadReductionRequest):
+        invalid.result()
+
+    values = reduction.evaluate_many(
+        [
+            ("volume", ["fluid"]),
+            ("minimum", "Temperature", ["missing"]),
+            ("mass_flow_integral", "Density", ["outlet"]),
+        ],
+        return_exceptions=True,
+    )
+    assert len(stub.calls) == 2
+    assert values[0].string_state == "Volume,,fluid"
+    assert isinstance(values[1], BadReductionRequest)
+    assert values[2].string_state == "MassFlowInt,Density,outlet"
+    with pytest.raises(BadReductionRequest):
+        reduction.evaluate_many([("minimum", "Temperature", ["missing"])])
+
+
+class _FakeReductionService:
+    def __init__(self, values, barrier=None):
+        self.values = values
+        self.calls = []
+        self.barrier = barrier
+
+    def _respond(self, method, request):
+        self.calls.append((method, tuple(request.locations)))
+        if self.barrier:
+            self.barrier.wait(timeout=10)
+        response = getattr(ReductionProtoModule, f"{method}Response")()
+        response.value.double_state = self.values[method][request.locations[0]]
+        return response
+
+    def area(self, request):
+        return self._respond("Area", request)
+
+    def area_average(self, request):
+        return self._respond("AreaAve", request)
+
+    def maximum(self, request):
+        return self._respond("Maximum", request)
+
+
+class _FakeSolver:
+    def __init__(self, values, barrier=None):
+        self.reduction = Reduction(_FakeReductionService(values, barrier))
+
+    @property
+    def setup(self):
+        raise AssertionError("named expressions must not be used")
+
+
+class _FakeLocation:
+    def __init__(self, name, solver):
+        self.obj_name = name
+        self._parent = solver
+
+
+def test_reduction_functions_use_native_rpcs_and_cache_extents() -> None:
+    solver1 = _FakeSolver({"Area": {"inlet1": 1.0}, "AreaAve": {"inlet1": 10.0}})
+    solver2 = _FakeSolver({"Area": {"inlet2": 3.0}, "AreaAve": {"inlet2": 20.0}})
+    locations = [_FakeLocation("inlet1", solver1), _FakeLocation("inlet2", solver2)]
+    service1 = solver1.reduction.service
+
+    for _ in range(3):
+        assert reduction_functions.area_average("p", locations) == 17.5
+    assert reduction_functions.area(locations) == 4.0
+    assert (
+        service1.calls
+        == [("AreaAve", ("inlet1",)), ("Area", ("inlet1",))]
+        + [("AreaAve", ("inlet1",))] * 2
+    )
+
+    solver1.reduction.invalidate_cache()
+    service1.values["Area"]["inlet1"] = 3.0
+    assert reduction_functions.area_average("p", locations) == 15.0
+    assert service1.calls[-2:] == [("AreaAve", ("inlet1",)), ("Area", ("inlet1",))]
+
+
+def test_reduction_functions_evaluate_solvers_concurrently() -> None:
+    # every rpc waits until one is in flight in each solver
+    barrier = threading.Barrier(4)
+    solvers = [
+        _FakeSolver(
+            {
+                "Area": {f"inlet{i}": float(i)},
+                "AreaAve": {f"inlet{i}": 10.0 * i},
+                "Maximum": {f"inlet{i}": float(i % 3)},
+            },
+            barrier,
+        )
+        for i in range(1, 5)
+    ]
+    locations = [
+        _FakeLocation(f"inlet{i}", solver) for i, solver in enumerate(solvers, 1)
+    ]
+
+    assert reduction_functions.area_average("p", locations) == 30.0
+    assert reduction_functions.area(locations) == 10.0
+    assert reduction_functions.maximum("p", locations) == 2.0
+    assert not barrier.broken
+
+
+class _RpcError(grpc.RpcError):
+    def __init__(self, code):
+        self._code = code
+
+    def code(self):
+        return self._code
+
+    def details(self):
+        return self._code.name
+
+
+class _FailingReductionService:
+    def __init__(self, code):
+        self.code = code
+
+    @catch_grpc_error
+    def area_average(self, request):
+        raise _RpcError(self.code)
+
+
+def test_reduction_functions_fall_back_only_for_unimplemented_rpcs(
+    monkeypatch,
+) -> None:
+    expressions = []
+
+    def eval_expr(solver, expr_str):
+        expressions.append(expr_str)
+        return 1.0
+
+    monkeypatch.setattr(reduction_functions, "_eval_expr", eval_expr)
+    solver = SimpleNamespace(
+        reduction=Reduction(_FailingReductionService(grpc.StatusCode.UNIMPLEMENTED))
+    )
+    location = _FakeLocation("inlet1", solver)
+    assert reduction_functions.area_average("p", [location]) == 1.0
+    assert expressions == ["AreaAve(p,['inlet1'])"]
+
+    solver.reduction = Reduction(_FailingReductionService(grpc.StatusCode.INTERNAL))
+    with pytest.raises(RuntimeError) as exc:
+        reduction_functions.area_average("p", [location])
+    assert not isinstance(exc.value, NotImplementedError)
+    assert len(expressions) == 1
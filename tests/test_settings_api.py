@@ -1,7 +1,15 @@
+import os
+import pickle
+
+import grpc
 import pytest
 from util.solver_workflow import new_solver_session  # noqa: F401
 
+from ansys.api.fluent.v0 import settings_pb2 as SettingsModule
+import ansys.fluent.core as pyfluent
 from ansys.fluent.core.examples import download_file
+from ansys.fluent.core.services.settings import SettingsService
+from ansys.fluent.core.utils.hashing import gethash
 
 
 @pytest.mark.nightly
@@ -152,3 +160,89 @@ def test_wildcard_path_is_iterable(new_solver_session):
     assert test_data[0][1].path == r"setup/boundary-conditions/velocity-inlet/inlet2"
     assert test_data[1][0] == "inlet1"
     assert test_data[1][1].path == r"setup/boundary-conditions/velocity-inlet/inlet1"
+
+
+class _FakeSettingsServiceImpl:
+    def __init__(self):
+        self.static_info = SettingsModule.StaticInfo(type="group", help="Root.")
+        self.static_info.children.add(name="child", value={"type": "integer"})
+
+    def get_static_info(self, request):
+        return SettingsModule.GetStaticInfoResponse(info=self.static_info)
+
+
+class _FakeSchemeEval:
+    version = "23.2.0"
+
+
+def _new_fake_settings_service():
+    service = SettingsService(
+        grpc.insecure_channel("localhost:0"), [], _FakeSchemeEval(), None
+    )
+    service._service_impl = _FakeSettingsServiceImpl()
+    return service
+
+
+def test_static_info_disk_cache_is_opt_in(tmp_path, monkeypatch):
+    monkeypatch.setattr(pyfluent, "SETTINGS_STATIC_INFO_CACHE_PATH", str(tmp_path))
+    assert not pyfluent.SETTINGS_USE_STATIC_INFO_CACHE
+    service = _new_fake_settings_service()
+    assert service.get_static_info()["help"] == "Root."
+    assert service.get_static_info_hash() is None
+    assert not list(tmp_path.rglob("*.pickle"))
+
+
+def test_static_info_disk_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(pyfluent, "SETTINGS_USE_STATIC_INFO_CACHE", True)
+    monkeypatch.setattr(pyfluent, "SETTINGS_STATIC_INFO_CACHE_PATH", str(tmp_path))
+    new_service = _new_fake_settings_service
+
+    service = new_service()
+    static_info = service.get_static_info()
+    assert static_info == {
+        "type": "group",
+        "help": "Root.",
+        "children": {"child": {"type": "integer"}},
+    }
+    assert service.get_static_info_hash() == gethash(static_info)
+    (file_path,) = tmp_path.rglob("*.pickle")
+    assert file_path.parent.parts[-2:] == (
+        pyfluent.__version__,
+        _FakeSchemeEval.version,
+    )
+
+    service = new_service()
+    service._extract_static_info = None
+    assert service.get_static_info() == static_info
+    assert service.get_static_info_hash() == gethash(static_info)
+
+    service = new_service()
+    service._service_impl.static_info.help = "Changed root."
+    assert service.get_static_info()["help"] == "Changed root."
+    assert len(list(tmp_path.rglob("*.pickle"))) == 2
+
+
+def test_static_info_disk_cache_is_pruned(tmp_path, monkeypatch):
+    monkeypatch.setattr(pyfluent, "SETTINGS_USE_STATIC_INFO_CACHE", True)
+    monkeypatch.setattr(pyfluent, "SETTINGS_STATIC_INFO_CACHE_PATH", str(tmp_path))
+    monkeypatch.setattr(pyfluent, "SETTINGS_STATIC_INFO_CACHE_MAX_ENTRIES", 2)
+
+    def get_static_info(help):
+        service = _new_fake_settings_service()
+        service._service_impl.static_info.help = help
+        return service.get_static_info()
+
+    mtime = 0
+    for help in ["First.", "Second.", "First.", "Third."]:
+        get_static_info(help)
+        # Make the access order independent of the file system time resolution.
+        mtime += 10
+        for file_path in tmp_path.rglob("*.pickle"):
+            if file_path.stat().st_mtime > 10000:
+                os.utime(file_path, (mtime, mtime))
+
+    cached = {
+        pickle.loads(file_path.read_bytes())["static_info"]["help"]
+        for file_path in tmp_path.rglob("*.pickle")
+    }
+    assert cached == {"First.", "Third."}
@@ -1,8 +1,17 @@
+from concurrent.futures import ThreadPoolExecutor
+import operator
+import threading
 import time
 
 from util.solver_workflow import new_solver_session  # noqa: F401
 
+from ansys.api.fluent.v0 import events_pb2 as EventsProtoModule
 from ansys.fluent.core import connect_to_fluent
+from ansys.fluent.core.streaming_services.events_streaming import EventsManager
+from ansys.fluent.core.streaming_services.streaming import (
+    CallbackDispatcher,
+    DispatchPolicy,
+)
 
 
 def transcript(data):
@@ -51,3 +60,173 @@ def test_transcript(new_solver_session):
         assert total_checked_transcripts == total_passed_transcripts
     else:
         assert total_checked_transcripts >= total_passed_transcripts
+
+
+def test_callback_dispatcher_policies():
+    release = threading.Event()
+    calls = []
+
+    def callback(value):
+        release.wait(timeout=10)
+        calls.append(value)
+
+    # the first callback blocks the dispatcher thread while the others queue up
+    dispatcher = CallbackDispatcher("drop_oldest", max_queue_size=3)
+    dispatcher.submit(None, callback, 0)
+    while dispatcher.metrics.queue_depth:
+        time.sleep(0.01)
+    for value in range(1, 6):
+        dispatcher.submit(None, callback, value)
+    assert dispatcher.metrics.queue_depth == 3
+    release.set()
+    assert dispatcher.wait(timeout=10)
+    assert calls == [0, 3, 4, 5]
+    assert dispatcher.metrics.dropped == 2
+    assert dispatcher.metrics.dispatched == 4
+    assert dispatcher.metrics.max_queue_depth == 3
+    dispatcher.stop()
+
+    release.clear()
+    calls.clear()
+    dispatcher = CallbackDispatcher(DispatchPolicy.COALESCE)
+    dispatcher.submit("a", callback, 0)
+    while dispatcher.metrics.queue_depth:
+        time.sleep(0.01)
+    for value in range(1, 6):
+        dispatcher.submit("a" if value % 2 else "b", callback, value)
+    release.set()
+    assert dispatcher.wait(timeout=10)
+    assert calls == [0, 5, 4]
+    assert dispatcher.metrics.coalesced == 3
+    dispatcher.stop()
+
+    calls.clear()
+    dispatcher = CallbackDispatcher("block", max_queue_size=2)
+    for value in range(100):
+        dispatcher.submit(None, calls.append, value)
+    dispatcher.submit(None, operator.truediv, 1, 0)
+    assert dispatcher.wait(timeout=10)
+    assert calls == list(range(100))
+    assert dispatcher.metrics.max_queue_depth <= 2
+    assert dispatcher.metrics.errors == 1
+    assert dispatcher.metrics.mean_latency <= dispatcher.metrics.max_latency
+    dispatcher.stop()
+
+
+def test_callback_dispatcher_executor():
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        # every callback waits until one is running on each worker
+        barrier = threading.Barrier(4)
+        dispatcher = CallbackDispatcher(executor=executor, max_workers=4)
+        for _ in range(8):
+            dispatcher.submit(None, barrier.wait, 10)
+        assert dispatcher.wait(timeout=10)
+        assert dispatcher.metrics.dispatched == 8
+        assert dispatcher.metrics.errors == 0
+        dispatcher.stop()
+
+
+def test_callback_dispatcher_executor_applies_policy():
+    release = threading.Event()
+    started = threading.Semaphore(0)
+    calls = []
+
+    def callback(value):
+        started.release()
+        release.wait(timeout=10)
+        calls.append(value)
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        dispatcher = CallbackDispatcher(
+            "drop_oldest", max_queue_size=3, executor=executor, max_workers=2
+        )
+        for value in range(2):
+            dispatcher.submit(None, callback, value)
+        for _ in range(2):
+            assert started.acquire(timeout=10)
+        # both workers are busy, so further callbacks stay in the queue
+        for value in range(2, 7):
+            dispatcher.submit(None, callback, value)
+        assert dispatcher.metrics.queue_depth == 3
+        assert dispatcher.metrics.dropped == 2
+        release.set()
+        assert dispatcher.wait(timeout=10)
+        assert sorted(calls) == [0, 1, 4, 5, 6]
+        dispatcher.stop()
+
+
+class _FakeEventsService:
+    def __init__(self, responses):
+        self.responses = responses
+
+    def begin_streaming(self, request, started_evt, id, stream_begin_method):
+        started_evt.set()
+        yield from self.responses
+
+
+def test_events_manager_internal_callbacks_are_not_dispatched():
+    responses = [EventsProtoModule.BeginStreamingResponse() for _ in range(5)]
+    for i, response in enumerate(responses):
+        response.iterationendedevent.index = i
+    events_manager = EventsManager(_FakeEventsService(responses), None, "session")
+    events_manager.set_dispatch_policy("coalesce")
+    stream_thread = threading.current_thread()
+    internal_calls = []
+    calls = []
+
+    def internal_callback(session_id, event_info):
+        assert threading.current_thread() is stream_thread
+        internal_calls.append(event_info.index)
+
+    def callback(session_id, event_info):
+        time.sleep(0.1)
+        calls.append(event_info.index)
+
+    events_manager._register_internal_callback("IterationEndedEvent", internal_callback)
+    events_manager.register_callback("IterationEndedEvent", callback)
+    events_manager._process_streaming("id", "BeginStreaming", threading.Event())
+    assert internal_calls == [0, 1, 2, 3, 4]
+    assert events_manager.wait_for_callbacks(timeout=10)
+    # only the user callback is coalesced
+    assert calls[-1] == 4 and len(calls) < 5
+    events_manager._dispatcher.stop()
+
+
+def test_callback_dispatcher_reentrant_submit_does_not_block():
+    calls = []
+    dispatcher = CallbackDispatcher("block", max_queue_size=2)
+
+    def callback(value):
+        if value == 0:
+            # the queue fills up while this callback still runs
+            for other in range(1, 6):
+                dispatcher.submit(None, callback, other)
+        calls.append(value)
+
+    dispatcher.submit(None, callback, 0)
+    assert dispatcher.wait(timeout=10)
+    assert calls == [0, 4, 5]
+    assert dispatcher.metrics.dropped == 3
+    dispatcher.stop()
+
+
+def test_callback_dispatcher_stop_without_waiting():
+    release = threading.Event()
+    calls = []
+
+    def callback(value):
+        release.wait(timeout=10)
+        calls.append(value)
+
+    dispatcher = CallbackDispatcher()
+    for value in range(3):
+        dispatcher.submit(None, callback, value)
+    start_time = time.perf_counter()
+    dispatcher.stop(wait=False)
+    assert time.perf_counter() - start_time < 1
+    dispatcher.submit(None, callback, 3)
+    release.set()
+    assert dispatcher.wait(timeout=10)
+    assert calls == [0, 1, 2, 3]
+    dispatcher.stop()
+    assert dispatcher._thread is None
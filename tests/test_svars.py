@@ -5,7 +5,13 @@ from util.solver_workflow import (  # noqa: F401
     new_solver_session_single_precision,
 )
 
+from ansys.api.fluent.v0 import svar_pb2 as SvarProtoModule
 from ansys.fluent.core import examples
+from ansys.fluent.core.services.svar import (
+    SVARData,
+    SVARInfo,
+    _generate_set_svar_data_requests,
+)
 
 
 @pytest.mark.fluent_version(">=23.2")
@@ -194,3 +200,126 @@ def test_svars_single_precision(new_solver_session_single_precision):
     fluid_temp = sv_p_wall_fluid["tank"]
     assert fluid_temp.size == 183424
     assert str(fluid_temp.dtype) == "float32"
+
+
+@pytest.mark.parametrize("dtype", [np.float32, np.float64, np.int32, np.int64])
+def test_set_svar_data_requests_stream_bytes(dtype):
+    svar_data = np.arange(1000, dtype=dtype)[::2]
+    requests = list(
+        _generate_set_svar_data_requests("SV_T", 1, {3: svar_data}, chunk_size=100)
+    )
+    header, info, *payloads = requests
+    assert header.header.name == "SV_T"
+    assert info.payloadInfo.zone == 3
+    assert info.payloadInfo.fieldSize == svar_data.size
+    assert all(
+        len(request.payload.bytePayload) <= 100
+        and len(request.payload.bytePayload) % svar_data.itemsize == 0
+        for request in payloads
+    )
+    streamed = np.frombuffer(
+        b"".join(request.payload.bytePayload for request in payloads), dtype=dtype
+    )
+    assert np.array_equal(streamed, svar_data)
+    assert isinstance(requests[0], SvarProtoModule.SetSvarDataRequest)
+
+
+class _FakeSvarService:
+    def __init__(self):
+        self.calls = []
+        self.zones = [("fluid", 2), ("wall", 3)]
+        self.svars = ["SV_P", "SV_T"]
+
+    def get_zones_info(self, request):
+        self.calls.append("get_zones_info")
+        return SvarProtoModule.GetZonesInfoResponse(
+            zonesInfo=[
+                SvarProtoModule.ZoneInfo(
+                    name=name,
+                    zoneId=zone_id,
+                    partitionsInfo=[
+                        SvarProtoModule.PartitionInfo(count=4, startIndex=0, endIndex=3)
+                    ],
+                )
+                for name, zone_id in self.zones
+            ],
+            domainsInfo=[SvarProtoModule.DomainInfo(name="mixture", domainId=1)],
+        )
+
+    def get_svars_info(self, request):
+        self.calls.append(("get_svars_info", request.zoneId))
+        return SvarProtoModule.GetSvarsInfoResponse(
+            svarsInfo=[
+                SvarProtoModule.SvarInfo(name=name, dimension=1, fieldType=3)
+                for name in self.svars
+            ]
+        )
+
+    def get_svar_data(self, request):
+        self.calls.append(("get_svar_data", request.name))
+        return self._stream(request)
+
+    def _stream(self, request):
+        for zone_id in request.zones:
+            yield SvarProtoModule.GetSvarDataResponse(
+                payloadInfo=SvarProtoModule.Info(fieldType=3, fieldSize=4, zone=zone_id)
+            )
+            yield SvarProtoModule.GetSvarDataResponse(
+                payload=SvarProtoModule.Payload(
+                    bytePayload=np.full(4, zone_id, dtype=np.float64).tobytes()
+                )
+            )
+
+
+def test_svar_metadata_is_cached():
+    service = _FakeSvarService()
+    svar_info = SVARInfo(service)
+    svar_data = SVARData(service, svar_info)
+    for _ in range(3):
+        assert svar_data.get_array("SV_T", "wall").size == 4
+        svar_data.get_svar_data("SV_T", zone_names=["fluid", "wall"])
+    assert service.calls.count("get_zones_info") == 1
+    assert service.calls.count(("get_svars_info", 3)) == 1
+
+    svar_info.invalidate_metadata()
+    svar_data.get_array("SV_T", "wall")
+    assert service.calls.count("get_zones_info") == 2
+    assert service.calls.count(("get_svars_info", 3)) == 2
+
+
+def test_svar_metadata_is_refreshed_for_new_names():
+    service = _FakeSvarService()
+    svar_data = SVARData(service, SVARInfo(service))
+    assert svar_data.get_array("SV_T", "wall").size == 4
+    service.zones.append(("inlet", 4))
+    service.svars.append("SV_U")
+    service.calls.clear()
+
+    assert svar_data.get_array("SV_T", "inlet").size == 4
+    assert svar_data.get_array("SV_U", "wall").size == 4
+    assert service.calls == [
+        "get_zones_info",
+        ("get_svars_info", 4),
+        ("get_svars_info", 3),
+    ]
+    service.calls.clear()
+
+    assert svar_data.get_array("SV_T", "outlet") is None
+    assert svar_data.get_array("SV_V", "wall") is None
+    assert service.calls == ["get_zones_info", ("get_svars_info", 3)]
+
+
+def test_get_svars_data_pipelines_requests():
+    service = _FakeSvarService()
+    svar_data = SVARData(service, SVARInfo(service))
+    svars_data = svar_data.get_svars_data(
+        svar_names=["SV_P", "SV_T"], zone_names=["fluid", "wall"]
+    )
+    assert list(svars_data) == ["SV_P", "SV_T"]
+    for data in svars_data.values():
+        assert data.zones == ["fluid", "wall"]
+        assert np.array_equal(data["wall"], np.full(4, 3.0))
+    assert [call for call in service.calls if call[0] == "get_svar_data"] == [
+        ("get_svar_data", "SV_P"),
+        ("get_svar_data", "SV_T"),
+    ]
@@ -1,7 +1,10 @@
+import time
+import tracemalloc
+
 import pytest
 from util.solver_workflow import new_solver_session  # noqa: F401
 
-from ansys.fluent.core.services.datamodel_tui import TUIMenu
+from ansys.fluent.core.services.datamodel_tui import LazyTUIMenu, TUIMenu
 
 
 @pytest.mark.skip("randomly failing due to missing transcript capture")
@@ -21,3 +24,81 @@ def test_runtime_tui_menus(load_static_mixer_case) -> None:
     rmf = solver.tui.define.models.resolved_MEA_fuelcells
     assert rmf is not None
     assert rmf.__class__ == TUIMenu
+
+
+class _main_menu(TUIMenu):
+    def __init__(self, path, service):
+        self.path = path
+        self.service = service
+        super().__init__(path, service)
+
+    class file(TUIMenu):
+        def __init__(self, path, service):
+            self.path = path
+            self.service = service
+            super().__init__(path, service)
+
+        class import_(TUIMenu):
+            def __init__(self, path, service):
+                self.path = path
+                self.service = service
+                super().__init__(path, service)
+
+        import_ = LazyTUIMenu(import_, "import")
+
+    file = LazyTUIMenu(file, "file")
+
+
+def test_lazy_tui_menu():
+    service = object()
+    main_menu = _main_menu([], service)
+    assert "file" not in main_menu.__dict__
+    assert _main_menu.file.__name__ == "file"
+    assert _main_menu.file.import_.__name__ == "import_"
+
+    menu = main_menu.file.import_
+    assert isinstance(menu, _main_menu.file.import_)
+    assert menu.path == ["file", "import"]
+    assert menu.service is service
+    assert main_menu.file is main_menu.__dict__["file"]
+    assert main_menu.file.import_ is menu
+
+
+def _create_all_menus(menu):
+    # what the generated __init__ methods did before the menus were lazy
+    for name, attr in vars(type(menu)).items():
+        if isinstance(attr, LazyTUIMenu):
+            _create_all_menus(getattr(menu, name))
+    return menu
+
+
+def _measure(create):
+    tracemalloc.start()
+    start = time.perf_counter()
+    create()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+@pytest.mark.nightly
+@pytest.mark.codegen_required
+@pytest.mark.fluent_version(">=23.2")
+def test_tui_first_access_benchmark(new_solver_session, record_property):
+    solver = new_solver_session
+    # the generated module is imported by the first access
+    tui = solver.tui
+    main_menu = type(tui)
+    eager_elapsed, eager_peak = _measure(
+        lambda: _create_all_menus(main_menu([], tui.service))
+    )
+    lazy_elapsed, lazy_peak = _measure(lambda: main_menu([], tui.service))
+    record_property("eager_elapsed", eager_elapsed)
+    record_property("eager_peak", eager_peak)
+    record_property("lazy_elapsed", lazy_elapsed)
+    record_property("lazy_peak", lazy_peak)
+    assert lazy_elapsed * 10 < eager_elapsed
+    assert lazy_peak * 10 < eager_peak
+    assert "file" not in tui.__dict__
+    assert tui.file.read_case